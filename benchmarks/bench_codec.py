@@ -0,0 +1,67 @@
+"""
+Compare the snapshot codecs on realistic option chains.
+
+    python -m benchmarks.bench_codec --strikes 200 --repeat 200
+
+For every codec in `src.pubsub.codec` this reports the encoded size and the mean
+encode/decode time per chain, next to the raw Groww dict pickled and dumped as JSON
+(what crossed process boundaries before the codecs existed).
+"""
+import argparse
+import json
+import pickle
+import time
+from typing import Callable, List, Tuple
+
+from src.client.fake import generate_chain
+from src.pubsub.codec import available_codecs, get_codec
+from src.pubsub.snapshot import OptionChainSnapshot
+
+
+def _mean_seconds(fn: Callable[[], object], repeat: int) -> float:
+    fn()  # warm up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+
+def run(strikes: int = 200, repeat: int = 200) -> List[Tuple[str, int, float, float]]:
+    """Return (name, bytes, encode seconds, decode seconds) rows."""
+    data = generate_chain("NIFTY", num_strikes=strikes, tick=1)
+    snapshot = OptionChainSnapshot.from_dict(data, underlying="NIFTY", expiry_date="2026-10-20")
+    rows = []
+
+    for name, dumps, loads in (
+        ("dict/json", lambda: json.dumps(data).encode(), json.loads),
+        ("dict/pickle", lambda: pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+    ):
+        payload = dumps()
+        rows.append((name, len(payload), _mean_seconds(dumps, repeat), _mean_seconds(lambda: loads(payload), repeat)))
+
+    for name in available_codecs():
+        codec = get_codec(name)
+        payload = codec.encode(snapshot)
+        rows.append((
+            name,
+            len(payload),
+            _mean_seconds(lambda: codec.encode(snapshot), repeat),
+            _mean_seconds(lambda: codec.decode(payload), repeat),
+        ))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--strikes", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{args.strikes}-strike chain, mean of {args.repeat} runs")
+    print(f"{'codec':<12} {'bytes':>9} {'encode us':>10} {'decode us':>10}")
+    for name, size, encode, decode in run(args.strikes, args.repeat):
+        print(f"{name:<12} {size:>9} {encode * 1e6:>10.1f} {decode * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+IV and greeks over whole chains; see bench_pubsub.py for how to run and compare
+against a baseline. The target is under a millisecond for a warm 200-strike chain.
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from datetime import datetime
+
+from benchmarks.chains import STRIKE_COUNTS, allocations, make_chain
+from src.pricing.engine import IST, GreeksEngine
+from src.pubsub.snapshot import OptionChainSnapshot
+
+NOW = datetime(2026, 10, 16, 11, 0, tzinfo=IST).timestamp()
+
+
+def chain(strikes: int, tick: int = 0) -> OptionChainSnapshot:
+    return OptionChainSnapshot.from_dict(
+        make_chain(strikes, tick=tick), timestamp=NOW + tick, underlying="NIFTY", expiry_date="2026-10-20"
+    )
+
+
+@pytest.mark.parametrize("strikes", STRIKE_COUNTS)
+def test_greeks_cold(benchmark, strikes):
+    snapshot = chain(strikes)
+
+    benchmark.extra_info.update(allocations(lambda: GreeksEngine().compute(snapshot)))
+    benchmark(lambda: GreeksEngine().compute(snapshot))
+
+
+@pytest.mark.parametrize("strikes", STRIKE_COUNTS)
+def test_greeks_warm(benchmark, strikes):
+    ticks = [chain(strikes, tick=t) for t in range(2)]
+    engine = GreeksEngine()
+    engine.compute(ticks[0])
+    state = {"tick": 0}
+
+    def compute_next():
+        state["tick"] ^= 1
+        return engine.compute(ticks[state["tick"]])
+
+    benchmark.extra_info.update(allocations(compute_next))
+    benchmark(compute_next)
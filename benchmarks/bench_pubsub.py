@@ -0,0 +1,85 @@
+"""
+OptionChainData hot paths. Run with pytest-benchmark installed:
+
+    pytest benchmarks/bench_pubsub.py benchmarks/bench_strategy.py --benchmark-autosave
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from benchmarks.chains import (
+    STRIKE_COUNTS, SUBSCRIBER_COUNTS, allocations,
+    make_chain, make_publisher, make_subscriptions,
+)
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+
+
+@pytest.mark.parametrize("subscribers", SUBSCRIBER_COUNTS)
+def test_add_subscriber(benchmark, subscribers):
+    keys = list(make_chain(200)["strikes"])
+    subscriptions = make_subscriptions(keys, subscribers)
+
+    def add_all():
+        publisher = OptionChainData()
+        for subscriber, strikes in subscriptions:
+            publisher.add_subscriber(subscriber, strikes)
+        return publisher
+
+    benchmark.extra_info.update(allocations(add_all))
+    benchmark(add_all)
+    benchmark.extra_info["subscribers"] = subscribers
+
+
+@pytest.mark.parametrize("subscribers", SUBSCRIBER_COUNTS)
+def test_remove_subscriber(benchmark, subscribers):
+    keys = list(make_chain(200)["strikes"])
+    subscriptions = make_subscriptions(keys, subscribers)
+
+    def setup():
+        return (make_publisher(subscriptions),), {}
+
+    def remove_all(publisher):
+        for subscriber, _ in subscriptions:
+            publisher.remove_subscriber(subscriber)
+
+    benchmark.extra_info.update(allocations(lambda: remove_all(make_publisher(subscriptions))))
+    benchmark.pedantic(remove_all, setup=setup, rounds=10)
+    benchmark.extra_info["subscribers"] = subscribers
+
+
+@pytest.mark.parametrize("subscribers", SUBSCRIBER_COUNTS)
+@pytest.mark.parametrize("strikes", STRIKE_COUNTS)
+@pytest.mark.parametrize("payload", ["dict", "snapshot"])
+def test_notify(benchmark, payload, strikes, subscribers):
+    data = make_chain(strikes)
+    if payload == "snapshot":
+        data = OptionChainSnapshot.from_dict(data)
+    subscriptions = make_subscriptions(list(make_chain(strikes)["strikes"]), subscribers)
+    publisher = make_publisher(subscriptions)
+    publisher.notify(data)  # build the routing plan outside the timed rounds
+
+    benchmark.extra_info.update(allocations(lambda: publisher.notify(data)))
+    benchmark.extra_info["deliveries_per_notify"] = sum(s.updates for s, _ in subscriptions) // 2
+    benchmark(publisher.notify, data)
+
+
+@pytest.mark.parametrize("strikes", STRIKE_COUNTS)
+def test_notify_diff_mode(benchmark, strikes):
+    ticks = [OptionChainSnapshot.from_dict(make_chain(strikes, tick=t)) for t in range(2)]
+    subscriptions = make_subscriptions(list(make_chain(strikes)["strikes"]), 100)
+    publisher = make_publisher(subscriptions, diff=True)
+    state = {"tick": 0}
+
+    def notify_next():
+        state["tick"] ^= 1
+        publisher.notify(ticks[state["tick"]])
+
+    benchmark.extra_info.update(allocations(notify_next))
+    benchmark(notify_next)
+
+
+def test_snapshot_from_dict(benchmark):
+    data = make_chain(200)
+    benchmark.extra_info.update(allocations(lambda: OptionChainSnapshot.from_dict(data)))
+    benchmark(OptionChainSnapshot.from_dict, data)
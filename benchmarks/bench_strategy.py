@@ -0,0 +1,48 @@
+"""
+Strategy hot paths; see bench_pubsub.py for how to run and compare against a baseline.
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from benchmarks.chains import STRIKE_COUNTS, allocations, make_chain
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.strategies.max_oi import MaxOIStrategy
+from src.strategies.oi_tracker import RollingOITracker
+
+
+@pytest.mark.parametrize("strikes", STRIKE_COUNTS)
+@pytest.mark.parametrize("payload", ["dict", "snapshot"])
+def test_max_oi_update(benchmark, payload, strikes):
+    data = make_chain(strikes)
+    if payload == "snapshot":
+        data = OptionChainSnapshot.from_dict(data)
+    strategy = MaxOIStrategy()
+
+    benchmark.extra_info.update(allocations(lambda: strategy.update(data)))
+    benchmark(strategy.update, data)
+
+
+@pytest.mark.parametrize("strikes", STRIKE_COUNTS)
+def test_max_oi_score_batch(benchmark, strikes):
+    snapshots = [OptionChainSnapshot.from_dict(make_chain(strikes, tick=t)) for t in range(100)]
+    strategy = MaxOIStrategy()
+
+    benchmark.extra_info.update(allocations(lambda: strategy.score_batch(snapshots)))
+    benchmark(strategy.score_batch, snapshots)
+    benchmark.extra_info["ticks_per_call"] = len(snapshots)
+
+
+@pytest.mark.parametrize("strikes", STRIKE_COUNTS)
+def test_rolling_oi_tracker_update(benchmark, strikes):
+    ticks = [OptionChainSnapshot.from_dict(make_chain(strikes, tick=t)) for t in range(2)]
+    tracker = RollingOITracker()
+    state = {"tick": 0}
+
+    def update_next():
+        state["tick"] ^= 1
+        tracker.update(ticks[state["tick"]])
+        return tracker.top_oi(5), tracker.pcr
+
+    benchmark.extra_info.update(allocations(update_next))
+    benchmark(update_next)
@@ -0,0 +1,80 @@
+"""
+Synthetic workloads for the benchmark suite: option chains of any size and subscriber
+populations with a chosen mix of global and strike-specific subscriptions.
+"""
+import random
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.client.fake import generate_chain
+from src.pubsub.interfaces import ISubscriber
+from src.pubsub.publisher import OptionChainData
+
+STRIKE_COUNTS = (50, 200, 2000)
+SUBSCRIBER_COUNTS = (1, 100, 10000)
+
+
+class NullSubscriber(ISubscriber):
+    """Subscriber that only counts its updates, so benchmarks measure the publisher."""
+
+    __slots__ = ("updates",)
+
+    def __init__(self):
+        self.updates = 0
+
+    def update(self, data: Any):
+        self.updates += 1
+
+
+def make_chain(num_strikes: int, tick: int = 0, seed: int = 0) -> Dict[str, Any]:
+    """A Groww-shaped NIFTY chain with `num_strikes` strikes."""
+    return generate_chain("NIFTY", num_strikes=num_strikes, tick=tick, seed=seed)
+
+
+def make_subscriptions(
+    strike_keys: List[str],
+    count: int,
+    global_fraction: float = 0.1,
+    strikes_per_subscriber: int = 3,
+    seed: int = 0,
+) -> List[Tuple[NullSubscriber, Any]]:
+    """
+    `count` (subscriber, strikes) pairs. About `global_fraction` of them subscribe
+    globally (strikes None); the rest pick `strikes_per_subscriber` random strikes.
+    """
+    rng = random.Random(seed)
+    subscriptions = []
+    for _ in range(count):
+        if rng.random() < global_fraction:
+            strikes = None
+        else:
+            strikes = rng.sample(strike_keys, min(strikes_per_subscriber, len(strike_keys)))
+        subscriptions.append((NullSubscriber(), strikes))
+    return subscriptions
+
+
+def make_publisher(subscriptions: List[Tuple[NullSubscriber, Any]], **kwargs) -> OptionChainData:
+    publisher = OptionChainData(**kwargs)
+    for subscriber, strikes in subscriptions:
+        publisher.add_subscriber(subscriber, strikes)
+    return publisher
+
+
+def allocations(fn: Callable[[], Any]) -> Dict[str, int]:
+    """
+    Run `fn` once under tracemalloc and report its peak extra memory and the number of
+    memory blocks it left allocated. Kept apart from the timed rounds, which tracing
+    would slow down.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {"alloc_peak_bytes": peak - start, "alloc_retained_blocks": retained}
@@ -1,89 +1,253 @@
-import os
 import time
-from datetime import datetime, timedelta
+
+# Taken before the remaining imports so the reported startup time includes them
+STARTED = time.perf_counter()
+
+import os
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, List
 from dotenv import load_dotenv
 
 from src.client.factory import ClientFactory
+from src.client.interfaces import AsyncTradingClient
+from src.fetch.adaptive import AdaptiveInterval
+from src.fetch.scheduler import FetchKey, FetchScheduler
+from src.metrics.registry import METRICS
+from src.market.expiry import exchange_for
+from src.market.trading_calendar import calendar_for, load_holidays
 from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.storage.checkpoint import Checkpointer
 from src.strategies.max_oi import MaxOIStrategy
 
-def get_next_expiry_date(currently: datetime) -> str:
-    """
-    Returns the date string of the next upcoming Tuesday.
-    If today is Tuesday, it returns today.
-    """
-    days_ahead = 1 - currently.weekday() # Tuesday is 1
-    if days_ahead < 0:
-        days_ahead += 7
-    next_tuesday = currently + timedelta(days=days_ahead)
-    return next_tuesday.strftime("%Y-%m-%d")
+# The streaming path (aiohttp, asyncio) and the metrics exporters are imported only
+# when configured, to keep cold starts fast.
+if TYPE_CHECKING:
+    from src.feed.pump import StreamingPump
+
+async def run_streaming(pumps: List["StreamingPump"], client: AsyncTradingClient):
+    """Run every streaming pump until interrupted, then release the client's connections."""
+    import asyncio
+
+    async with client:
+        await asyncio.gather(*(pump.run() for pump in pumps))
 
 def main():
     # Load environment variables
     load_dotenv()
     
+    client_name = os.getenv("TRADING_CLIENT", "groww").lower()
     api_key = os.getenv("GROWW_API_KEY")
     totp_secret = os.getenv("GROWW_TOTP_SECRET")
     
-    if not api_key or api_key == "your_groww_api_key_here" or not totp_secret or totp_secret == "your_totp_secret_here":
+    if client_name == "groww" and (not api_key or api_key == "your_groww_api_key_here" or not totp_secret or totp_secret == "your_totp_secret_here"):
         print("Please configure valid GROWW_API_KEY and GROWW_TOTP_SECRET in the .env file.")
         return
 
     print("Initializing components...")
     
-    # 1. Setup Client
-    client = ClientFactory.get_client("groww", api_key=api_key, totp_secret=totp_secret)
-    
-    # 2. Setup Publisher and Strategy
-    publisher = OptionChainData()
-    strategy = MaxOIStrategy()
-    
-    # Subscribe the strategy to listen to all strikes (global)
-    publisher.add_subscriber(strategy)
+    # 1. Setup Client credentials. TRADING_CLIENT=fake runs offline.
+    # FEED_URL switches from REST polling to the streaming feed, which still polls
+    # (every POLL_INTERVAL) while the feed is down.
+    # GROWW_TOKEN_CACHE (a file path) keeps the access token across restarts.
+    client_kwargs = {}
+    if client_name == "groww":
+        client_kwargs = {"api_key": api_key, "totp_secret": totp_secret, "token_cache": os.getenv("GROWW_TOKEN_CACHE")}
+    feed_url = os.getenv("FEED_URL")
     
-    exchange = "NSE"
-    underlying = "NIFTY"
-    expiry_date = get_next_expiry_date(datetime.now())
+    # 2. Setup one Publisher and Strategy per (underlying, expiry) series
+    underlyings = [u.strip().upper() for u in os.getenv("UNDERLYINGS", "NIFTY").split(",") if u.strip()]
+    expiry_kinds = [k.strip().lower() for k in os.getenv("EXPIRY_KINDS", "weekly").split(",") if k.strip()]
+    default_interval = float(os.getenv("POLL_INTERVAL", "60"))
+    strategies = {}
+    checkpointers = {}
 
-    print(f"Starting execution loop for {underlying} ({exchange}) expiring {expiry_date}...")
-    
-    while True:
-        try:
-            print(f"[{datetime.now()}] Fetching live option chain data...")
-            market_data = client.get_option_chain(
-                exchange=exchange,
-                underlying=underlying,
-                expiry_date=expiry_date
+    def report(key: FetchKey, snapshot: OptionChainSnapshot):
+        # Runs after every subscriber has seen the tick, so checkpoints are consistent
+        if key in checkpointers:
+            checkpointers[key].update(snapshot)
+
+        # Print the results computed by the series' strategy
+        strategy = strategies[key]
+        oi_type, oi_strike = strategy.get_max_oi_details()
+        label = f"{key.underlying} {key.expiry_date}"
+        print(f"[{datetime.now()}] {label} Current LTP: {snapshot.underlying_ltp}")
+        
+        if oi_type and oi_strike:
+            print(f"[{datetime.now()}] {label} Max OI near LTP detected in {oi_type} at Strike {oi_strike} (OI: {strategy.max_oi_value})")
+        else:
+            print(f"[{datetime.now()}] {label} No valid OI strikes found within the nearest {strategy.window} strikes to the current LTP.")
+
+    def report_error(key: FetchKey, error: BaseException):
+        print(f"[{datetime.now()}] Error fetching or processing {key.underlying} {key.expiry_date}: {error}")
+
+    # Latency metrics are off unless exported: METRICS_PORT serves Prometheus text on
+    # /metrics, METRICS_LOG_INTERVAL prints p50/p99 summaries every N seconds.
+    metrics_port = os.getenv("METRICS_PORT")
+    metrics_log_interval = os.getenv("METRICS_LOG_INTERVAL")
+    metrics_server = reporter = None
+    METRICS.enabled = bool(metrics_port or metrics_log_interval)
+    if metrics_port or metrics_log_interval:
+        from src.metrics.exporters import PeriodicReporter, serve_prometheus
+    if metrics_port:
+        metrics_server = serve_prometheus(METRICS, int(metrics_port))
+        print(f"Serving metrics on http://127.0.0.1:{metrics_port}/metrics")
+    if metrics_log_interval:
+        reporter = PeriodicReporter(
+            METRICS,
+            float(metrics_log_interval),
+            emit=lambda line: print(f"[{datetime.now()}] metrics {line}")
+        ).start()
+
+    # COMPUTE_GREEKS=1 recomputes IV and greeks for every strike from the premiums
+    # (risk-free rate RISK_FREE_RATE) before strategies see each tick.
+    greeks_engine = None
+    if os.getenv("COMPUTE_GREEKS", "").lower() in ("1", "true", "yes"):
+        from src.pricing.engine import GreeksEngine
+
+        greeks_engine = GreeksEngine(rate=float(os.getenv("RISK_FREE_RATE", "0.065")))
+
+    # Expiries falling on exchange holidays move to the previous trading day.
+    # MARKET_HOLIDAYS names a file of extra holiday dates (one YYYY-MM-DD per line).
+    holidays_file = os.getenv("MARKET_HOLIDAYS")
+    extra_holidays = load_holidays(holidays_file) if holidays_file else None
+
+    def poll_interval(underlying: str) -> float:
+        # Per-underlying cadence, e.g. POLL_INTERVAL_BANKNIFTY=30
+        return float(os.getenv(f"POLL_INTERVAL_{underlying}", default_interval))
+
+    series = []
+    for underlying in underlyings:
+        interval = poll_interval(underlying)
+        calendar = calendar_for(exchange_for(underlying), extra_holidays)
+        for expiry_date in calendar.expiries(underlying, datetime.now(), expiry_kinds):
+            key = FetchKey(calendar.exchange, underlying, expiry_date)
+            strategies[key] = MaxOIStrategy()
+            series.append((key, interval))
+
+    if not strategies:
+        print("No option chain series configured. Check UNDERLYINGS and EXPIRY_KINDS.")
+        return
+
+    # CHECKPOINT_DIR keeps one warm-restart checkpoint per series (subscriptions, last
+    # snapshot, strategy state), written every CHECKPOINT_INTERVAL seconds and restored
+    # on startup unless older than CHECKPOINT_MAX_AGE seconds.
+    checkpoint_dir = os.getenv("CHECKPOINT_DIR")
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+    def checkpoint(key: FetchKey, publisher):
+        if not checkpoint_dir:
+            return
+        checkpointer = Checkpointer(
+            os.path.join(checkpoint_dir, f"{key.underlying}_{key.expiry_date}.ckpt"),
+            publisher,
+            {"max_oi": strategies[key]},
+            interval=float(os.getenv("CHECKPOINT_INTERVAL", "30")),
+            max_age=float(os.getenv("CHECKPOINT_MAX_AGE", "3600"))
+        )
+        if checkpointer.restore():
+            print(f"Restored {key.underlying} {key.expiry_date} from checkpoint {checkpointer.path}")
+        checkpointers[key] = checkpointer
+
+    if feed_url:
+        from src.feed.adapter import WebSocketFeedAdapter
+        from src.feed.pump import StreamingPump
+
+        async_client = ClientFactory.get_async_client(client_name, **client_kwargs)
+        max_rate = float(os.getenv("FEED_MAX_RATE", "2"))
+        pumps = []
+        for key, interval in series:
+            pump = StreamingPump(
+                WebSocketFeedAdapter(feed_url),
+                key,
+                OptionChainData(enrich=greeks_engine),
+                client=async_client,
+                max_rate=max_rate,
+                poll_interval=interval,
+                on_update=report
             )
-            
-            # Notify the publisher so subscribers (our strategy) get updated
-            publisher.notify(market_data)
-            
-            # Print the results computed by the strategy
-            oi_type, oi_strike = strategy.get_max_oi_details()
-            
-            underlying_ltp = market_data.get("underlying_ltp")
-            print(f"[{datetime.now()}] Current LTP: {underlying_ltp}")
-            
-            if oi_type and oi_strike:
-                print(f"[{datetime.now()}] Max OI near LTP detected in {oi_type} at Strike {oi_strike} (OI: {strategy.max_oi_value})")
+            # Subscribe the strategy to listen to all strikes (global)
+            pump.publisher.add_subscriber(strategies[key])
+            checkpoint(key, pump.publisher)
+            pumps.append(pump)
+            print(f"Streaming {key.underlying} ({key.exchange}) expiring {key.expiry_date} at up to {max_rate:g} updates/s...")
+    else:
+        # ADAPTIVE_POLLING (on by default, except for the offline fake client) polls
+        # only during market hours, every POLL_MIN_INTERVAL seconds when the chain is
+        # busy or expiry is close, backing off to the series' POLL_INTERVAL when quiet.
+        adaptive = os.getenv("ADAPTIVE_POLLING", "0" if client_name == "fake" else "1").lower() in ("1", "true", "yes")
+        min_interval = float(os.getenv("POLL_MIN_INTERVAL", "5"))
+
+        # Shared by every poller, rate limited to stay under broker throttles
+        client = ClientFactory.get_throttled_client(client_name, **client_kwargs)
+
+        def schedule(key: FetchKey, interval: float):
+            policy = None
+            if adaptive:
+                policy = AdaptiveInterval(
+                    calendar_for(key.exchange, extra_holidays),
+                    key.expiry_date,
+                    min_interval=min(min_interval, interval),
+                    max_interval=interval
+                )
+            # Subscribe the strategy to listen to all strikes (global)
+            publisher = scheduler.add(
+                key,
+                interval=interval,
+                publisher=OptionChainData(metrics=METRICS, enrich=greeks_engine),
+                policy=policy
+            )
+            publisher.add_subscriber(strategies[key])
+            checkpoint(key, publisher)
+            if policy:
+                print(f"Scheduling {key.underlying} ({key.exchange}) expiring {key.expiry_date} every {policy.min_interval:g}-{interval:g}s during market hours...")
             else:
-                print(f"[{datetime.now()}] No valid OI strikes found within the nearest 12 strikes to the current LTP.")
-                
-            print("-" * 50)
-            
-        except KeyboardInterrupt:
-            print(f"\n[{datetime.now()}] Gracefully stopping execution. Goodbye!")
-            break
-        except Exception as e:
-            print(f"[{datetime.now()}] Error fetching or processing data: {e}")
-            
-        # Wait 60 seconds before next fetch
-        try:
-            time.sleep(60)
-        except KeyboardInterrupt:
-            print(f"\n[{datetime.now()}] Gracefully stopping execution during sleep. Goodbye!")
-            break
+                print(f"Scheduling {key.underlying} ({key.exchange}) expiring {key.expiry_date} every {interval:g}s...")
+
+        def roll(key: FetchKey):
+            # The contract has settled: move on to the underlying's next expiries
+            print(f"[{datetime.now()}] {key.underlying} {key.expiry_date} expired")
+            calendar = calendar_for(key.exchange, extra_holidays)
+            after = date.fromisoformat(key.expiry_date) + timedelta(days=1)
+            for expiry_date in calendar.expiries(key.underlying, after, expiry_kinds):
+                next_key = key._replace(expiry_date=expiry_date)
+                if next_key not in strategies:
+                    strategies[next_key] = MaxOIStrategy()
+                    schedule(next_key, poll_interval(key.underlying))
+
+        # Adaptive series are removed when their contract expires and rolled to the next one
+        scheduler = FetchScheduler(
+            client,
+            max_workers=int(os.getenv("FETCH_WORKERS", "4")),
+            default_interval=default_interval,
+            on_update=report,
+            on_error=report_error,
+            on_expire=roll
+        )
+        for key, interval in series:
+            schedule(key, interval)
+
+    print(f"Starting execution loop for {len(strategies)} series (startup took {(time.perf_counter() - STARTED) * 1000:.0f} ms)...")
+    
+    try:
+        if feed_url:
+            import asyncio
+
+            asyncio.run(run_streaming(pumps, async_client))
+        else:
+            scheduler.run()
+    except KeyboardInterrupt:
+        print(f"\n[{datetime.now()}] Gracefully stopping execution. Goodbye!")
+    finally:
+        if not feed_url:
+            scheduler.close()
+        for checkpointer in checkpointers.values():
+            checkpointer.close()
+        if reporter:
+            reporter.stop()
+        if metrics_server:
+            metrics_server.shutdown()
 
 
 if __name__ == "__main__":
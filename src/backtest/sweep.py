@@ -0,0 +1,176 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.pubsub.snapshot import SIDES, OptionChainSnapshot
+from src.strategies.max_oi import _interleaved_oi, nearest_strike_matrix
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# A day of ticks: recorded snapshots, or the path of a `TickRecorder` file.
+DaySource = Union[str, os.PathLike, Sequence[OptionChainSnapshot]]
+
+RESULT_COLUMNS = ("day", "window", "min_oi", "tie_break", "ticks", "signals", "hits")
+
+
+class MaxOISweep:
+    """
+    Backtests every combination of `MaxOIStrategy` parameters over recorded days in
+    one vectorized pass per day.
+
+    The grid covers the nearest-strike `windows`, a `min_oi` threshold below which the
+    strategy stays flat, and the leg preferred when CE and PE OI tie (`tie_break`).
+    Each signal is scored against the following `horizon` ticks: a CE max-OI strike
+    (resistance) is a hit if the underlying stays at or below it, a PE strike
+    (support) if it stays at or above it. Ticks without a full horizon are not scored.
+
+    Per day, candidates are ranked once for the widest window; a running maximum over
+    them then gives the max-OI leg of every window at once, and thresholds broadcast
+    over the result, so the cost barely grows with the size of the grid. Days are
+    spread over a process pool of `max_workers` (0 evaluates them in this process).
+    """
+
+    def __init__(
+        self,
+        windows: Sequence[int] = (4, 8, 12, 16, 20),
+        min_oi: Sequence[float] = (0,),
+        tie_break: Sequence[str] = SIDES,
+        horizon: int = 15,
+        max_workers: Optional[int] = None,
+    ):
+        if not windows or min(windows) < 1:
+            raise ValueError(f"windows must be positive, got {list(windows)}")
+        for side in tie_break:
+            if side not in SIDES:
+                raise ValueError(f"Unknown tie_break '{side}'. Supported sides: {list(SIDES)}")
+        if horizon < 1:
+            raise ValueError(f"horizon must be at least 1, got {horizon}")
+        self.windows = np.array(sorted(set(windows)), dtype=np.intp)
+        self.min_oi = np.array(sorted(set(min_oi)), dtype=np.float64)
+        self.tie_break = tuple(dict.fromkeys(tie_break))
+        self.horizon = horizon
+        self.max_workers = max_workers
+
+    def signals(self, ltps: np.ndarray, strikes: np.ndarray, ce_oi: np.ndarray, pe_oi: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Max-OI legs of `T` ticks sharing one strike grid, for every tie-break and window.
+
+        `ce_oi`/`pe_oi` are `(T, n_strikes)`. Returns (OI, side index, strike index)
+        arrays of shape `(len(tie_break), T, len(windows))`; OI is -1 (and the leg
+        meaningless) where the window holds no OI at all.
+        """
+        widest = int(self.windows[-1])
+        nearest = nearest_strike_matrix(strikes, ltps, widest)
+        width = nearest.shape[1]
+        rows = np.arange(len(ltps))[:, None]
+        ce, pe = ce_oi[rows, nearest], pe_oi[rows, nearest]
+        # Position of each window's last candidate in the interleaved (CE, PE) order
+        ends = 2 * np.minimum(self.windows, width) - 1
+        positions = np.arange(2 * width)
+
+        values, sides, cols = [], [], []
+        for preferred in self.tie_break:
+            first, second = (ce, pe) if preferred == "CE" else (pe, ce)
+            candidates = _interleaved_oi(first, second)
+            running = np.maximum.accumulate(candidates, axis=1)
+            # A candidate takes over only if it beats everything before it, so ties keep
+            # the nearer strike and, within a strike, the preferred leg
+            leads = np.ones_like(candidates, dtype=bool)
+            leads[:, 1:] = candidates[:, 1:] > running[:, :-1]
+            best = np.maximum.accumulate(np.where(leads, positions, 0), axis=1)[:, ends]
+            side = best % 2 if preferred == "CE" else 1 - best % 2
+            values.append(running[:, ends])
+            sides.append(side)
+            cols.append(np.take_along_axis(nearest, best // 2, axis=1))
+        return np.stack(values), np.stack(sides), np.stack(cols)
+
+    def evaluate_day(self, snapshots: Sequence[OptionChainSnapshot]) -> Dict[str, np.ndarray]:
+        """
+        Score one day. Returns `ticks` (scored ticks), `signals` and `hits` arrays of
+        shape `(len(tie_break), len(windows), len(min_oi))`.
+        """
+        shape = (len(self.tie_break), len(self.windows), len(self.min_oi))
+        signals = np.zeros(shape, dtype=np.int64)
+        hits = np.zeros(shape, dtype=np.int64)
+
+        ltps = np.array([s.underlying_ltp or np.nan for s in snapshots], dtype=np.float64)
+        scored = len(ltps) - self.horizon
+        if scored <= 0:
+            return {"ticks": np.zeros(shape, dtype=np.int64), "signals": signals, "hits": hits}
+        future = np.lib.stride_tricks.sliding_window_view(ltps[1:], self.horizon)[:scored]
+        future_high, future_low = future.max(axis=1), future.min(axis=1)
+
+        # Ticks sharing a strike grid (usually the whole day) are evaluated together
+        groups: Dict[bytes, List[int]] = {}
+        for t in range(scored):
+            if snapshots[t].underlying_ltp and len(snapshots[t]) and not np.isnan(future_high[t]):
+                groups.setdefault(snapshots[t].strikes.tobytes(), []).append(t)
+
+        for ticks in groups.values():
+            group = [snapshots[t] for t in ticks]
+            strikes = group[0].strikes
+            values, sides, cols = self.signals(
+                ltps[ticks],
+                strikes,
+                np.stack([s.column("CE", "open_interest") for s in group]),
+                np.stack([s.column("PE", "open_interest") for s in group]),
+            )
+            levels = strikes[cols]
+            held = np.where(
+                sides == 0,
+                future_high[ticks][None, :, None] <= levels,
+                future_low[ticks][None, :, None] >= levels,
+            )
+            # (tie_break, T, windows, 1) against (min_oi,) broadcasts the whole threshold grid
+            active = (values[..., None] > -1) & (values[..., None] >= self.min_oi)
+            signals += active.sum(axis=1)
+            hits += (active & held[..., None]).sum(axis=1)
+
+        scored_ticks = sum(len(ticks) for ticks in groups.values())
+        return {"ticks": np.full(shape, scored_ticks, dtype=np.int64), "signals": signals, "hits": hits}
+
+    def run(self, days: Mapping[str, DaySource]) -> "pd.DataFrame":
+        """
+        Evaluate every day and return one row per (day, window, min_oi, tie_break)
+        with the `ticks` scored, `signals` taken and signals that `hits`.
+        """
+        import pandas as pd
+
+        labels = list(days)
+        if self.max_workers == 0 or len(labels) <= 1:
+            results = [_evaluate(self, days[label]) for label in labels]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(_evaluate, itertools.repeat(self), (days[label] for label in labels)))
+
+        rows = []
+        for label, result in zip(labels, results):
+            for (b, side), (w, window), (k, threshold) in itertools.product(
+                enumerate(self.tie_break), enumerate(self.windows), enumerate(self.min_oi)
+            ):
+                rows.append((
+                    label, int(window), float(threshold), side,
+                    int(result["ticks"][b, w, k]), int(result["signals"][b, w, k]), int(result["hits"][b, w, k]),
+                ))
+        return pd.DataFrame(rows, columns=list(RESULT_COLUMNS))
+
+    @staticmethod
+    def summarize(results: "pd.DataFrame") -> "pd.DataFrame":
+        """Totals per parameter combination across days, best hit rate first."""
+        summary = results.groupby(["window", "min_oi", "tie_break"], as_index=False)[["ticks", "signals", "hits"]].sum()
+        summary["coverage"] = summary["signals"] / summary["ticks"].where(summary["ticks"] > 0)
+        summary["hit_rate"] = summary["hits"] / summary["signals"].where(summary["signals"] > 0)
+        return summary.sort_values(["hit_rate", "signals"], ascending=False, ignore_index=True)
+
+
+def _evaluate(sweep: MaxOISweep, source: DaySource) -> Dict[str, Any]:
+    """Process-pool entry point: load one day (recorded files are read in the worker) and score it."""
+    if isinstance(source, (str, os.PathLike)):
+        from src.storage.recorder import TickReplay
+
+        source = list(TickReplay(source))
+    return sweep.evaluate_day(source)
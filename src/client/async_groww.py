@@ -0,0 +1,120 @@
+import asyncio
+import os
+from typing import Any, Dict, Optional, Union
+
+import aiohttp
+
+from src.client import groww
+from src.client.auth import TokenManager
+from src.client.interfaces import AsyncTradingClient
+
+GROWW_API_URL = "https://api.groww.in/v1"
+
+
+class GrowwAPIError(RuntimeError):
+    """Raised when the Groww API answers with an error status or a failed response."""
+
+    def __init__(self, message: str, status: Optional[int] = None, code: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+
+class AsyncGrowwClient(AsyncTradingClient):
+    """
+    Groww client that talks to the REST API directly over aiohttp instead of wrapping
+    the synchronous SDK.
+
+    One `aiohttp.ClientSession` with a keep-alive connection pool of up to
+    `max_connections` sockets is shared by every request, so concurrent fetches reuse
+    warm TLS connections. Each request is bounded by `timeout` seconds.
+
+    Pass an `access_token`, or `api_key` and `totp_secret` to log in through the SDK on
+    first use. Logins go through the `TokenManager` shared with `GrowwClient`, and
+    `token_cache` keeps the token on disk across restarts. With those credentials, a
+    request rejected with HTTP 401 invalidates the token and is retried once after
+    logging in again; a fixed `access_token` cannot be renewed, so its 401 is raised.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        totp_secret: Optional[str] = None,
+        access_token: Optional[str] = None,
+        base_url: str = GROWW_API_URL,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        token_cache: Union[str, os.PathLike, None] = None,
+    ):
+        if access_token is None and not (api_key and totp_secret):
+            raise ValueError("AsyncGrowwClient needs an access_token or both api_key and totp_secret")
+        self.api_key = api_key
+        self.totp_secret = totp_secret
+        self.access_token = access_token
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.token_cache = token_cache
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._tokens: Optional[TokenManager] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Accept": "application/json", "X-API-VERSION": "1.0"},
+            )
+        return self._session
+
+    async def _get_access_token(self) -> str:
+        if self.access_token is not None:
+            return self.access_token
+        if self._tokens is None:
+            self._tokens = groww.token_manager(self.api_key, self.totp_secret, self.token_cache)
+        if self._tokens.token is not None and self._tokens.clock() < self._tokens.expires_at:
+            # Cached: returns at once (starting a background refresh if it is due)
+            return self._tokens.get_token()
+        # Logging in blocks on the SDK, so keep it off the event loop
+        return await asyncio.to_thread(self._tokens.get_token)
+
+    async def get_option_chain(self, exchange: str, underlying: str, expiry_date: str) -> Dict[str, Any]:
+        """
+        Fetch the option chain; returns the response payload in the same shape as the SDK.
+        """
+        token = await self._get_access_token()
+        try:
+            return await self._fetch_option_chain(exchange, underlying, expiry_date, token)
+        except GrowwAPIError as e:
+            if e.status != 401 or self._tokens is None:
+                raise
+            self._tokens.invalidate(token)
+            token = await self._get_access_token()
+            return await self._fetch_option_chain(exchange, underlying, expiry_date, token)
+
+    async def _fetch_option_chain(self, exchange: str, underlying: str, expiry_date: str, token: str) -> Dict[str, Any]:
+        session = await self._get_session()
+        url = f"{self.base_url}/option-chain/exchange/{exchange.upper()}/underlying/{underlying.upper()}"
+        async with session.get(
+            url,
+            params={"expiry_date": expiry_date},
+            headers={"Authorization": f"Bearer {token}"},
+        ) as response:
+            try:
+                body = await response.json(content_type=None)
+            except ValueError:
+                body = None
+            if response.status >= 400 or not isinstance(body, dict) or body.get("status") == "FAILURE":
+                error = (body.get("error") if isinstance(body, dict) else None) or {}
+                raise GrowwAPIError(
+                    f"Option chain request for {underlying} {expiry_date} failed with HTTP {response.status}: "
+                    f"{error.get('message') or response.reason}",
+                    status=response.status,
+                    code=error.get("code"),
+                )
+        return body.get("payload", body)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
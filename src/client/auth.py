@@ -0,0 +1,174 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Union
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+IST = ZoneInfo("Asia/Kolkata")
+
+# Groww access tokens stop working at 6 AM IST every day.
+TOKEN_RESET_HOUR = 6
+
+
+def next_token_expiry(issued_at: float) -> float:
+    """Epoch seconds of the first 6 AM IST after `issued_at`."""
+    issued = datetime.fromtimestamp(issued_at, IST)
+    reset = issued.replace(hour=TOKEN_RESET_HOUR, minute=0, second=0, microsecond=0)
+    if reset <= issued:
+        reset += timedelta(days=1)
+    return reset.timestamp()
+
+
+class TokenManager:
+    """
+    Caches one broker access token per API key and refreshes it before it expires.
+
+    `get_token()` returns the cached token and only calls `login` when there is none
+    or it has expired. Within `refresh_margin` seconds of expiry it starts one
+    background refresh and keeps serving the current token meanwhile; after a failed
+    refresh, the next attempt waits `retry_delay` seconds. Managers are
+    shared per API key through `shared()`, so every client instance and thread reuses
+    one login.
+
+    With `cache_path`, tokens are also stored on disk (keyed by a hash of the API key,
+    file mode 0600), so a restarted process skips the login round trip.
+    """
+
+    _shared: Dict[str, "TokenManager"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: str,
+        login: Callable[[], str],
+        cache_path: Union[str, os.PathLike, None] = None,
+        refresh_margin: float = 600.0,
+        expiry: Callable[[float], float] = next_token_expiry,
+        clock: Callable[[], float] = time.time,
+        retry_delay: float = 60.0,
+    ):
+        self.api_key = api_key
+        self.login = login
+        self.cache_path = os.fspath(cache_path) if cache_path is not None else None
+        self.refresh_margin = refresh_margin
+        self.expiry = expiry
+        self.clock = clock
+        self.retry_delay = retry_delay
+        self.token: Optional[str] = None
+        self.expires_at: float = 0.0
+        self.logins = 0
+        self._lock = threading.Lock()
+        self._refresh: Optional[threading.Thread] = None
+        self._refresh_failed_at: Optional[float] = None
+        self._cache_key = hashlib.sha256(api_key.encode()).hexdigest()
+
+    @classmethod
+    def shared(cls, api_key: str, login: Callable[[], str], **kwargs) -> "TokenManager":
+        """
+        The process-wide manager for `api_key`, created on first use. `login` and the
+        other options of later calls are ignored.
+        """
+        with cls._shared_lock:
+            manager = cls._shared.get(api_key)
+            if manager is None:
+                manager = cls._shared[api_key] = cls(api_key, login, **kwargs)
+            return manager
+
+    @classmethod
+    def reset_shared(cls):
+        """Forget every shared manager (for tests and credential rotation)."""
+        with cls._shared_lock:
+            cls._shared.clear()
+
+    def get_token(self) -> str:
+        now = self.clock()
+        if self.token is None or now >= self.expires_at:
+            with self._lock:
+                if (self.token is None or self.clock() >= self.expires_at) and not self._load():
+                    self._login()
+        elif now >= self.expires_at - self.refresh_margin:
+            self._refresh_in_background()
+        return self.token
+
+    def invalidate(self, token: Optional[str] = None):
+        """
+        Drop the cached token, e.g. after the API rejects it; the next call logs in.
+        With `token`, only drop it if it is still the cached one, so a client holding a
+        stale token does not discard a newer one another client already fetched.
+        """
+        with self._lock:
+            if token is not None and token != self.token:
+                return
+            self.token = None
+            self.expires_at = 0.0
+
+    def _login(self):
+        issued_at = self.clock()
+        token = self.login()
+        self.logins += 1
+        self.token, self.expires_at = token, self.expiry(issued_at)
+        self._store()
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refresh is not None and self._refresh.is_alive():
+                return
+            if self._refresh_failed_at is not None and self.clock() - self._refresh_failed_at < self.retry_delay:
+                return
+            self._refresh = threading.Thread(target=self._run_refresh, name="token-refresh", daemon=True)
+            self._refresh.start()
+
+    def _run_refresh(self):
+        try:
+            issued_at = self.clock()
+            token = self.login()
+        except Exception:
+            # The current token stays valid until it expires; retry after `retry_delay`.
+            logger.exception("Background token refresh failed")
+            with self._lock:
+                self._refresh_failed_at = self.clock()
+            return
+        with self._lock:
+            self._refresh_failed_at = None
+            self.logins += 1
+            self.token, self.expires_at = token, self.expiry(issued_at)
+            self._store()
+
+    def _read_cache(self) -> Dict[str, Dict[str, Union[str, float]]]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _load(self) -> bool:
+        """Adopt a still-valid token from the disk cache, if any."""
+        if not self.cache_path:
+            return False
+        entry = self._read_cache().get(self._cache_key) or {}
+        token, expires_at = entry.get("token"), float(entry.get("expires_at") or 0)
+        if not token or self.clock() >= expires_at - self.refresh_margin:
+            return False
+        self.token, self.expires_at = token, expires_at
+        return True
+
+    def _store(self):
+        if not self.cache_path:
+            return
+        cache = self._read_cache()
+        cache[self._cache_key] = {"token": self.token, "expires_at": self.expires_at}
+        tmp = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            logger.warning("Could not write token cache %s", self.cache_path, exc_info=True)
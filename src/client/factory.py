@@ -1,20 +1,45 @@
-from typing import Dict, Type
-from src.client.interfaces import TradingClient
-from src.client.groww import GrowwClient
+import importlib
+from typing import Dict, Optional, Tuple, Type, Union
+from src.client.interfaces import AsyncTradingClient, TradingClient
+from src.client.throttled import ThrottledClient
+
+# A client class, or a lazy "package.module:ClassName" reference to one.
+ClientRef = Union[Type, str]
+
+
+def _resolve(registry: Dict[str, ClientRef], name: str) -> Optional[Type]:
+    """
+    Look up a registered client class, importing it on first use for string references.
+    """
+    ref = registry.get(name.lower())
+    if isinstance(ref, str):
+        module_name, _, attr = ref.partition(":")
+        ref = getattr(importlib.import_module(module_name), attr)
+        registry[name.lower()] = ref
+    return ref
 
 
 class ClientFactory:
     """
     Factory to instantiate different trading clients.
+
+    Built-in clients are registered as "module:ClassName" strings and imported on first
+    use, so broker SDKs (and their dependency trees) only load for the client in use.
     """ 
     
-    _clients: Dict[str, Type[TradingClient]] = {
-        "groww": GrowwClient,
+    _clients: Dict[str, ClientRef] = {
+        "groww": "src.client.groww:GrowwClient",
+        "fake": "src.client.fake:FakeClient",
+    }
+
+    _async_clients: Dict[str, ClientRef] = {
+        "groww": "src.client.async_groww:AsyncGrowwClient",
+        "fake": "src.client.fake:AsyncFakeClient",
     }
 
     @classmethod
-    def register_client(cls, name: str, client_class: Type[TradingClient]):
-        """Register a new client type."""
+    def register_client(cls, name: str, client_class: Union[Type[TradingClient], str]):
+        """Register a new client type, or a lazy "module:ClassName" reference to one."""
         cls._clients[name.lower()] = client_class
 
     @classmethod
@@ -22,7 +47,36 @@ class ClientFactory:
         """
         Get a trading client instance by name.
         """
-        client_class = cls._clients.get(name.lower())
+        client_class = _resolve(cls._clients, name)
         if not client_class:
             raise ValueError(f"Trading client '{name}' not found. Supported clients: {list(cls._clients.keys())}")
         return client_class(**kwargs)
+
+    @classmethod
+    def register_async_client(cls, name: str, client_class: Union[Type[AsyncTradingClient], str]):
+        """Register a new asyncio client type, or a lazy "module:ClassName" reference to one."""
+        cls._async_clients[name.lower()] = client_class
+
+    @classmethod
+    def get_async_client(cls, name: str, **kwargs) -> AsyncTradingClient:
+        """
+        Get an asyncio trading client instance by name.
+        """
+        client_class = _resolve(cls._async_clients, name)
+        if not client_class:
+            raise ValueError(f"Async trading client '{name}' not found. Supported clients: {list(cls._async_clients.keys())}")
+        return client_class(**kwargs)
+
+    @classmethod
+    def get_throttled_client(
+        cls,
+        name: str,
+        rate_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        cache_ttl: float = 0.0,
+        **kwargs
+    ) -> ThrottledClient:
+        """
+        Get a trading client instance by name, wrapped with per-endpoint rate limiting,
+        request coalescing and a response cache of `cache_ttl` seconds.
+        """
+        return ThrottledClient(cls.get_client(name, **kwargs), rate_limits=rate_limits, cache_ttl=cache_ttl)
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.client.interfaces import AsyncTradingClient, TradingClient
+
+# Rough spot levels and strike spacing for the indices we trade.
+DEFAULT_SPOT = {
+    "NIFTY": 25000.0,
+    "BANKNIFTY": 56000.0,
+    "FINNIFTY": 26500.0,
+    "MIDCPNIFTY": 13000.0,
+    "SENSEX": 82000.0,
+    "BANKEX": 63000.0,
+}
+DEFAULT_STRIKE_STEP = {
+    "NIFTY": 50.0,
+    "BANKNIFTY": 100.0,
+    "FINNIFTY": 50.0,
+    "MIDCPNIFTY": 25.0,
+    "SENSEX": 100.0,
+    "BANKEX": 100.0,
+}
+
+
+class FakeClient(TradingClient):
+    """
+    Offline trading client that serves synthetic option chains in the Groww response shape.
+
+    Every (exchange, underlying, expiry) series does its own seeded random walk, so runs
+    are reproducible and tests, dry runs and benchmarks need no network or credentials.
+    `latency` simulates a broker round trip. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        num_strikes: int = 200,
+        seed: int = 0,
+        latency: float = 0.0,
+        spot: Optional[Dict[str, float]] = None,
+    ):
+        self.num_strikes = num_strikes
+        self.seed = seed
+        self.latency = latency
+        self.spot = {**DEFAULT_SPOT, **(spot or {})}
+        self.calls: List[Tuple[str, str, str]] = []
+        self._ticks: Dict[Tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def get_option_chain(self, exchange: str, underlying: str, expiry_date: str) -> Dict[str, Any]:
+        """
+        Return the next synthetic tick for the requested chain.
+        """
+        key = (exchange.upper(), underlying.upper(), expiry_date)
+        with self._lock:
+            self.calls.append(key)
+            tick = self._ticks.get(key, 0)
+            self._ticks[key] = tick + 1
+
+        if self.latency:
+            time.sleep(self.latency)
+        return generate_chain(
+            underlying=key[1],
+            num_strikes=self.num_strikes,
+            tick=tick,
+            seed=self.seed ^ zlib.crc32("|".join(key).encode()),
+            spot=self.spot.get(key[1], 20000.0),
+        )
+
+
+class AsyncFakeClient(AsyncTradingClient):
+    """
+    Asyncio variant of `FakeClient` serving the same synthetic chains. `latency` is
+    awaited, so concurrent fetches overlap like real network calls.
+    """
+
+    def __init__(
+        self,
+        num_strikes: int = 200,
+        seed: int = 0,
+        latency: float = 0.0,
+        spot: Optional[Dict[str, float]] = None,
+    ):
+        self.latency = latency
+        self._client = FakeClient(num_strikes=num_strikes, seed=seed, spot=spot)
+
+    @property
+    def calls(self) -> List[Tuple[str, str, str]]:
+        return self._client.calls
+
+    async def get_option_chain(self, exchange: str, underlying: str, expiry_date: str) -> Dict[str, Any]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._client.get_option_chain(exchange, underlying, expiry_date)
+
+
+def generate_chain(
+    underlying: str = "NIFTY",
+    num_strikes: int = 200,
+    tick: int = 0,
+    seed: int = 0,
+    spot: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Build one synthetic Groww-style option chain response.
+    The strike grid is fixed per series; the LTP, OI, volume and premiums move with `tick`.
+    """
+    spot = DEFAULT_SPOT.get(underlying, 20000.0) if spot is None else spot
+    step = DEFAULT_STRIKE_STEP.get(underlying, 50.0)
+    rng = np.random.default_rng([seed, tick])
+
+    # Random walk of the underlying, reproducible for any tick without replaying the path
+    drift = np.random.default_rng([seed, 0xC0FFEE]).normal(0.0, spot * 0.0005, tick + 1).sum()
+    ltp = round(float(spot + drift), 2)
+
+    first = round(spot / step) * step - (num_strikes // 2) * step
+    strikes = first + step * np.arange(num_strikes)
+    moneyness = (strikes - ltp) / (spot * 0.02)
+    ce_oi = rng.integers(1_000, 50_000, num_strikes) * np.exp(-np.maximum(-moneyness, 0) * 0.3)
+    pe_oi = rng.integers(1_000, 50_000, num_strikes) * np.exp(-np.maximum(moneyness, 0) * 0.3)
+    ce_ltp = np.maximum(ltp - strikes, 0) + spot * 0.004 * np.exp(-np.abs(moneyness))
+    pe_ltp = np.maximum(strikes - ltp, 0) + spot * 0.004 * np.exp(-np.abs(moneyness))
+    iv = 12 + 2 * moneyness ** 2 + rng.normal(0, 0.1, num_strikes)
+    delta = 1 / (1 + np.exp(1.7 * moneyness))
+    volume = rng.integers(0, 100_000, (2, num_strikes))
+
+    chain = {}
+    for i, strike in enumerate(strikes):
+        key = str(int(strike)) if float(strike).is_integer() else str(float(strike))
+        chain[key] = {
+            "CE": {
+                "open_interest": int(ce_oi[i]),
+                "ltp": round(float(ce_ltp[i]), 2),
+                "volume": int(volume[0, i]),
+                "greeks": {"iv": round(float(iv[i]), 4), "delta": round(float(delta[i]), 4)},
+            },
+            "PE": {
+                "open_interest": int(pe_oi[i]),
+                "ltp": round(float(pe_ltp[i]), 2),
+                "volume": int(volume[1, i]),
+                "greeks": {"iv": round(float(iv[i]), 4), "delta": round(float(delta[i]) - 1, 4)},
+            },
+        }
+    return {"underlying_ltp": ltp, "strikes": chain}
@@ -1,39 +1,82 @@
-from typing import Any, Dict
+import os
+from typing import Any, Dict, Optional, Union
+from src.client.auth import TokenManager
 from src.client.interfaces import TradingClient
 
 try:
     from growwapi import GrowwAPI
+    from growwapi.groww.exceptions import GrowwAPIAuthenticationException
     import pyotp
 except ImportError:
     GrowwAPI = None
     pyotp = None
 
+    class GrowwAPIAuthenticationException(Exception):
+        """Stand-in for the SDK's HTTP 401 error when growwapi is not installed."""
+
+def login(api_key: str, totp_secret: str) -> str:
+    """
+    Log in with a fresh TOTP and return a new access token.
+    """
+    if GrowwAPI is None or pyotp is None:
+        raise ImportError("growwapi or pyotp is not installed. Please install them to use GrowwClient.")
+    totp_gen = pyotp.TOTP(totp_secret)
+    totp = totp_gen.now()
+    return GrowwAPI.get_access_token(api_key=api_key, totp=totp)
+
+
+def token_manager(api_key: str, totp_secret: str, token_cache: Union[str, os.PathLike, None] = None) -> TokenManager:
+    """
+    The shared `TokenManager` for an API key, logging in through `login` when needed.
+    """
+    return TokenManager.shared(api_key, lambda: login(api_key, totp_secret), cache_path=token_cache)
+
+
 class GrowwClient(TradingClient):
     """
     Groww API client implementation.
+
+    Access tokens come from the `TokenManager` shared by every client with the same API
+    key, so only the first client logs in. Pass `token_cache` (a file path) to keep the
+    token across restarts. A request rejected with HTTP 401 (token revoked or reset
+    early) invalidates the token and is retried once after logging in again.
     """
     
-    def __init__(self, api_key: str, totp_secret: str):
+    def __init__(self, api_key: str, totp_secret: str, token_cache: Union[str, os.PathLike, None] = None):
         self.api_key = api_key
         self.totp_secret = totp_secret
         
         if GrowwAPI is None or pyotp is None:
             raise ImportError("growwapi or pyotp is not installed. Please install them to use GrowwClient.")
-            
-        totp_gen = pyotp.TOTP(totp_secret)
-        totp = totp_gen.now()
-        
-        access_token = GrowwAPI.get_access_token(api_key=api_key, totp=totp)
-        self.client = GrowwAPI(access_token)
+
+        self.tokens = token_manager(api_key, totp_secret, token_cache)
+        self._access_token: Optional[str] = None
+        self._get_client()
+
+    def _get_client(self):
+        """The SDK client, rebuilt whenever the shared token has been refreshed."""
+        access_token = self.tokens.get_token()
+        if access_token != self._access_token:
+            self.client = GrowwAPI(access_token)
+            self._access_token = access_token
+        return self.client
 
     def get_option_chain(self, exchange: str, underlying: str, expiry_date: str) -> Dict[str, Any]:
         """
         Fetch the option chain using Groww SDK.
         """
+        try:
+            return self._fetch_option_chain(exchange, underlying, expiry_date)
+        except GrowwAPIAuthenticationException:
+            self.tokens.invalidate(self._access_token)
+            return self._fetch_option_chain(exchange, underlying, expiry_date)
+
+    def _fetch_option_chain(self, exchange: str, underlying: str, expiry_date: str) -> Dict[str, Any]:
+        client = self._get_client()
         # Map exchange string to SDK constant if needed. We assume NSE by default if not provided correctly.
-        exch = self.client.EXCHANGE_NSE if exchange.upper() == "NSE" else self.client.EXCHANGE_BSE
+        exch = client.EXCHANGE_NSE if exchange.upper() == "NSE" else client.EXCHANGE_BSE
         
-        response = self.client.get_option_chain(
+        response = client.get_option_chain(
             exchange=exch,
             underlying=underlying,
             expiry_date=expiry_date
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Tuple
 
 
 class TradingClient(ABC):
@@ -13,3 +13,41 @@ class TradingClient(ABC):
         Fetch the option chain for a given underlying and expiry date.
         """
         pass
+
+
+class AsyncTradingClient(ABC):
+    """
+    Asyncio counterpart of `TradingClient`: many fetches can be in flight on one event
+    loop instead of one thread per request. Use as an async context manager, or call
+    `close()` to release the connection pool.
+    """
+
+    @abstractmethod
+    async def get_option_chain(self, exchange: str, underlying: str, expiry_date: str) -> Dict[str, Any]:
+        """
+        Fetch the option chain for a given underlying and expiry date.
+        """
+        pass
+
+    async def get_option_chains(self, requests: Iterable[Tuple[str, str, str]]) -> List[Any]:
+        """
+        Fetch several (exchange, underlying, expiry_date) chains concurrently, in order.
+        A failed fetch is returned as its exception instead of cancelling the others.
+        """
+        # Imported here so sync-only users of this module do not pay for asyncio
+        import asyncio
+
+        return await asyncio.gather(
+            *(self.get_option_chain(*request) for request in requests),
+            return_exceptions=True
+        )
+
+    async def close(self):
+        """Release network resources."""
+        pass
+
+    async def __aenter__(self) -> "AsyncTradingClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -0,0 +1,143 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.client.interfaces import TradingClient
+
+OPTION_CHAIN = "option_chain"
+
+# Requests per second and burst size per endpoint. Groww allows 10 live-data requests per second.
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    OPTION_CHAIN: (10.0, 10.0),
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. `acquire` reserves a token and sleeps until it is available,
+    so concurrent callers queue up fairly behind the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, waiting if the bucket is empty. Returns the seconds waited.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class ThrottledClient(TradingClient):
+    """
+    Wraps another `TradingClient` with client-side rate limiting and request coalescing.
+
+    - Each endpoint is limited by its own token bucket.
+    - Concurrent identical `(exchange, underlying, expiry)` requests share one in-flight call.
+    - Responses are served from cache for `cache_ttl` seconds (0 disables caching).
+
+    Cached and coalesced responses are the same object for every caller; treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        client: TradingClient,
+        rate_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        cache_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.client = client
+        self.cache_ttl = cache_ttl
+        self._clock = clock
+        limits = DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits
+        self._buckets = {
+            endpoint: TokenBucket(rate, burst, clock=clock, sleep=sleep)
+            for endpoint, (rate, burst) in limits.items()
+        }
+        self._cache: Dict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]] = {}
+        self._in_flight: Dict[Tuple[str, str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "throttled": 0, "throttle_wait": 0.0}
+
+    def get_option_chain(self, exchange: str, underlying: str, expiry_date: str) -> Dict[str, Any]:
+        """
+        Fetch the option chain, from cache or a shared in-flight request when possible.
+        """
+        key = (exchange.upper(), underlying.upper(), expiry_date)
+        owner = False
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and self._clock() - cached[0] < self.cache_ttl:
+                self._stats["hits"] += 1
+                return cached[1]
+
+            pending = self._in_flight.get(key)
+            if pending is not None:
+                self._stats["coalesced"] += 1
+            else:
+                pending = self._in_flight[key] = Future()
+                self._stats["misses"] += 1
+                owner = True
+        if not owner:
+            return pending.result()
+
+        try:
+            self._throttle(OPTION_CHAIN)
+            response = self.client.get_option_chain(
+                exchange=exchange,
+                underlying=underlying,
+                expiry_date=expiry_date
+            )
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            if self.cache_ttl > 0:
+                self._cache[key] = (self._clock(), response)
+            del self._in_flight[key]
+        pending.set_result(response)
+        return response
+
+    def _throttle(self, endpoint: str):
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            return
+        waited = bucket.acquire()
+        if waited > 0:
+            with self._lock:
+                self._stats["throttled"] += 1
+                self._stats["throttle_wait"] += waited
+
+    def stats(self) -> Dict[str, float]:
+        """Cache hits, misses (calls to the wrapped client), coalesced waits and throttling counters."""
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,137 @@
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class FeedTick(NamedTuple):
+    """
+    One live update for a single instrument of a chain. Underlying (index) ticks have
+    no strike or side and carry the index price as `fields["ltp"]`.
+    """
+    underlying: str
+    expiry_date: Optional[str]
+    strike: Optional[str]
+    side: Optional[str]
+    fields: Dict[str, float]
+    timestamp: float
+
+
+class FeedDisconnected(ConnectionError):
+    """Raised by a feed adapter when its connection is lost."""
+
+
+class FeedAdapter(ABC):
+    """
+    Source of live per-instrument ticks, e.g. a broker's streaming feed.
+
+    `connect()` opens the connection, `subscribe()` asks for every instrument of one
+    chain, and iterating the adapter yields `FeedTick`s until the connection drops
+    (raising `FeedDisconnected`). An adapter may be connected again after `close()`.
+    """
+
+    @abstractmethod
+    async def connect(self):
+        pass
+
+    @abstractmethod
+    async def subscribe(self, underlying: str, expiry_date: str):
+        pass
+
+    @abstractmethod
+    def __aiter__(self) -> AsyncIterator[FeedTick]:
+        pass
+
+    @abstractmethod
+    async def close(self):
+        pass
+
+
+def parse_tick(message: Dict[str, Any]) -> FeedTick:
+    """
+    Build a tick from one JSON feed message:
+
+        {"underlying": "NIFTY", "expiry_date": "2026-10-20", "strike": "23400",
+         "type": "CE", "ltp": 120.5, "open_interest": 51000, "timestamp": 1760000000.1}
+
+    Index ticks omit `strike` and `type`. Every other numeric key is a field update.
+    """
+    fields = {
+        key: float(value) for key, value in message.items()
+        if key not in ("underlying", "expiry_date", "strike", "type", "timestamp")
+        and isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+    strike = message.get("strike")
+    return FeedTick(
+        underlying=message["underlying"],
+        expiry_date=message.get("expiry_date"),
+        strike=None if strike is None else str(strike),
+        side=message.get("type"),
+        fields=fields,
+        timestamp=float(message.get("timestamp") or time.time()),
+    )
+
+
+class WebSocketFeedAdapter(FeedAdapter):
+    """
+    Feed adapter for a JSON-over-websocket tick stream.
+
+    Subscribing sends `{"action": "subscribe", "underlying": ..., "expiry_date": ...}`.
+    Each text frame holds one tick message (see `parse_tick`) or a list of them.
+    Malformed frames and messages are logged and skipped.
+    """
+
+    def __init__(self, url: str, heartbeat: float = 15.0, timeout: float = 10.0):
+        self.url = url
+        self.heartbeat = heartbeat
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+
+    async def connect(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=None, connect=self.timeout))
+        try:
+            self._ws = await self._session.ws_connect(self.url, heartbeat=self.heartbeat)
+        except aiohttp.ClientError as e:
+            raise FeedDisconnected(f"Could not connect to feed {self.url}: {e}") from e
+
+    async def subscribe(self, underlying: str, expiry_date: str):
+        if self._ws is None:
+            raise FeedDisconnected("Feed is not connected")
+        await self._ws.send_json({"action": "subscribe", "underlying": underlying, "expiry_date": expiry_date})
+
+    async def __aiter__(self) -> AsyncIterator[FeedTick]:
+        if self._ws is None:
+            raise FeedDisconnected("Feed is not connected")
+        async for msg in self._ws:
+            if msg.type is aiohttp.WSMsgType.TEXT:
+                try:
+                    payload = json.loads(msg.data)
+                except ValueError:
+                    logger.warning("Skipping malformed frame from %s: %.200s", self.url, msg.data)
+                    continue
+                messages: List[Dict[str, Any]] = payload if isinstance(payload, list) else [payload]
+                for message in messages:
+                    try:
+                        tick = parse_tick(message)
+                    except (KeyError, TypeError, ValueError, AttributeError):
+                        logger.warning("Skipping malformed tick from %s: %.200r", self.url, message)
+                        continue
+                    yield tick
+            elif msg.type is aiohttp.WSMsgType.ERROR:
+                break
+        raise FeedDisconnected(f"Feed {self.url} closed the connection")
+
+    async def close(self):
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
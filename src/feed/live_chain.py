@@ -0,0 +1,102 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.feed.adapter import FeedTick
+from src.pubsub.snapshot import FIELD_INDEX, FIELDS, SIDE_INDEX, SIDES, OptionChainSnapshot, format_strike
+
+
+class LiveChainBuilder:
+    """
+    Keeps one option chain current from per-instrument feed ticks.
+
+    The chain is held in the snapshot's columnar layout and each tick overwrites its
+    fields in place. Strikes missing from the grid are inserted on first sight, so the
+    builder can start empty, although seeding it with `reset()` from a REST snapshot
+    gives subscribers a complete chain from the first publish. `snapshot()` hands out an
+    independent copy, so subscribers may keep it.
+    """
+
+    def __init__(self, underlying: Optional[str] = None, expiry_date: Optional[str] = None):
+        self.underlying = underlying
+        self.expiry_date = expiry_date
+        self.underlying_ltp: Optional[float] = None
+        self.strikes = np.empty(0, dtype=np.float64)
+        self.values = np.empty((len(SIDES), len(FIELDS), 0), dtype=np.float64)
+        self.timestamp: Optional[float] = None
+        # Set by every applied tick, cleared by `snapshot()`
+        self.dirty = False
+        self.ticks = 0
+        self._keys: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.strikes)
+
+    def reset(self, snapshot: OptionChainSnapshot):
+        """Replace the whole chain, e.g. with a fresh REST fetch."""
+        self.underlying_ltp = snapshot.underlying_ltp
+        self.strikes = np.array(snapshot.strikes, dtype=np.float64)
+        self.values = np.array(snapshot.values, dtype=np.float64)
+        self._keys = list(snapshot.strike_keys)
+        self._index = {key: i for i, key in enumerate(self._keys)}
+        self.timestamp = snapshot.timestamp
+        self.dirty = True
+
+    def apply(self, tick: FeedTick) -> bool:
+        """
+        Fold one tick into the chain. Returns False for ticks that cannot belong to it
+        (an unknown side or an unparseable strike).
+        """
+        if tick.strike is None:
+            ltp = tick.fields.get("ltp")
+            if ltp is None:
+                return False
+            self.underlying_ltp = ltp
+        else:
+            side = SIDE_INDEX.get(tick.side)
+            if side is None:
+                return False
+            row = self._index.get(tick.strike)
+            if row is None:
+                row = self._row_for(tick.strike)
+                if row is None:
+                    return False
+            for field, value in tick.fields.items():
+                f = FIELD_INDEX.get(field)
+                if f is not None:
+                    self.values[side, f, row] = value
+
+        self.timestamp = tick.timestamp
+        self.ticks += 1
+        self.dirty = True
+        return True
+
+    def _row_for(self, strike: str) -> Optional[int]:
+        """Row of a strike spelled differently from our keys ("23400.0"), inserting it if new."""
+        try:
+            price = float(strike)
+        except ValueError:
+            return None
+        key = format_strike(price)
+        row = self._index.get(key)
+        if row is None:
+            row = int(np.searchsorted(self.strikes, price))
+            self.strikes = np.insert(self.strikes, row, price)
+            self.values = np.insert(self.values, row, np.nan, axis=2)
+            self._keys.insert(row, key)
+            self._index = {k: i for i, k in enumerate(self._keys)}
+        return row
+
+    def snapshot(self) -> OptionChainSnapshot:
+        """Copy of the current chain; clears `dirty`."""
+        self.dirty = False
+        return OptionChainSnapshot(
+            underlying_ltp=self.underlying_ltp,
+            strikes=self.strikes.copy(),
+            values=self.values.copy(),
+            strike_keys=list(self._keys),
+            timestamp=self.timestamp,
+            underlying=self.underlying,
+            expiry_date=self.expiry_date,
+        )
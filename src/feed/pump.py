@@ -0,0 +1,162 @@
+import asyncio
+import inspect
+import logging
+from typing import Callable, List, Optional
+
+from src.client.interfaces import AsyncTradingClient
+from src.feed.adapter import FeedAdapter, FeedDisconnected, FeedTick
+from src.feed.live_chain import LiveChainBuilder
+from src.fetch.scheduler import FetchKey
+from src.pubsub.interfaces import IPublisher
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingPump:
+    """
+    Feeds one chain's publisher from a live tick stream instead of a fixed poll.
+
+    Ticks from `feed` are folded into a `LiveChainBuilder` as they arrive. At most
+    `max_rate` times per second, and only when something changed, the current chain is
+    published as one snapshot, so bursts of ticks are conflated into the latest state.
+
+    When a `client` is given, the chain is seeded with one REST fetch, and the pump
+    polls every `poll_interval` seconds whenever the feed is down or has been silent
+    for `stale_after` seconds. Dropped feeds are reconnected with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        feed: FeedAdapter,
+        key: FetchKey,
+        publisher: Optional[IPublisher] = None,
+        client: Optional[AsyncTradingClient] = None,
+        max_rate: float = 2.0,
+        stale_after: float = 30.0,
+        poll_interval: float = 60.0,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        on_update: Optional[Callable[[FetchKey, OptionChainSnapshot], None]] = None,
+    ):
+        if max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, got {max_rate}")
+        self.feed = feed
+        self.key = key
+        self.publisher = publisher or OptionChainData()
+        self.client = client
+        self.max_rate = max_rate
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.on_update = on_update
+        self.builder = LiveChainBuilder(key.underlying, key.expiry_date)
+
+        self.streaming = False
+        self.published = 0
+        self.conflated = 0
+        self.polls = 0
+        self.reconnects = 0
+        self._published_ticks = 0
+        self._stopping = asyncio.Event()
+
+    async def run(self):
+        """Stream (and poll, when needed) until `stop()` is called."""
+        self._stopping.clear()
+        if self.client is not None:
+            await self._poll()
+        tasks: List[asyncio.Task] = [
+            asyncio.create_task(self._stream()),
+            asyncio.create_task(self._publish_loop()),
+        ]
+        if self.client is not None:
+            tasks.append(asyncio.create_task(self._fallback()))
+        try:
+            await self._stopping.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.feed.close()
+            self.streaming = False
+
+    def stop(self):
+        self._stopping.set()
+
+    def _accepts(self, tick: FeedTick) -> bool:
+        if tick.underlying != self.key.underlying:
+            return False
+        # Index ticks are shared by every expiry of the underlying
+        return tick.strike is None or tick.expiry_date in (None, self.key.expiry_date)
+
+    async def _stream(self):
+        delay = self.reconnect_delay
+        while True:
+            try:
+                await self.feed.connect()
+                await self.feed.subscribe(self.key.underlying, self.key.expiry_date)
+                self.streaming = True
+                ticks = aiter(self.feed)
+                while True:
+                    tick = await asyncio.wait_for(anext(ticks), self.stale_after)
+                    delay = self.reconnect_delay
+                    if self._accepts(tick):
+                        self.builder.apply(tick)
+            except FeedDisconnected as e:
+                logger.warning("Feed for %s disconnected: %s", self.key, e)
+            except TimeoutError:
+                logger.warning("Feed for %s silent for %ss, reconnecting", self.key, self.stale_after)
+            except Exception:
+                logger.exception("Feed for %s failed, reconnecting", self.key)
+            self.streaming = False
+            await self.feed.close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+            self.reconnects += 1
+
+    async def _fallback(self):
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            if not self.streaming:
+                await self._poll()
+
+    async def _poll(self):
+        try:
+            data = await self.client.get_option_chain(self.key.exchange, self.key.underlying, self.key.expiry_date)
+        except Exception:
+            logger.exception("Fallback fetch of %s failed", self.key)
+            return
+        # A feed that came back during the request has fresher data
+        if self.streaming and self.polls:
+            return
+        self.builder.reset(OptionChainSnapshot.from_dict(
+            data, underlying=self.key.underlying, expiry_date=self.key.expiry_date
+        ))
+        self.polls += 1
+
+    async def _publish_loop(self):
+        interval = 1.0 / self.max_rate
+        while True:
+            await asyncio.sleep(interval)
+            if self.builder.dirty:
+                await self.flush()
+
+    async def flush(self):
+        """Publish the current chain now."""
+        ticks = self.builder.ticks
+        self.conflated += max(ticks - self._published_ticks - 1, 0)
+        self._published_ticks = ticks
+        snapshot = self.builder.snapshot()
+        try:
+            publish = getattr(self.publisher, "publish", None)
+            if inspect.iscoroutinefunction(publish):
+                await publish(snapshot)
+            else:
+                self.publisher.notify(snapshot)
+            self.published += 1
+            if self.on_update:
+                self.on_update(self.key, snapshot)
+        except Exception:
+            logger.exception("Error publishing %s", self.key)
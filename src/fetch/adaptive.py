@@ -0,0 +1,95 @@
+import time
+from typing import Callable, Optional
+
+import numpy as np
+
+from src.market.trading_calendar import TradingCalendar
+from src.pubsub.snapshot import FIELD_INDEX, OptionChainSnapshot
+
+# Fields whose movement counts as chain activity.
+ACTIVITY_FIELDS = (FIELD_INDEX["open_interest"], FIELD_INDEX["ltp"])
+
+
+class AdaptiveInterval:
+    """
+    Poll interval for one series, from the market calendar, the chain's recent
+    activity and the time left to expiry.
+
+    After each fetch, `observe` measures the share of strikes whose OI or LTP moved
+    since the previous tick and folds it into an exponentially weighted activity
+    level (weight `smoothing` on the newest tick). `interval()` then maps activity 0
+    to `max_interval` and 1 to `min_interval` geometrically, so a quiet lunchtime
+    chain is polled rarely and a busy one often. Within `expiry_ramp` seconds of the
+    expiry close the interval is also capped, falling linearly to `min_interval`.
+
+    Outside the session (weekends, holidays, before the open and after the close)
+    `until_open()` is positive and `interval()` returns the wait until the next open,
+    so a scheduler using the policy stops polling until then. Once the expiry close
+    has passed, `expired()` is True and the series should not be polled again.
+    """
+
+    def __init__(
+        self,
+        calendar: TradingCalendar,
+        expiry_date: Optional[str] = None,
+        min_interval: float = 5.0,
+        max_interval: float = 60.0,
+        smoothing: float = 0.5,
+        expiry_ramp: float = 6 * 3600.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals need 0 < min_interval <= max_interval")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        self.calendar = calendar
+        self.expiry_close = calendar.expiry_close(expiry_date).timestamp() if expiry_date else None
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.smoothing = smoothing
+        self.expiry_ramp = expiry_ramp
+        self.clock = clock
+        # None until two ticks have been compared; treated as fully active meanwhile
+        self.activity: Optional[float] = None
+        self._previous: Optional[OptionChainSnapshot] = None
+
+    def observe(self, snapshot: OptionChainSnapshot):
+        """Update the activity level with a newly fetched tick."""
+        previous, self._previous = self._previous, snapshot
+        if previous is None:
+            return
+        if len(previous) != len(snapshot) or not np.array_equal(previous.strikes, snapshot.strikes):
+            changed = 1.0
+        else:
+            old = previous.values[:, ACTIVITY_FIELDS, :]
+            new = snapshot.values[:, ACTIVITY_FIELDS, :]
+            moved = (old != new) & ~(np.isnan(old) & np.isnan(new))
+            changed = float(moved.any(axis=(0, 1)).mean()) if len(snapshot) else 0.0
+        if self.activity is None:
+            self.activity = changed
+        else:
+            self.activity += self.smoothing * (changed - self.activity)
+
+    def expired(self) -> bool:
+        """True once the series' contract has settled."""
+        return self.expiry_close is not None and self.clock() >= self.expiry_close
+
+    def until_open(self) -> float:
+        """Seconds until the market opens; 0 while it is open."""
+        return self.calendar.seconds_until_open(self.clock())
+
+    def interval(self) -> float:
+        """Seconds until the next poll."""
+        now = self.clock()
+        wait = self.calendar.seconds_until_open(now)
+        if wait > 0:
+            return wait
+
+        activity = 1.0 if self.activity is None else self.activity
+        interval = self.max_interval * (self.min_interval / self.max_interval) ** activity
+        if self.expiry_close is not None:
+            remaining = self.expiry_close - now
+            if 0 < remaining < self.expiry_ramp:
+                ramp = self.min_interval + (self.max_interval - self.min_interval) * remaining / self.expiry_ramp
+                interval = min(interval, ramp)
+        return interval
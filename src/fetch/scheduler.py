@@ -0,0 +1,252 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from src.client.interfaces import TradingClient
+from src.fetch.adaptive import AdaptiveInterval
+from src.metrics.registry import METRICS, MetricsRegistry
+from src.pubsub.interfaces import IPublisher
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class FetchKey(NamedTuple):
+    """Identifies one option chain series to poll."""
+    exchange: str
+    underlying: str
+    expiry_date: str
+
+
+class FetchJob:
+    """
+    Schedule and bookkeeping for one polled series. With a `policy`, `interval` is
+    recomputed after every fetch.
+    """
+
+    def __init__(self, key: FetchKey, interval: float, publisher: IPublisher, policy: Optional[AdaptiveInterval] = None):
+        self.key = key
+        self.interval = interval
+        self.publisher = publisher
+        self.policy = policy
+        self.next_due: float = 0.0
+        self.dispatched: float = 0.0
+        self.in_flight: bool = False
+        self.fetches: int = 0
+        self.errors: int = 0
+        self.last_error: Optional[BaseException] = None
+        self.last_duration: float = 0.0
+
+
+class FetchScheduler:
+    """
+    Polls many (exchange, underlying, expiry) option chains concurrently.
+
+    All series share one (already authenticated) `TradingClient` and a bounded thread
+    pool. Each series has its own poll interval and feeds its own publisher; at most one
+    fetch per series is in flight, so its publisher always sees ticks in order.
+
+    A series added with an `AdaptiveInterval` policy is polled at the interval the
+    policy picks after each tick, and not at all while its market is closed. When its
+    contract expires the series is removed and passed to `on_expire`, which may add
+    the next expiry.
+    """
+
+    def __init__(
+        self,
+        client: TradingClient,
+        max_workers: int = 4,
+        default_interval: float = 60.0,
+        on_update: Optional[Callable[[FetchKey, OptionChainSnapshot], None]] = None,
+        on_error: Optional[Callable[[FetchKey, BaseException], None]] = None,
+        on_expire: Optional[Callable[[FetchKey], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        if default_interval <= 0:
+            raise ValueError(f"default_interval must be positive, got {default_interval}")
+        self.client = client
+        self.metrics = metrics or METRICS
+        self.default_interval = default_interval
+        self.on_update = on_update
+        self.on_error = on_error
+        self.on_expire = on_expire
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch")
+        self._jobs: Dict[FetchKey, FetchJob] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._closed = False
+        # Set whenever run() is not executing, so close() can wait for it to return
+        self._idle = threading.Event()
+        self._idle.set()
+        self._runner: Optional[threading.Thread] = None
+
+    def add(
+        self,
+        key: FetchKey,
+        interval: Optional[float] = None,
+        publisher: Optional[IPublisher] = None,
+        policy: Optional[AdaptiveInterval] = None,
+    ) -> IPublisher:
+        """
+        Start polling a series every `interval` seconds (the scheduler default if None),
+        or as often as `policy` decides. Returns the publisher fed by this series,
+        creating an `OptionChainData` if none is given. Raises ValueError for an
+        interval that is not positive, which would poll the broker in a busy loop.
+        """
+        if interval is not None and interval <= 0:
+            raise ValueError(f"Poll interval for {key} must be positive, got {interval}")
+        with self._lock:
+            if key in self._jobs:
+                raise ValueError(f"Series {key} is already scheduled")
+            job = FetchJob(
+                key,
+                interval if interval is not None else self.default_interval,
+                publisher or OptionChainData(metrics=self.metrics),
+                policy
+            )
+            self._jobs[key] = job
+        self._wakeup.set()
+        return job.publisher
+
+    def remove(self, key: FetchKey):
+        """Stop polling a series. A fetch already in flight still completes."""
+        with self._lock:
+            self._jobs.pop(key, None)
+
+    def publisher(self, key: FetchKey) -> IPublisher:
+        return self._jobs[key].publisher
+
+    def jobs(self) -> List[FetchJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def run_once(self):
+        """
+        Fetch every series once, concurrently, and wait for all of them to be published.
+        """
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if not job.in_flight]
+            now = self._clock()
+            for job in jobs:
+                job.in_flight = True
+                job.dispatched = now
+        wait([self._executor.submit(self._fetch, job) for job in jobs])
+
+    def run(self):
+        """
+        Poll every series on its own cadence until `stop()` is called.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("FetchScheduler is closed")
+            self._stopping.clear()
+            self._idle.clear()
+            self._runner = threading.current_thread()
+        try:
+            self._run()
+        finally:
+            self._idle.set()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.clear()
+            now = self._clock()
+            timeout = None
+            expired = []
+
+            with self._lock:
+                for job in list(self._jobs.values()):
+                    if self._stopping.is_set():
+                        # close() may be about to shut the executor down
+                        break
+                    if job.in_flight:
+                        continue
+                    if job.policy is not None and job.policy.expired():
+                        del self._jobs[job.key]
+                        expired.append(job.key)
+                        continue
+                    if job.next_due <= now and job.policy is not None:
+                        closed_for = job.policy.until_open()
+                        if closed_for > 0:
+                            job.next_due = now + closed_for
+                    if job.next_due <= now:
+                        job.in_flight = True
+                        job.dispatched = now
+                        job.next_due = now + job.interval
+                        self._executor.submit(self._fetch, job)
+                    else:
+                        remaining = job.next_due - now
+                        timeout = remaining if timeout is None else min(timeout, remaining)
+
+            for key in expired:
+                logger.info("Series %s expired, no longer polling it", key)
+                if self.on_expire:
+                    self.on_expire(key)
+            if expired:
+                # on_expire may have scheduled the next expiry
+                continue
+
+            # Sleep until the next series is due, a fetch completes, or the schedule changes.
+            self._wakeup.wait(timeout)
+
+    def stop(self):
+        """Make `run()` return after its current pass."""
+        self._stopping.set()
+        self._wakeup.set()
+
+    def close(self):
+        """Stop polling, wait for `run()` to return and for fetches in flight."""
+        with self._lock:
+            self._closed = True
+            self.stop()
+        if self._runner is not threading.current_thread():
+            self._idle.wait()
+        self._executor.shutdown(wait=True)
+
+    def _fetch(self, job: FetchJob):
+        key = job.key
+        metrics = self.metrics
+        labels = {"underlying": key.underlying, "expiry": key.expiry_date}
+        started = time.perf_counter()
+        try:
+            with metrics.timer("fetch_seconds", **labels):
+                market_data = self.client.get_option_chain(
+                    exchange=key.exchange,
+                    underlying=key.underlying,
+                    expiry_date=key.expiry_date
+                )
+            with metrics.timer("parse_seconds", **labels):
+                snapshot = OptionChainSnapshot.from_dict(
+                    market_data,
+                    underlying=key.underlying,
+                    expiry_date=key.expiry_date
+                )
+            with metrics.timer("publish_seconds", **labels):
+                job.publisher.notify(snapshot)
+            job.fetches += 1
+            if job.policy is not None:
+                job.policy.observe(snapshot)
+            if self.on_update:
+                self.on_update(key, snapshot)
+        except Exception as e:
+            job.errors += 1
+            job.last_error = e
+            metrics.inc("fetch_errors_total", **labels)
+            if self.on_error:
+                self.on_error(key, e)
+            else:
+                logger.exception("Error fetching or processing %s", key)
+        finally:
+            job.last_duration = time.perf_counter() - started
+            with self._lock:
+                if job.policy is not None:
+                    job.interval = job.policy.interval()
+                    job.next_due = job.dispatched + job.interval
+                job.in_flight = False
+            self._wakeup.set()
@@ -0,0 +1,110 @@
+import calendar
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional, Sequence, Union
+
+# Weekday (Monday=0) on which each index's options expire.
+EXPIRY_WEEKDAY = {
+    "NIFTY": 1,       # Tuesday
+    "BANKNIFTY": 1,
+    "FINNIFTY": 1,
+    "MIDCPNIFTY": 1,
+    "SENSEX": 3,      # Thursday
+    "BANKEX": 3,
+}
+
+# Indices that still list weekly contracts; the rest only have monthly expiries.
+WEEKLY_UNDERLYINGS = {"NIFTY", "SENSEX"}
+
+# Exchange each index's options trade on.
+EXCHANGE = {
+    "SENSEX": "BSE",
+    "BANKEX": "BSE",
+}
+
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+
+
+def exchange_for(underlying: str) -> str:
+    """Return the exchange ("NSE" or "BSE") the underlying's options are listed on."""
+    return EXCHANGE.get(underlying.upper(), "NSE")
+
+
+def _as_date(currently: Union[date, datetime]) -> date:
+    return currently.date() if isinstance(currently, datetime) else currently
+
+
+def _shift(expiry: date, trading_day: Optional[Callable[[date], bool]]) -> date:
+    """Move an expiry falling on a non-trading day back to the previous trading day."""
+    if trading_day is not None:
+        while not trading_day(expiry):
+            expiry -= timedelta(days=1)
+    return expiry
+
+
+def next_weekly_expiry(
+    underlying: str,
+    currently: Union[date, datetime],
+    trading_day: Optional[Callable[[date], bool]] = None,
+) -> date:
+    """
+    Return the next weekly expiry on or after `currently`. With a `trading_day`
+    predicate (see `TradingCalendar.is_trading_day`), expiries on holidays move to
+    the previous trading day.
+    """
+    today = _as_date(currently)
+    weekday = EXPIRY_WEEKDAY.get(underlying.upper(), 1)
+    nominal = today + timedelta(days=(weekday - today.weekday()) % 7)
+    expiry = _shift(nominal, trading_day)
+    if expiry < today:
+        # This week's expiry was brought forward and has already passed
+        expiry = _shift(nominal + timedelta(days=7), trading_day)
+    return expiry
+
+
+def _last_weekday_of_month(year: int, month: int, weekday: int) -> date:
+    last = date(year, month, calendar.monthrange(year, month)[1])
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def next_monthly_expiry(
+    underlying: str,
+    currently: Union[date, datetime],
+    trading_day: Optional[Callable[[date], bool]] = None,
+) -> date:
+    """
+    Return the next monthly expiry (last expiry weekday of the month) on or after
+    `currently`, shifted off holidays like `next_weekly_expiry`.
+    """
+    today = _as_date(currently)
+    weekday = EXPIRY_WEEKDAY.get(underlying.upper(), 1)
+    expiry = _shift(_last_weekday_of_month(today.year, today.month, weekday), trading_day)
+    if expiry < today:
+        year, month = (today.year + 1, 1) if today.month == 12 else (today.year, today.month + 1)
+        expiry = _shift(_last_weekday_of_month(year, month, weekday), trading_day)
+    return expiry
+
+
+def upcoming_expiries(
+    underlying: str,
+    currently: Union[date, datetime],
+    kinds: Sequence[str] = (WEEKLY, MONTHLY),
+    trading_day: Optional[Callable[[date], bool]] = None,
+) -> List[str]:
+    """
+    Return the distinct upcoming expiry dates ("YYYY-MM-DD") of the requested kinds.
+    Weekly expiries are skipped for indices that only list monthly contracts.
+    """
+    expiries = []
+    for kind in kinds:
+        if kind == WEEKLY:
+            if underlying.upper() not in WEEKLY_UNDERLYINGS:
+                continue
+            expiry = next_weekly_expiry(underlying, currently, trading_day)
+        elif kind == MONTHLY:
+            expiry = next_monthly_expiry(underlying, currently, trading_day)
+        else:
+            raise ValueError(f"Unknown expiry kind '{kind}'. Supported kinds: {[WEEKLY, MONTHLY]}")
+        if expiry.isoformat() not in expiries:
+            expiries.append(expiry.isoformat())
+    return expiries
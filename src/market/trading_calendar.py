@@ -0,0 +1,180 @@
+import os
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+from zoneinfo import ZoneInfo
+
+from src.market.expiry import MONTHLY, WEEKLY, upcoming_expiries
+
+IST = ZoneInfo("Asia/Kolkata")
+
+# Equity derivatives sessions on NSE and BSE (IST). Pre-open only runs the cash
+# market's call auction, so option chains barely move before MARKET_OPEN.
+PRE_OPEN = time(9, 0)
+MARKET_OPEN = time(9, 15)
+MARKET_CLOSE = time(15, 30)
+
+CLOSED = "closed"
+PRE_OPEN_PHASE = "pre_open"
+OPEN = "open"
+
+# Weekday trading holidays from the exchange circulars. Update every December; extra
+# dates can be added at runtime with `load_holidays` (MARKET_HOLIDAYS in main.py).
+NSE_HOLIDAYS = frozenset({
+    date(2026, 1, 26),   # Republic Day
+    date(2026, 3, 3),    # Holi
+    date(2026, 3, 26),   # Shri Ram Navami
+    date(2026, 3, 31),   # Shri Mahavir Jayanti
+    date(2026, 4, 3),    # Good Friday
+    date(2026, 4, 14),   # Dr. Baba Saheb Ambedkar Jayanti
+    date(2026, 5, 1),    # Maharashtra Day
+    date(2026, 5, 28),   # Bakri Id
+    date(2026, 6, 26),   # Muharram
+    date(2026, 9, 14),   # Ganesh Chaturthi
+    date(2026, 10, 2),   # Mahatma Gandhi Jayanti
+    date(2026, 10, 20),  # Dussehra
+    date(2026, 11, 10),  # Diwali Balipratipada
+    date(2026, 11, 24),  # Prakash Gurpurb Sri Guru Nanak Dev
+    date(2026, 12, 25),  # Christmas
+})
+
+# BSE follows the same holiday list for equity derivatives.
+BSE_HOLIDAYS = NSE_HOLIDAYS
+
+Moment = Union[datetime, float]
+
+
+def load_holidays(path: Union[str, os.PathLike]) -> List[date]:
+    """Read one ISO date ("YYYY-MM-DD") per line; blank lines and `#` comments are ignored."""
+    holidays = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                holidays.append(date.fromisoformat(line))
+    return holidays
+
+
+def _as_ist(moment: Moment) -> datetime:
+    """An IST datetime from epoch seconds or a datetime (naive ones are taken as IST)."""
+    if isinstance(moment, datetime):
+        return moment.replace(tzinfo=IST) if moment.tzinfo is None else moment.astimezone(IST)
+    return datetime.fromtimestamp(moment, IST)
+
+
+class TradingCalendar:
+    """
+    Session hours and holidays of one exchange.
+
+    Answers whether the market is open at a moment, when the next session opens, and
+    which contracts are live: `expiries()` applies the exchange's expiry rules
+    (`src.market.expiry`) and moves expiries that fall on a holiday to the previous
+    trading day. Moments are datetimes (naive ones are read as IST) or epoch seconds.
+    """
+
+    def __init__(
+        self,
+        exchange: str = "NSE",
+        holidays: Iterable[date] = (),
+        open_time: time = MARKET_OPEN,
+        close_time: time = MARKET_CLOSE,
+        pre_open: time = PRE_OPEN,
+    ):
+        if not pre_open <= open_time < close_time:
+            raise ValueError("Sessions need pre_open <= open_time < close_time")
+        self.exchange = exchange
+        self.holidays = frozenset(holidays)
+        self.open_time = open_time
+        self.close_time = close_time
+        self.pre_open = pre_open
+
+    def with_holidays(self, holidays: Iterable[date]) -> "TradingCalendar":
+        """A copy of this calendar with extra holidays."""
+        return TradingCalendar(
+            self.exchange, self.holidays | frozenset(holidays), self.open_time, self.close_time, self.pre_open
+        )
+
+    def is_trading_day(self, day: Union[date, datetime]) -> bool:
+        if isinstance(day, datetime):
+            day = _as_ist(day).date()
+        return day.weekday() < 5 and day not in self.holidays
+
+    def next_trading_day(self, day: date) -> date:
+        """The first trading day on or after `day`."""
+        while not self.is_trading_day(day):
+            day += timedelta(days=1)
+        return day
+
+    def previous_trading_day(self, day: date) -> date:
+        """The last trading day on or before `day`."""
+        while not self.is_trading_day(day):
+            day -= timedelta(days=1)
+        return day
+
+    def session(self, day: date) -> Tuple[datetime, datetime]:
+        """(open, close) of `day`'s session as IST datetimes; `day` need not be a trading day."""
+        return datetime.combine(day, self.open_time, IST), datetime.combine(day, self.close_time, IST)
+
+    def phase(self, moment: Moment) -> str:
+        """`OPEN`, `PRE_OPEN_PHASE` or `CLOSED` at `moment`."""
+        now = _as_ist(moment)
+        if not self.is_trading_day(now.date()):
+            return CLOSED
+        clock = now.time()
+        if self.open_time <= clock < self.close_time:
+            return OPEN
+        if self.pre_open <= clock < self.open_time:
+            return PRE_OPEN_PHASE
+        return CLOSED
+
+    def is_open(self, moment: Moment) -> bool:
+        return self.phase(moment) == OPEN
+
+    def next_open(self, moment: Moment) -> datetime:
+        """Start of the session in progress at `moment`, or of the next one."""
+        now = _as_ist(moment)
+        day = now.date()
+        if self.is_trading_day(day) and now.time() < self.close_time:
+            return self.session(day)[0]
+        return self.session(self.next_trading_day(day + timedelta(days=1)))[0]
+
+    def seconds_until_open(self, moment: Moment) -> float:
+        """0 while the market is open, otherwise seconds until the next session opens."""
+        now = _as_ist(moment)
+        return max((self.next_open(now) - now).total_seconds(), 0.0)
+
+    def seconds_until_close(self, moment: Moment) -> float:
+        """Seconds left in the current session, 0 when the market is closed."""
+        now = _as_ist(moment)
+        if not self.is_open(now):
+            return 0.0
+        return (self.session(now.date())[1] - now).total_seconds()
+
+    def expiry_close(self, expiry_date: Union[str, date]) -> datetime:
+        """When contracts expiring on `expiry_date` settle: the close of that day's session."""
+        if isinstance(expiry_date, str):
+            expiry_date = date.fromisoformat(expiry_date)
+        return self.session(expiry_date)[1]
+
+    def expiries(
+        self,
+        underlying: str,
+        currently: Union[date, datetime],
+        kinds: Sequence[str] = (WEEKLY, MONTHLY),
+    ) -> List[str]:
+        """`upcoming_expiries` with holiday-shifted dates."""
+        return upcoming_expiries(underlying, currently, kinds, trading_day=self.is_trading_day)
+
+
+NSE = TradingCalendar("NSE", NSE_HOLIDAYS)
+BSE = TradingCalendar("BSE", BSE_HOLIDAYS)
+
+CALENDARS = {"NSE": NSE, "BSE": BSE}
+
+
+def calendar_for(exchange: str, extra_holidays: Optional[Iterable[date]] = None) -> TradingCalendar:
+    """The calendar of `exchange` ("NSE" or "BSE"), optionally with extra holidays."""
+    try:
+        calendar = CALENDARS[exchange.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown exchange '{exchange}'. Supported exchanges: {list(CALENDARS)}") from None
+    return calendar.with_holidays(extra_holidays) if extra_holidays else calendar
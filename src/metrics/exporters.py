@@ -0,0 +1,111 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+from src.metrics.registry import LabelKey, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+def _labels(key: LabelKey, **extra: str) -> str:
+    pairs = list(key) + sorted(extra.items())
+    if not pairs:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+def prometheus_text(registry: MetricsRegistry) -> str:
+    """
+    Render the registry in the Prometheus text exposition format. Histograms are
+    exported as summaries (quantiles, `_sum` and `_count`).
+    """
+    histograms, counters = registry.collect()
+    lines = []
+    for name in sorted(counters):
+        lines.append(f"# TYPE {name} counter")
+        for key, counter in counters[name].items():
+            lines.append(f"{name}{_labels(key)} {counter.value}")
+    for name in sorted(histograms):
+        lines.append(f"# TYPE {name} summary")
+        for key, hist in histograms[name].items():
+            for q in QUANTILES:
+                lines.append(f"{name}{_labels(key, quantile=str(q))} {hist.percentile(q):.9g}")
+            lines.append(f"{name}_sum{_labels(key)} {hist.sum:.9g}")
+            lines.append(f"{name}_count{_labels(key)} {hist.count}")
+    return "\n".join(lines) + "\n"
+
+
+def summary_line(registry: MetricsRegistry) -> str:
+    """
+    One compact log line: p50/p99 per histogram series and every counter.
+    """
+    histograms, counters = registry.collect()
+    parts = []
+    for name in sorted(histograms):
+        for key, hist in histograms[name].items():
+            label = ",".join(v for _, v in key)
+            series = f"{name}[{label}]" if label else name
+            parts.append(f"{series} p50={hist.percentile(0.5):.3g} p99={hist.percentile(0.99):.3g} n={hist.count}")
+    for name in sorted(counters):
+        for key, counter in counters[name].items():
+            label = ",".join(v for _, v in key)
+            parts.append(f"{name}[{label}]={counter.value}" if label else f"{name}={counter.value}")
+    return " | ".join(parts)
+
+
+def serve_prometheus(registry: MetricsRegistry, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serve `prometheus_text(registry)` on http://host:port/metrics from a daemon thread.
+    Call `shutdown()` on the returned server to stop it.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = prometheus_text(registry).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+class PeriodicReporter:
+    """
+    Emits `summary_line(registry)` every `interval` seconds from a daemon thread.
+    """
+
+    def __init__(self, registry: MetricsRegistry, interval: float = 60.0, emit: Optional[Callable[[str], None]] = None):
+        self.registry = registry
+        self.interval = interval
+        self.emit = emit or logger.info
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "PeriodicReporter":
+        self._thread = threading.Thread(target=self._run, name="metrics-report", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            line = summary_line(self.registry)
+            if line:
+                self.emit(line)
@@ -0,0 +1,211 @@
+import functools
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Log-linear bucketing in the style of HdrHistogram: values below 2 * SUB_BUCKETS are
+# counted exactly, larger ones in SUB_BUCKETS buckets per power of two (~3% relative error).
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_LINEAR_LIMIT = 2 * SUB_BUCKETS
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _bucket_index(value: int) -> int:
+    if value < _LINEAR_LIMIT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return _LINEAR_LIMIT + (shift - 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+
+
+def _bucket_upper(index: int) -> int:
+    if index < _LINEAR_LIMIT:
+        return index
+    shift, sub = divmod(index - _LINEAR_LIMIT, SUB_BUCKETS)
+    return ((sub + SUB_BUCKETS + 1) << (shift + 1)) - 1
+
+
+class Histogram:
+    """
+    HDR-style histogram of non-negative integer samples (nanoseconds for latencies,
+    bytes or strikes for sizes). Recording is O(1) and memory stays at a few hundred
+    buckets however many samples are recorded. `scale` converts recorded integers to
+    the exported unit (1e-9 turns nanoseconds into seconds).
+    """
+
+    def __init__(self, scale: float = 1.0):
+        self.scale = scale
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+        self._counts: List[int] = []
+        self._lock = threading.Lock()
+
+    def record(self, value: int):
+        value = max(int(value), 0)
+        index = _bucket_index(value)
+        with self._lock:
+            if index >= len(self._counts):
+                self._counts.extend([0] * (index + 1 - len(self._counts)))
+            self._counts[index] += 1
+            self.count += 1
+            self.total += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        """
+        Value at quantile `q` (0..1) in exported units, accurate to the bucket resolution.
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, round(q * self.count))
+            seen = 0
+            for index, n in enumerate(self._counts):
+                seen += n
+                if seen >= rank:
+                    return min(_bucket_upper(index), self.max) * self.scale
+        return self.max * self.scale
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count * self.scale if self.count else 0.0
+
+    @property
+    def sum(self) -> float:
+        return self.total * self.scale
+
+
+class Counter:
+    """Monotonic counter."""
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self.value += amount
+
+
+class _Timer:
+    """Context manager recording the elapsed nanoseconds of its block into a histogram."""
+
+    __slots__ = ("histogram", "started")
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.record(time.perf_counter_ns() - self.started)
+
+
+class _NullTimer:
+    """Shared no-op timer handed out while metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """
+    Named, labelled latency histograms, value histograms and counters.
+
+    While `enabled` is False every recording call returns immediately (timers are a
+    shared no-op), so instrumentation can stay in hot paths. Metric names follow
+    Prometheus conventions: latencies end in `_seconds` and are timed in nanoseconds.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, Counter]] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, scale: float = 1.0, **labels: Any) -> Histogram:
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        series = self._histograms.get(name)
+        if series is None or key not in series:
+            with self._lock:
+                series = self._histograms.setdefault(name, {})
+                if key not in series:
+                    series[key] = Histogram(scale)
+        return series[key]
+
+    def counter(self, name: str, **labels: Any) -> Counter:
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        series = self._counters.get(name)
+        if series is None or key not in series:
+            with self._lock:
+                series = self._counters.setdefault(name, {})
+                if key not in series:
+                    series[key] = Counter()
+        return series[key]
+
+    def timer(self, name: str, **labels: Any):
+        """`with registry.timer("notify_seconds"):` records the block's latency."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self.histogram(name, 1e-9, **labels))
+
+    def observe(self, name: str, value: int, **labels: Any):
+        """Record a non-latency sample, e.g. a payload size."""
+        if self.enabled:
+            self.histogram(name, **labels).record(value)
+
+    def inc(self, name: str, amount: int = 1, **labels: Any):
+        if self.enabled:
+            self.counter(name, **labels).inc(amount)
+
+    def timed(self, name: Optional[str] = None, **labels: Any) -> Callable:
+        """
+        Decorator timing every call of the wrapped function, e.g. for a strategy's own stages:
+
+            @METRICS.timed("max_oi_window_seconds")
+            def pick_window(...): ...
+        """
+        def decorator(fn: Callable) -> Callable:
+            metric = name or re.sub(r"\W+", "_", fn.__qualname__.replace("<locals>", "")).lower() + "_seconds"
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with _Timer(self.histogram(metric, 1e-9, **labels)):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def collect(self) -> Tuple[Dict[str, Dict[LabelKey, Histogram]], Dict[str, Dict[LabelKey, Counter]]]:
+        """Copy of the current metric tables, for exporters."""
+        with self._lock:
+            return (
+                {name: dict(series) for name, series in self._histograms.items()},
+                {name: dict(series) for name, series in self._counters.items()},
+            )
+
+
+# Process-wide registry used by the publisher, scheduler and `timed` decorator by default.
+# Disabled until the entry point switches it on.
+METRICS = MetricsRegistry(enabled=False)
+
+
+def timed(name: Optional[str] = None, **labels: Any) -> Callable:
+    """`METRICS.timed` shortcut for strategies."""
+    return METRICS.timed(name, **labels)
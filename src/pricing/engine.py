@@ -0,0 +1,109 @@
+from datetime import datetime, time as dtime
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from src.pricing import black_scholes
+from src.pubsub.snapshot import FIELD_INDEX, SIDE_INDEX, OptionChainSnapshot
+
+IST = ZoneInfo("Asia/Kolkata")
+
+# NSE/BSE index options settle at the 15:30 IST close of the expiry day.
+EXPIRY_TIME = dtime(15, 30)
+
+SECONDS_PER_YEAR = 365.0 * 86400.0
+
+# Floor on time to expiry, so the last minutes of expiry day still get finite greeks.
+MIN_TIME_TO_EXPIRY = 60.0 / SECONDS_PER_YEAR
+
+
+class GreeksEngine:
+    """
+    Recomputes IV and greeks for every strike of a chain from the leg premiums, with
+    one vectorized Black-Scholes pass over the whole CE/PE block.
+
+    Calling the engine on a snapshot returns a copy whose `iv` (in percent, like the
+    broker's), `delta`, `gamma`, `theta` (per calendar day) and `vega` (per IV point)
+    fields are replaced; legs without a usable premium get NaN. Time to expiry runs to
+    15:30 IST on the snapshot's `expiry_date` (or `expiry_date` given here).
+
+    The IVs of each series' previous tick warm-start the solver (mapped onto the new
+    strike grid if it changed), so a steady chain usually converges in one or two
+    Newton steps. Pass an engine as `OptionChainData(enrich=...)` to feed enriched
+    chains to every subscriber.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.065,
+        dividend: float = 0.0,
+        price_field: str = "ltp",
+        expiry_date: Optional[str] = None,
+    ):
+        if price_field not in FIELD_INDEX:
+            raise ValueError(f"Unknown price field '{price_field}'")
+        self.rate = rate
+        self.dividend = dividend
+        self.price_field = price_field
+        self.expiry_date = expiry_date
+        # Previous (strikes, IV block) per (underlying, expiry), for warm starts
+        self._previous: Dict[Tuple[Optional[str], Optional[str]], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def time_to_expiry(self, snapshot: OptionChainSnapshot) -> Optional[float]:
+        """Years from the snapshot's timestamp to the expiry close, or None if the expiry is unknown."""
+        expiry_date = snapshot.expiry_date or self.expiry_date
+        if not expiry_date:
+            return None
+        expires = datetime.combine(datetime.fromisoformat(expiry_date).date(), EXPIRY_TIME, IST).timestamp()
+        return max((expires - snapshot.timestamp) / SECONDS_PER_YEAR, MIN_TIME_TO_EXPIRY)
+
+    def _guess(self, key: Tuple[Optional[str], Optional[str]], strikes: np.ndarray) -> Optional[np.ndarray]:
+        previous = self._previous.get(key)
+        if previous is None:
+            return None
+        old_strikes, old_ivs = previous
+        if np.array_equal(old_strikes, strikes):
+            return old_ivs
+        guess = np.full((len(SIDE_INDEX), len(strikes)), np.nan)
+        for side in range(len(SIDE_INDEX)):
+            known = ~np.isnan(old_ivs[side])
+            if known.any():
+                guess[side] = np.interp(strikes, old_strikes[known], old_ivs[side][known])
+        return guess
+
+    def compute(self, snapshot: OptionChainSnapshot) -> OptionChainSnapshot:
+        """Return `snapshot` with recomputed IV and greeks; unchanged if LTP or expiry are missing."""
+        t = self.time_to_expiry(snapshot)
+        spot = snapshot.underlying_ltp
+        if t is None or not spot or not len(snapshot):
+            return snapshot
+
+        key = (snapshot.underlying, snapshot.expiry_date or self.expiry_date)
+        strikes = snapshot.strikes[None, :]
+        is_call = np.array([[True], [False]])
+        premiums = snapshot.values[:, FIELD_INDEX[self.price_field], :]
+        ivs = black_scholes.implied_volatility(
+            premiums, spot, strikes, t, is_call, self.rate, self.dividend, guess=self._guess(key, snapshot.strikes)
+        )
+        self._previous[key] = (snapshot.strikes, ivs)
+
+        values = snapshot.values.copy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            greeks = black_scholes.greeks(spot, strikes, t, ivs, is_call, self.rate, self.dividend)
+        values[:, FIELD_INDEX["iv"], :] = ivs * 100.0
+        for name, column in greeks.items():
+            values[:, FIELD_INDEX[name], :] = column
+        return OptionChainSnapshot(
+            underlying_ltp=spot,
+            strikes=snapshot.strikes,
+            values=values,
+            strike_keys=snapshot.strike_keys,
+            timestamp=snapshot.timestamp,
+            # The broker's response still holds its own greeks, so to_dict() rebuilds from `values`
+            raw=None,
+            underlying=snapshot.underlying,
+            expiry_date=snapshot.expiry_date,
+        )
+
+    __call__ = compute
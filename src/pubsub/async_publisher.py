@@ -0,0 +1,342 @@
+import asyncio
+import inspect
+import logging
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.pubsub.interfaces import ISubscriber
+from src.pubsub.publisher import FULL, OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """
+    What a subscriber queue does when a new payload arrives and it is already full.
+    """
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest pending payload.
+    CONFLATE = "conflate"        # Keep only the latest pending payload per strike key.
+    BLOCK = "block"              # Make the publisher wait until the subscriber catches up.
+
+
+class SubscriberStats:
+    """
+    Delivery counters for one subscriber queue. Latencies are in seconds and measured
+    from the moment a payload is queued until the subscriber's `update` returns.
+    """
+
+    def __init__(self):
+        self.enqueued: int = 0
+        self.delivered: int = 0
+        self.dropped: int = 0
+        self.errors: int = 0
+        self.lag: int = 0
+        self.max_lag: int = 0
+        self.latency_last: float = 0.0
+        self.latency_max: float = 0.0
+        self.latency_total: float = 0.0
+
+    @property
+    def latency_mean(self) -> float:
+        return self.latency_total / self.delivered if self.delivered else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+            "latency_last": self.latency_last,
+            "latency_mean": self.latency_mean,
+            "latency_max": self.latency_max,
+        }
+
+
+class _SubscriberChannel:
+    """
+    Bounded per-subscriber queue plus the worker task draining it.
+    All methods must be called from the event loop thread.
+    """
+
+    def __init__(self, subscriber: ISubscriber, maxsize: int, policy: OverflowPolicy, executor: Executor):
+        self.subscriber = subscriber
+        self.maxsize = maxsize
+        self.policy = policy
+        self.executor = executor
+        self.stats = SubscriberStats()
+        self.is_async = inspect.iscoroutinefunction(subscriber.update)
+
+        # Pending (strike, payload, enqueued_at) entries. Conflating queues are keyed
+        # by strike so a newer payload replaces the pending one for the same strike.
+        self._items: Union[deque, OrderedDict] = OrderedDict() if policy is OverflowPolicy.CONFLATE else deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+        # BLOCK queues only: payloads that arrived while the queue was full, oldest first,
+        # moved into the queue in order by one feeder task as room frees up.
+        self._overflow: deque = deque()
+        self._overflow_empty = asyncio.Event()
+        self._overflow_empty.set()
+        self._feeder: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def offer(self, strike: str, payload: Any) -> bool:
+        """
+        Queue a payload without waiting. Returns False only for a BLOCK queue that is
+        full or already holding overflow: the payload then waits in the overflow FIFO,
+        behind every earlier payload, until the queue has room.
+        """
+        if self.policy is OverflowPolicy.BLOCK and (self._overflow or len(self._items) >= self.maxsize):
+            self._overflow.append((strike, payload, asyncio.get_running_loop().time()))
+            self._overflow_empty.clear()
+            self.stats.lag = len(self._items) + len(self._overflow)
+            self.stats.max_lag = max(self.stats.max_lag, self.stats.lag)
+            if self._feeder is None:
+                self._feeder = asyncio.get_running_loop().create_task(self._feed())
+            return False
+        self._enqueue(strike, payload, asyncio.get_running_loop().time())
+        return True
+
+    def _enqueue(self, strike: str, payload: Any, now: float):
+        if self.policy is OverflowPolicy.CONFLATE:
+            if strike in self._items:
+                self._items[strike] = (strike, payload, now)
+                self.stats.dropped += 1
+                self.stats.enqueued += 1
+                return True
+            if len(self._items) >= self.maxsize:
+                self._items.popitem(last=False)
+                self.stats.dropped += 1
+            self._items[strike] = (strike, payload, now)
+        else:
+            if len(self._items) >= self.maxsize:
+                self._items.popleft()
+                self.stats.dropped += 1
+            self._items.append((strike, payload, now))
+
+        self.stats.enqueued += 1
+        self._track_lag()
+
+    async def _feed(self):
+        """Move overflow into the queue in arrival order as the worker frees slots."""
+        try:
+            while self._overflow and not self._stopped:
+                if len(self._items) >= self.maxsize:
+                    self._not_full.clear()
+                    await self._not_full.wait()
+                    continue
+                self._enqueue(*self._overflow.popleft())
+        finally:
+            self._feeder = None
+            if not self._overflow:
+                self._overflow_empty.set()
+
+    async def wait_overflow(self):
+        """Wait until every overflowed payload has entered the queue (or the channel stopped)."""
+        await self._overflow_empty.wait()
+
+    def _track_lag(self):
+        self.stats.lag = len(self._items) + len(self._overflow)
+        self.stats.max_lag = max(self.stats.max_lag, self.stats.lag)
+        if self._items:
+            self._idle.clear()
+            self._not_empty.set()
+
+    def _pop(self) -> Tuple[str, Any, float]:
+        if isinstance(self._items, OrderedDict):
+            _, item = self._items.popitem(last=False)
+        else:
+            item = self._items.popleft()
+        self.stats.lag = len(self._items) + len(self._overflow)
+        self._not_full.set()
+        return item
+
+    def start(self):
+        self._stopped = False
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        self._stopped = True
+        # Drop pending overflow and release publishers waiting on it
+        self.stats.dropped += len(self._overflow)
+        self._overflow.clear()
+        self._overflow_empty.set()
+        self._not_full.set()
+        if self._feeder is not None:
+            self._feeder.cancel()
+            self._feeder = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def join(self):
+        while self._overflow or self._items:
+            await self._overflow_empty.wait()
+            await self._idle.wait()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._items:
+                self._idle.set()
+                self._not_empty.clear()
+                await self._not_empty.wait()
+                continue
+
+            strike, payload, enqueued_at = self._pop()
+            try:
+                if self.is_async:
+                    await self.subscriber.update(payload)
+                else:
+                    await loop.run_in_executor(self.executor, self.subscriber.update, payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.stats.errors += 1
+                logger.exception("Subscriber %r failed to process update for strike %r", self.subscriber, strike)
+                continue
+
+            latency = loop.time() - enqueued_at
+            self.stats.delivered += 1
+            self.stats.latency_last = latency
+            self.stats.latency_total += latency
+            self.stats.latency_max = max(self.stats.latency_max, latency)
+
+
+class AsyncOptionChainData(OptionChainData):
+    """
+    Asyncio publisher for option chain data.
+
+    Routing follows `OptionChainData` (global vs strike-specific subscribers), but
+    instead of calling `update` inline every subscriber gets its own bounded queue
+    drained by its own task, so a slow strategy only delays itself. Subscribers may
+    define `update` as a coroutine; synchronous ones run on a thread pool.
+
+    Use from the event loop thread: call `start()` inside a running loop, feed data
+    with `await publish(data)` (honours BLOCK backpressure) or the non-waiting
+    `notify(data)`, and `await close()` on shutdown.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 16,
+        policy: Union[OverflowPolicy, str] = OverflowPolicy.DROP_OLDEST,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        diff: bool = False,
+    ):
+        super().__init__(diff=diff)
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.policy = OverflowPolicy(policy)
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="subscriber")
+        self._channels: Dict[ISubscriber, _SubscriberChannel] = {}
+        self._blocked: List[_SubscriberChannel] = []
+        self._started = False
+
+    def add_subscriber(
+        self,
+        subscriber: ISubscriber,
+        strikes: Union[str, List[str]] = None,
+        mode: str = FULL,
+        maxsize: Optional[int] = None,
+        policy: Union[OverflowPolicy, str, None] = None,
+    ):
+        """
+        Subscribe to OptionChain updates. `maxsize` and `policy` override the
+        publisher defaults for this subscriber's queue; they are fixed by the first
+        subscription of a given subscriber.
+        """
+        super().add_subscriber(subscriber, strikes, mode)
+        if subscriber not in self._channels:
+            channel = _SubscriberChannel(
+                subscriber,
+                maxsize or self.maxsize,
+                OverflowPolicy(policy) if policy is not None else self.policy,
+                self._executor,
+            )
+            self._channels[subscriber] = channel
+            if self._started:
+                channel.start()
+
+    def remove_subscriber(self, subscriber: ISubscriber):
+        """
+        Remove a subscriber and discard anything still queued for it.
+        """
+        super().remove_subscriber(subscriber)
+        channel = self._channels.pop(subscriber, None)
+        if channel is not None:
+            channel.stop()
+
+    def start(self):
+        """Start one worker task per subscriber. Must be called inside a running loop."""
+        self._started = True
+        for channel in self._channels.values():
+            channel.start()
+
+    def notify(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        """
+        Queue data for every interested subscriber without waiting. Payloads for
+        full BLOCK queues wait, in order, in the subscriber's overflow buffer; use
+        `publish` to apply backpressure instead. Raises RuntimeError outside the event
+        loop thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError(
+                "AsyncOptionChainData.notify must be called from the running event loop; "
+                "use asyncio.run_coroutine_threadsafe(publisher.publish(data), loop) from other threads"
+            ) from None
+        super().notify(data)
+        self._blocked.clear()
+
+    async def publish(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        """
+        Queue data for every interested subscriber, waiting on any full BLOCK queue.
+        """
+        OptionChainData.notify(self, data)
+        blocked, self._blocked = self._blocked, []
+        for channel in blocked:
+            await channel.wait_overflow()
+
+    def _deliver(self, subscriber: ISubscriber, payload: Any, strike: str):
+        channel = self._channels[subscriber]
+        if not channel.offer(strike, payload):
+            self._blocked.append(channel)
+
+    async def join(self):
+        """Wait until every subscriber has drained its queue. Returns at once if not started."""
+        if not self._started:
+            return
+        for channel in list(self._channels.values()):
+            await channel.join()
+
+    async def close(self):
+        """Stop all worker tasks, dropping undelivered payloads, and release the thread pool."""
+        self._started = False
+        tasks = [c._task for c in self._channels.values() if c._task is not None]
+        for channel in self._channels.values():
+            channel.stop()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[ISubscriber, Dict[str, float]]:
+        """Per-subscriber lag, drop and latency counters."""
+        return {sub: channel.stats.as_dict() for sub, channel in self._channels.items()}
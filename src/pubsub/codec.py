@@ -0,0 +1,263 @@
+import json
+import math
+import pickle
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.pubsub.snapshot import FIELDS, SIDES, OptionChainSnapshot
+
+# Binary layout of one snapshot record (all little-endian):
+#
+#   header   magic "OCS", version, n_sides, n_fields, n_strikes, timestamp, underlying_ltp,
+#            len(underlying), len(expiry_date)
+#   names    underlying and expiry_date as UTF-8, zero-padded to an 8-byte boundary
+#   strikes  float64[n_strikes]
+#   values   float64[n_sides * n_fields * n_strikes], in the snapshot's (side, field, strike) order
+#
+# Records are self-delimiting, so a file of records can be appended to and scanned in order.
+MAGIC = b"OCS"
+VERSION = 1
+_HEADER = struct.Struct("<3sBBBxxIddHH8x")
+_F8 = np.dtype("<f8")
+
+
+class CodecError(ValueError):
+    """Raised when a buffer does not hold a valid encoded snapshot."""
+
+
+def _pad(n: int) -> int:
+    return -n % 8
+
+
+def encode_snapshot(snapshot: OptionChainSnapshot) -> bytes:
+    """
+    Encode a snapshot into the compact columnar binary layout.
+    """
+    underlying = (snapshot.underlying or "").encode()
+    expiry = (snapshot.expiry_date or "").encode()
+    names = underlying + expiry
+    ltp = snapshot.underlying_ltp
+    header = _HEADER.pack(
+        MAGIC, VERSION, len(SIDES), len(FIELDS), len(snapshot),
+        snapshot.timestamp, math.nan if ltp is None else ltp,
+        len(underlying), len(expiry),
+    )
+    return b"".join((
+        header,
+        names,
+        b"\0" * _pad(len(names)),
+        np.ascontiguousarray(snapshot.strikes, dtype=_F8).tobytes(),
+        np.ascontiguousarray(snapshot.values, dtype=_F8).tobytes(),
+    ))
+
+
+def decode_snapshot(buffer, offset: int = 0) -> Tuple[OptionChainSnapshot, int]:
+    """
+    Decode the snapshot record starting at `offset` in `buffer` (bytes, mmap, memoryview...).
+
+    The strike and value arrays are zero-copy NumPy views into `buffer`, read-only when
+    the buffer is. Returns the snapshot and the offset just past its record.
+    """
+    if len(buffer) - offset < _HEADER.size:
+        raise CodecError("Truncated snapshot header")
+    magic, version, n_sides, n_fields, n, timestamp, ltp, n_underlying, n_expiry = _HEADER.unpack_from(buffer, offset)
+    if magic != MAGIC:
+        raise CodecError(f"Bad snapshot magic {magic!r} at offset {offset}")
+    if version != VERSION or (n_sides, n_fields) != (len(SIDES), len(FIELDS)):
+        raise CodecError(f"Unsupported snapshot layout: version {version}, {n_sides} sides x {n_fields} fields")
+
+    pos = offset + _HEADER.size
+    names = bytes(buffer[pos:pos + n_underlying + n_expiry])
+    pos += n_underlying + n_expiry + _pad(n_underlying + n_expiry)
+    end = pos + _F8.itemsize * n * (1 + n_sides * n_fields)
+    if len(buffer) < end:
+        raise CodecError("Truncated snapshot body")
+
+    strikes = np.frombuffer(buffer, dtype=_F8, count=n, offset=pos)
+    values = np.frombuffer(buffer, dtype=_F8, count=n_sides * n_fields * n, offset=pos + _F8.itemsize * n)
+
+    snapshot = OptionChainSnapshot(
+        underlying_ltp=None if math.isnan(ltp) else ltp,
+        strikes=strikes,
+        values=values.reshape(n_sides, n_fields, n),
+        timestamp=timestamp,
+        underlying=names[:n_underlying].decode() or None,
+        expiry_date=names[n_underlying:].decode() or None,
+    )
+    return snapshot, end
+
+
+class SnapshotCodec(ABC):
+    """
+    A named way of turning a snapshot into bytes and back, for payloads that cross a
+    process, network or disk boundary. Every codec carries the chain's underlying,
+    expiry date and timestamp along with the data.
+    """
+
+    name: str
+
+    @abstractmethod
+    def encode(self, snapshot: OptionChainSnapshot) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, buffer) -> OptionChainSnapshot:
+        pass
+
+
+class ColumnarCodec(SnapshotCodec):
+    """The binary layout above: smallest on the wire and zero-copy to decode."""
+
+    name = "columnar"
+
+    def encode(self, snapshot: OptionChainSnapshot) -> bytes:
+        return encode_snapshot(snapshot)
+
+    def decode(self, buffer) -> OptionChainSnapshot:
+        return decode_snapshot(buffer)[0]
+
+
+def _envelope(snapshot: OptionChainSnapshot) -> Dict[str, Any]:
+    return {
+        "underlying": snapshot.underlying,
+        "expiry_date": snapshot.expiry_date,
+        "timestamp": snapshot.timestamp,
+        "chain": snapshot.to_dict(),
+    }
+
+
+def _from_envelope(envelope: Dict[str, Any]) -> OptionChainSnapshot:
+    return OptionChainSnapshot.from_dict(
+        envelope["chain"],
+        timestamp=envelope["timestamp"],
+        underlying=envelope["underlying"],
+        expiry_date=envelope["expiry_date"],
+    )
+
+
+class JsonCodec(SnapshotCodec):
+    """The Groww response dict as JSON. Human-readable, but the slowest and largest."""
+
+    name = "json"
+
+    def encode(self, snapshot: OptionChainSnapshot) -> bytes:
+        return json.dumps(_envelope(snapshot), separators=(",", ":")).encode()
+
+    def decode(self, buffer) -> OptionChainSnapshot:
+        return _from_envelope(json.loads(bytes(buffer)))
+
+
+class PickleCodec(SnapshotCodec):
+    """The Groww response dict, pickled. Only for trusted peers."""
+
+    name = "pickle"
+
+    def encode(self, snapshot: OptionChainSnapshot) -> bytes:
+        return pickle.dumps(_envelope(snapshot), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, buffer) -> OptionChainSnapshot:
+        return _from_envelope(pickle.loads(buffer))
+
+
+class ProtobufCodec(SnapshotCodec):
+    """
+    The columnar layout as a protobuf message, for consumers in other languages.
+    The schema is built at runtime, so no generated code is needed:
+
+        message OptionChainSnapshot {
+            uint32 version = 1;  uint32 n_sides = 2;  uint32 n_fields = 3;
+            double timestamp = 4;  double underlying_ltp = 5;
+            string underlying = 6;  string expiry_date = 7;
+            repeated double strikes = 8;  repeated double values = 9;
+        }
+    """
+
+    name = "protobuf"
+    _message_class = None
+
+    @classmethod
+    def message_class(cls):
+        if cls._message_class is None:
+            from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+            T = descriptor_pb2.FieldDescriptorProto
+            proto = descriptor_pb2.FileDescriptorProto(
+                name="option_chain_snapshot.proto", package="givememoney", syntax="proto3"
+            )
+            message = proto.message_type.add(name="OptionChainSnapshot")
+            fields = [
+                ("version", T.TYPE_UINT32), ("n_sides", T.TYPE_UINT32), ("n_fields", T.TYPE_UINT32),
+                ("timestamp", T.TYPE_DOUBLE), ("underlying_ltp", T.TYPE_DOUBLE),
+                ("underlying", T.TYPE_STRING), ("expiry_date", T.TYPE_STRING),
+            ]
+            for number, (name, kind) in enumerate(fields, start=1):
+                message.field.add(name=name, number=number, type=kind, label=T.LABEL_OPTIONAL)
+            for number, name in enumerate(("strikes", "values"), start=len(fields) + 1):
+                message.field.add(name=name, number=number, type=T.TYPE_DOUBLE, label=T.LABEL_REPEATED)
+
+            pool = descriptor_pool.DescriptorPool()
+            pool.Add(proto)
+            cls._message_class = message_factory.GetMessageClass(
+                pool.FindMessageTypeByName("givememoney.OptionChainSnapshot")
+            )
+        return cls._message_class
+
+    def encode(self, snapshot: OptionChainSnapshot) -> bytes:
+        ltp = snapshot.underlying_ltp
+        message = self.message_class()(
+            version=VERSION,
+            n_sides=len(SIDES),
+            n_fields=len(FIELDS),
+            timestamp=snapshot.timestamp,
+            underlying_ltp=math.nan if ltp is None else ltp,
+            underlying=snapshot.underlying or "",
+            expiry_date=snapshot.expiry_date or "",
+        )
+        message.strikes.extend(snapshot.strikes.tolist())
+        message.values.extend(snapshot.values.ravel().tolist())
+        return message.SerializeToString()
+
+    def decode(self, buffer) -> OptionChainSnapshot:
+        message = self.message_class().FromString(bytes(buffer))
+        if message.version != VERSION or (message.n_sides, message.n_fields) != (len(SIDES), len(FIELDS)):
+            raise CodecError(
+                f"Unsupported snapshot layout: version {message.version}, "
+                f"{message.n_sides} sides x {message.n_fields} fields"
+            )
+        n = len(message.strikes)
+        values = np.fromiter(message.values, dtype=np.float64, count=len(message.values))
+        return OptionChainSnapshot(
+            underlying_ltp=None if math.isnan(message.underlying_ltp) else message.underlying_ltp,
+            strikes=np.fromiter(message.strikes, dtype=np.float64, count=n),
+            values=values.reshape(len(SIDES), len(FIELDS), n),
+            timestamp=message.timestamp,
+            underlying=message.underlying or None,
+            expiry_date=message.expiry_date or None,
+        )
+
+
+_CODECS: Dict[str, SnapshotCodec] = {
+    codec.name: codec for codec in (ColumnarCodec(), JsonCodec(), PickleCodec(), ProtobufCodec())
+}
+
+
+def register_codec(codec: SnapshotCodec):
+    """Register a new codec under `codec.name`."""
+    _CODECS[codec.name.lower()] = codec
+
+
+def get_codec(name: str) -> SnapshotCodec:
+    """
+    Get a registered codec by name ("columnar", "json", "pickle", "protobuf").
+    """
+    codec = _CODECS.get(name.lower())
+    if codec is None:
+        raise ValueError(f"Snapshot codec '{name}' not found. Supported codecs: {available_codecs()}")
+    return codec
+
+
+def available_codecs() -> List[str]:
+    return list(_CODECS)
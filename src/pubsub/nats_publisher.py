@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Set, Union
+
+from src.pubsub.codec import SnapshotCodec, get_codec
+from src.pubsub.interfaces import IPublisher, ISubscriber
+from src.pubsub.snapshot import OptionChainSnapshot
+
+logger = logging.getLogger(__name__)
+
+SUBJECT_PREFIX = "chain"
+
+
+def chain_subject(underlying: str, expiry_date: str, strike: Optional[str] = None, prefix: str = SUBJECT_PREFIX) -> str:
+    """
+    NATS subject for a chain, or for one of its strikes, e.g. "chain.NIFTY.2026-10-20.23400".
+    Dots inside a strike ("23412.5") would split the token, so they become underscores.
+    """
+    subject = f"{prefix}.{underlying}.{expiry_date}"
+    if strike:
+        subject += "." + strike.replace(".", "_")
+    return subject
+
+
+class NatsPublisher(IPublisher, ISubscriber):
+    """
+    Publisher that distributes one option chain over NATS, so strategies can run in
+    other processes or on other machines.
+
+    `notify` encodes the snapshot once with a `src.pubsub.codec` codec (the columnar
+    binary layout by default; every peer must use the same one) and publishes it to
+    `chain.<underlying>.<expiry>`, plus one single-strike record per strike on
+    `chain.<underlying>.<expiry>.<strike>` when `per_strike` is set. `add_subscriber`
+    subscribes a plain `ISubscriber` to those subjects, with the same global vs
+    strike-specific semantics as `OptionChainData`.
+
+    The publisher is also an `ISubscriber`, so it can be attached globally to a local
+    `OptionChainData` to bridge it onto NATS. `nc` is a connected `nats.aio.client.Client`
+    (or anything with the same async `publish`/`subscribe`). Create the publisher inside
+    a running loop (or pass `loop`); sync methods may then be called from any thread.
+
+    The "pickle" codec is refused unless `allow_pickle=True`: unpickling a message runs
+    whatever code its sender chose, so anyone able to publish on the broker could take
+    over every subscribing process. Only enable it on a broker restricted to trusted peers.
+    """
+
+    def __init__(
+        self,
+        nc: Any,
+        underlying: str,
+        expiry_date: str,
+        prefix: str = SUBJECT_PREFIX,
+        per_strike: bool = True,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        codec: str = "columnar",
+        allow_pickle: bool = False,
+    ):
+        self.codec = get_codec(codec)
+        if self.codec.name == "pickle" and not allow_pickle:
+            raise ValueError(
+                "The pickle codec executes code from any peer on the broker; pass allow_pickle=True "
+                "only if every publisher is trusted"
+            )
+        self.nc = nc
+        self.underlying = underlying
+        self.expiry_date = expiry_date
+        self.prefix = prefix
+        self.per_strike = per_strike
+        self._loop = loop or asyncio.get_running_loop()
+        self._subscriptions: Dict[ISubscriber, Dict[str, Any]] = {}
+        self._global: Set[ISubscriber] = set()
+        self._pending: List[Union[asyncio.Future, Future]] = []
+        self._pending_lock = threading.Lock()
+
+    def subject(self, strike: Optional[str] = None) -> str:
+        return chain_subject(self.underlying, self.expiry_date, strike, self.prefix)
+
+    async def publish(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        """
+        Encode and publish one tick.
+        """
+        snapshot = data if isinstance(data, OptionChainSnapshot) else OptionChainSnapshot.from_dict(
+            data, underlying=self.underlying, expiry_date=self.expiry_date
+        )
+        encode = self.codec.encode
+        await self.nc.publish(self.subject(), encode(snapshot))
+        if self.per_strike:
+            for strike in snapshot.strike_keys:
+                await self.nc.publish(self.subject(strike), encode(snapshot.select([strike])))
+
+    async def subscribe(self, subscriber: ISubscriber, strikes: Union[str, List[str]] = None):
+        """
+        Route matching NATS messages to `subscriber.update` as decoded snapshots.
+        A global subscriber only listens on the chain subject, so it never receives a
+        strike twice.
+        """
+        if not strikes:
+            keys = [""]
+        elif isinstance(strikes, str):
+            keys = [strikes]
+        else:
+            keys = [k if k else "" for k in strikes]
+
+        if subscriber in self._global:
+            return
+        if "" in keys:
+            # Upgrading to global: the strike subscriptions would only duplicate data
+            await self.unsubscribe(subscriber)
+            keys = [""]
+
+        subs = self._subscriptions.setdefault(subscriber, {})
+        handler = _SubscriberHandler(subscriber, self.codec)
+        for key in keys:
+            if key not in subs:
+                subs[key] = await self.nc.subscribe(self.subject(key or None), cb=handler)
+        if keys == [""]:
+            self._global.add(subscriber)
+
+    async def unsubscribe(self, subscriber: ISubscriber):
+        """Drop every NATS subscription made for `subscriber`."""
+        self._global.discard(subscriber)
+        for sub in self._subscriptions.pop(subscriber, {}).values():
+            await sub.unsubscribe()
+
+    def add_subscriber(self, subscriber: ISubscriber, strikes: Union[str, List[str]] = None):
+        """Schedule `subscribe`; `await flush()` to wait until it is active."""
+        self._schedule(self.subscribe(subscriber, strikes))
+
+    def remove_subscriber(self, subscriber: ISubscriber):
+        """Schedule `unsubscribe`."""
+        self._schedule(self.unsubscribe(subscriber))
+
+    def notify(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        """Schedule `publish` for one tick."""
+        self._schedule(self.publish(data))
+
+    def update(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        """Forward a tick received from a local publisher onto NATS."""
+        self.notify(data)
+
+    async def flush(self):
+        """Wait for every scheduled publish/subscribe to complete, then flush the connection."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        for fut in pending:
+            await (fut if isinstance(fut, asyncio.Future) else asyncio.wrap_future(fut))
+        flush = getattr(self.nc, "flush", None)
+        if flush is not None:
+            await flush()
+
+    def _schedule(self, coro):
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            fut = self._loop.create_task(coro)
+        else:
+            fut = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        fut.add_done_callback(_log_failure)
+        with self._pending_lock:
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(fut)
+
+
+class _SubscriberHandler:
+    """
+    NATS message callback that decodes a snapshot and hands it to an `ISubscriber`.
+    """
+
+    def __init__(self, subscriber: ISubscriber, codec: SnapshotCodec):
+        self.subscriber = subscriber
+        self.codec = codec
+
+    async def __call__(self, msg):
+        snapshot = self.codec.decode(msg.data)
+        result = self.subscriber.update(snapshot)
+        if asyncio.iscoroutine(result):
+            await result
+
+
+def _log_failure(fut):
+    if not fut.cancelled() and fut.exception() is not None:
+        logger.error("NATS operation failed", exc_info=fut.exception())
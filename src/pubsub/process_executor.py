@@ -0,0 +1,185 @@
+import multiprocessing
+import queue
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.pubsub.codec import decode_snapshot, encode_snapshot
+from src.pubsub.interfaces import ISubscriber
+from src.pubsub.snapshot import OptionChainSnapshot
+
+
+class ProcessStrategyExecutor(ISubscriber):
+    """
+    Runs a group of `ISubscriber` strategies in worker processes, off the fetch loop's GIL.
+
+    Subscribe the executor (globally) to a publisher. Each tick is encoded once into a
+    ring of `multiprocessing.shared_memory` slots; workers decode it as zero-copy NumPy
+    views and call `update` on the strategies they own (assigned round-robin). Only each
+    strategy's small result, from `result_method` (e.g. `get_max_oi_details`), comes back
+    over a queue. A strategy that raises reports the exception as its result. `latest`
+    holds each strategy's newest result; pass `collect_results=True` to also keep every
+    result for `drain()`.
+
+    Strategies are pickled into the workers at `start()`, so their state lives there.
+    They must not keep references to the snapshot after `update` returns, because the
+    slot is reused for later ticks.
+    """
+
+    def __init__(
+        self,
+        strategies: Dict[str, ISubscriber],
+        workers: Optional[int] = None,
+        result_method: Optional[str] = "get_max_oi_details",
+        slots: int = 4,
+        slot_size: int = 1 << 20,
+        start_method: str = "spawn",
+        collect_results: bool = False,
+    ):
+        if not strategies:
+            raise ValueError("ProcessStrategyExecutor needs at least one strategy")
+        self.strategies = strategies
+        self.workers = max(1, min(workers or multiprocessing.cpu_count(), len(strategies)))
+        self.result_method = result_method
+        self.collect_results = collect_results
+        self.slot_size = slot_size
+        self.latest: Dict[str, Any] = {}
+        self._ctx = multiprocessing.get_context(start_method)
+        self._slot_count = slots
+        self._slots: List[SharedMemory] = []
+        self._slot_pending: List[int] = []
+        self._tasks: List[Any] = []
+        self._results: Any = None
+        self._processes: List[Any] = []
+        self._seq = 0
+        self._completed: List[Tuple[int, str, Any]] = []
+
+    def start(self):
+        """Allocate the shared-memory slots and launch the worker processes."""
+        if self._processes:
+            return
+        self._slots = [SharedMemory(create=True, size=self.slot_size) for _ in range(self._slot_count)]
+        self._slot_pending = [0] * self._slot_count
+        self._results = self._ctx.Queue()
+
+        names = list(self.strategies)
+        for worker_id in range(self.workers):
+            owned = {name: self.strategies[name] for name in names[worker_id::self.workers]}
+            tasks = self._ctx.Queue()
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(owned, [s.name for s in self._slots], tasks, self._results, self.result_method),
+                name=f"strategy-worker-{worker_id}",
+                daemon=True,
+            )
+            process.start()
+            self._tasks.append(tasks)
+            self._processes.append(process)
+
+    def update(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        """
+        Hand one tick to every worker. Blocks only if the next slot is still being read.
+        """
+        if not self._processes:
+            self.start()
+        snapshot = data if isinstance(data, OptionChainSnapshot) else OptionChainSnapshot.from_dict(data)
+        payload = encode_snapshot(snapshot)
+        if len(payload) > self.slot_size:
+            raise ValueError(f"Snapshot of {len(payload)} bytes does not fit a {self.slot_size}-byte slot")
+
+        slot = self._seq % self._slot_count
+        while self._slot_pending[slot]:
+            self._collect(block=True)
+
+        self._slots[slot].buf[:len(payload)] = payload
+        self._slot_pending[slot] = len(self._tasks)
+        for tasks in self._tasks:
+            tasks.put((self._seq, slot, len(payload)))
+        self._seq += 1
+
+    def _collect(self, block: bool) -> bool:
+        try:
+            seq, slot, results = self._results.get(block=block, timeout=30 if block else None)
+        except queue.Empty:
+            if block:
+                raise TimeoutError("Strategy workers stopped responding") from None
+            return False
+        self._slot_pending[slot] -= 1
+        for name, result in results.items():
+            self.latest[name] = result
+            if self.collect_results:
+                self._completed.append((seq, name, result))
+        return True
+
+    def drain(self) -> List[Tuple[int, str, Any]]:
+        """
+        Return the (tick sequence, strategy name, result) tuples that arrived since the last call.
+        Always empty unless the executor was created with `collect_results=True`.
+        """
+        while self._results is not None and self._collect(block=False):
+            pass
+        completed, self._completed = self._completed, []
+        return completed
+
+    def join(self):
+        """Wait until every tick handed out so far has been processed by all workers."""
+        while any(self._slot_pending):
+            self._collect(block=True)
+
+    def close(self):
+        """Stop the workers and release the shared memory, even if they stopped responding."""
+        if not self._processes:
+            return
+        try:
+            self.join()
+        finally:
+            for tasks in self._tasks:
+                tasks.put(None)
+            for process in self._processes:
+                process.join(timeout=10)
+                if process.is_alive():
+                    process.terminate()
+            for slot in self._slots:
+                slot.close()
+                slot.unlink()
+            self._processes, self._tasks, self._slots = [], [], []
+
+    def __enter__(self) -> "ProcessStrategyExecutor":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _worker_main(strategies: Dict[str, ISubscriber], slot_names: List[str], tasks, results, result_method: Optional[str]):
+    """
+    Worker process loop: decode each tick from shared memory and run the owned strategies.
+    """
+    slots = [SharedMemory(name=name, track=False) for name in slot_names]
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            seq, slot, size = task
+
+            view = slots[slot].buf[:size]
+            snapshot, _ = decode_snapshot(view)
+            out = {}
+            for name, strategy in strategies.items():
+                try:
+                    strategy.update(snapshot)
+                    method = getattr(strategy, result_method, None) if result_method else None
+                    out[name] = method() if method else None
+                except Exception as e:
+                    out[name] = e
+            # Release the views before the slot can be reused or closed
+            del snapshot
+            try:
+                view.release()
+            except BufferError:
+                pass
+            results.put((seq, slot, out))
+    finally:
+        for shm in slots:
+            shm.close()
@@ -1,25 +1,97 @@
-from typing import Any, Dict, Set, DefaultDict, Union, List
+import sys
+import weakref
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Set, DefaultDict, Tuple, Union, List
 from collections import defaultdict
+from src.metrics.registry import METRICS, MetricsRegistry
 from src.pubsub.interfaces import IPublisher, ISubscriber
+from src.pubsub.snapshot import OptionChainSnapshot, diff_snapshots
+
+# Subscription modes: receive every tick in full, or only what changed (diff mode).
+FULL = "full"
+DELTA = "delta"
+
+
+class _SubscriberRef(weakref.ref):
+    """Weak reference to a subscriber that remembers the subscriber's id for cleanup."""
+
+    __slots__ = ("id",)
+
+    def __init__(self, subscriber: ISubscriber, callback: Callable[["_SubscriberRef"], None]):
+        super().__init__(subscriber, callback)
+        self.id = id(subscriber)
+
 
 class OptionChainData(IPublisher):
     """
     Publisher for option chain data.
+
+    Fan-out goes through a routing plan (global subscribers plus, per strike, the
+    strike-specific subscribers that are not already global) that is rebuilt lazily
+    only after subscriptions change, so `notify` does no set arithmetic per tick.
+
+    With `weak=True` the registry holds subscribers through weak references: a
+    subscriber that is garbage collected without `remove_subscriber` is dropped
+    (with any strike buckets it leaves empty) on the next publisher call, which
+    bounds memory in long-running processes where short-lived watchers come and go.
+    Subscribers must then be kept alive elsewhere and must support weak references.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        diff: bool = False,
+        metrics: Optional[MetricsRegistry] = None,
+        enrich: Optional[Callable[[OptionChainSnapshot], OptionChainSnapshot]] = None,
+        weak: bool = False,
+    ):
+        # Weak mode keys every table below by a `_SubscriberRef` handle instead of the
+        # subscriber itself. Handles of collected subscribers queue up in `_dead` and are
+        # purged on the next call, never from inside a garbage collection.
+        self.weak = weak
+        self._refs: Dict[int, _SubscriberRef] = {}
+        self._dead: List[_SubscriberRef] = []
+
         # Maps a strike price (string) to a set of subscribers interested in it.
         # Use an empty string "" to represent subscribers interested in ALL strikes.
         self._subscribers: DefaultDict[str, Set[ISubscriber]] = defaultdict(set)
         
-        # Keep track of all raw subscribers so we can easily remove them later.
-        self._all_subscribers: Set[ISubscriber] = set()
+        # Reverse index: every subscriber mapped to the strike keys it is subscribed to,
+        # so removal only touches that subscriber's own buckets.
+        self._all_subscribers: Dict[ISubscriber, Set[str]] = {}
+
+        # Immutable fan-out plan derived from the tables above; None when stale.
+        self._global_route: Tuple[ISubscriber, ...] = ()
+        self._strike_routes: Optional[Dict[str, Tuple[ISubscriber, ...]]] = None
+
+        # Diff mode keeps the previous snapshot to work out which strikes changed.
+        self.diff = diff
+        self._previous: Optional[OptionChainSnapshot] = None
+        self._delta_subscribers: Set[ISubscriber] = set()
+
+        # Optional snapshot -> snapshot transform run once per tick before fan-out,
+        # e.g. a `GreeksEngine` recomputing IV and greeks.
+        self.enrich = enrich
 
-    def add_subscriber(self, subscriber: ISubscriber, strikes: Union[str, List[str]] = None):
+        # Latency instrumentation; costs one flag check per call while the registry is disabled.
+        self.metrics = metrics or METRICS
+        self._timed_delivery = False
+
+    def add_subscriber(self, subscriber: ISubscriber, strikes: Union[str, List[str]] = None, mode: str = FULL):
         """
         Subscribe to OptionChain updates.
         If strikes is None or empty, the subscriber will receive data for all strikes.
+        `mode="delta"` (diff mode only) delivers `ChainDelta` updates instead of full payloads.
         """
+        if mode not in (FULL, DELTA):
+            raise ValueError(f"Unknown subscription mode '{mode}'. Supported modes: {[FULL, DELTA]}")
+        if mode == DELTA:
+            if not self.diff:
+                raise ValueError("Delta subscriptions require a publisher created with diff=True")
+        if self._dead:
+            self._purge()
+        handle = self._handle(subscriber, create=True)
+        if mode == DELTA:
+            self._delta_subscribers.add(handle)
+
         if not strikes:
             keys = [""]
         elif isinstance(strikes, str):
@@ -27,24 +99,135 @@ class OptionChainData(IPublisher):
         else:
             keys = strikes
             
+        subscribed = self._all_subscribers.setdefault(handle, set())
         for key in keys:
             k = key if key else ""
-            self._subscribers[k].add(subscriber)
-            
-        self._all_subscribers.add(subscriber)
+            self._subscribers[k].add(handle)
+            subscribed.add(k)
+
+        self._strike_routes = None
 
     def remove_subscriber(self, subscriber: ISubscriber):
         """
         Remove a subscriber from all its subscriptions.
         """
-        if subscriber in self._all_subscribers:
-            self._all_subscribers.remove(subscriber)
-            # Remove from all strike buckets
-            for strike_subscribers in self._subscribers.values():
-                if subscriber in strike_subscribers:
-                    strike_subscribers.remove(subscriber)
+        if self._dead:
+            self._purge()
+        handle = self._handle(subscriber)
+        if handle is not None:
+            self._drop(handle)
+
+    def _handle(self, subscriber: ISubscriber, create: bool = False) -> Any:
+        """The key `subscriber` is registered under: itself, or its weak handle in weak mode."""
+        if not self.weak:
+            return subscriber
+        handle = self._refs.get(id(subscriber))
+        if handle is not None and handle() is not subscriber:
+            # A collected subscriber's id, reused by a new object before the purge
+            handle = None
+        if handle is None and create:
+            handle = self._refs[id(subscriber)] = _SubscriberRef(subscriber, self._dead.append)
+        return handle
+
+    def _drop(self, handle: Any):
+        """Delete one subscriber (by handle) from every table, pruning empty strike buckets."""
+        strikes = self._all_subscribers.pop(handle, None)
+        if strikes is None:
+            return
+        self._delta_subscribers.discard(handle)
+        if self.weak and self._refs.get(handle.id) is handle:
+            del self._refs[handle.id]
+
+        for strike in strikes:
+            bucket = self._subscribers.get(strike)
+            if bucket is not None:
+                bucket.discard(handle)
+                if not bucket:
+                    del self._subscribers[strike]
+
+        self._strike_routes = None
+
+    def _purge(self):
+        """Drop the subscribers that were garbage collected since the last call."""
+        # pop() is atomic, so handles queued by collections in other threads meanwhile are not lost
+        while self._dead:
+            self._drop(self._dead.pop())
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Size of the subscription registry: live subscribers, strike buckets, bucket
+        entries, routed strikes, and the approximate bytes held by the registry's own
+        containers (excluding the subscribers themselves).
+        """
+        if self._dead:
+            self._purge()
+        routes = self._strike_routes or {}
+        containers = [
+            self._subscribers, self._all_subscribers, self._delta_subscribers, self._refs,
+            self._global_route, routes,
+            *self._subscribers.values(), *self._all_subscribers.values(), *routes.values(),
+        ]
+        size = sum(sys.getsizeof(c) for c in containers)
+        if self.weak:
+            size += sum(sys.getsizeof(handle) for handle in self._all_subscribers)
+        return {
+            "subscribers": len(self._all_subscribers),
+            "buckets": len(self._subscribers),
+            "bucket_entries": sum(len(bucket) for bucket in self._subscribers.values()),
+            "routes": len(routes),
+            "bytes": size,
+        }
+
+    def subscriptions(self) -> Dict[ISubscriber, Tuple[Optional[List[str]], str]]:
+        """
+        Current subscriptions as subscriber -> (sorted strike keys, or None for all
+        strikes, mode). Feeding each entry back to `add_subscriber` recreates the table.
+        """
+        result = {}
+        for handle, strikes in list(self._all_subscribers.items()):
+            subscriber = handle() if self.weak else handle
+            if subscriber is not None:
+                result[subscriber] = (
+                    None if "" in strikes else sorted(strikes),
+                    DELTA if handle in self._delta_subscribers else FULL,
+                )
+        return result
+
+    @property
+    def previous_snapshot(self) -> Optional[OptionChainSnapshot]:
+        """The last tick diff mode compared against (None outside diff mode)."""
+        return self._previous
 
-    def notify(self, data: Dict[str, Any]):
+    def prime(self, snapshot: Optional[OptionChainSnapshot]):
+        """
+        Diff mode: treat `snapshot` as the previous tick, e.g. one restored after a
+        restart, so the next `notify` only reports what changed since then.
+        """
+        if self.diff:
+            self._previous = snapshot
+
+    def _routing_plan(self) -> Tuple[Tuple[ISubscriber, ...], Dict[str, Tuple[ISubscriber, ...]]]:
+        """
+        Return (global subscribers, strike -> strike-specific subscribers), rebuilding
+        the plan if subscriptions changed since it was last built. Subscribers registered
+        for both "" and a specific strike only appear in the global route, which prevents
+        double-notifying them. In weak mode the routes hold handles.
+        """
+        if self._dead:
+            self._purge()
+        if self._strike_routes is None:
+            global_subs = self._subscribers.get("", set())
+            routes = {}
+            for strike, subs in self._subscribers.items():
+                if strike:
+                    route = tuple(sub for sub in subs if sub not in global_subs)
+                    if route:
+                        routes[strike] = route
+            self._global_route = tuple(global_subs)
+            self._strike_routes = routes
+        return self._global_route, self._strike_routes
+
+    def notify(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
         """
         Distribute data to subscribers.
         `data` should follow the Groww SDK Option Chain response schema, e.g.:
@@ -55,29 +238,128 @@ class OptionChainData(IPublisher):
                 "23450": { ... }
             }
         }
+        or be an `OptionChainSnapshot` built once from such a response. Snapshots are
+        passed through to subscribers as-is, and strike-specific subscribers receive a
+        single-strike snapshot instead of a filtered dict.
+
+        In diff mode, strike-specific subscribers are only notified when their strike
+        changed since the previous tick, and "delta" subscribers receive a `ChainDelta`
+        (or nothing, if the chain did not move at all).
+
+        With `enrich` set, every tick is converted to a snapshot and passed through it
+        once before fan-out, and subscribers receive the enriched snapshot.
         """
-        if "strikes" not in data:
+        metrics = self.metrics
+        if not metrics.enabled:
+            self._notify(data)
             return
 
-        strikes_data = data["strikes"]
+        self._timed_delivery = True
+        try:
+            with metrics.timer("notify_seconds"):
+                self._notify(data)
+        finally:
+            self._timed_delivery = False
+        metrics.inc("ticks_total")
+        strikes = data if isinstance(data, OptionChainSnapshot) else data.get("strikes", ())
+        metrics.observe("payload_strikes", len(strikes))
+
+    def _notify(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        if self.enrich is not None:
+            # Enriched ticks are always delivered as snapshots
+            if not isinstance(data, OptionChainSnapshot):
+                if "strikes" not in data:
+                    return
+                data = OptionChainSnapshot.from_dict(data)
+            data = self.enrich(data)
+
+        if isinstance(data, OptionChainSnapshot):
+            snapshot = data
+            strikes: Mapping[str, Any] = data.strike_index
+
+            def filter_strike(strike: str) -> OptionChainSnapshot:
+                return data.select([strike])
+        else:
+            if "strikes" not in data:
+                return
+            snapshot = None
+            strikes_data = strikes = data["strikes"]
+
+            # Construct a filtered data payload for a single strike
+            def filter_strike(strike: str) -> Dict[str, Any]:
+                return {
+                    "underlying_ltp": data.get("underlying_ltp"),
+                    "strikes": {strike: strikes_data[strike]}
+                }
+
+        delta = None
+        if self.diff:
+            if snapshot is None:
+                snapshot = OptionChainSnapshot.from_dict(data)
+            delta = diff_snapshots(self._previous, snapshot)
+            self._previous = snapshot
+            strikes = dict.fromkeys(delta.changed_strikes)
+
+        global_route, strike_routes = self._routing_plan()
+        delta_subs = self._delta_subscribers
+        weak = self.weak
         
         # 1. Notify global subscribers (those subscribed to all strikes)
-        global_subs = self._subscribers.get("", set())
-        for sub in global_subs:
-            sub.update(data)
-            
-        # 2. Notify strike-specific subscribers
-        for strike, strike_info in strikes_data.items():
-            specific_subs = self._subscribers.get(strike, set())
-            
-            # Prevent double-notifying if a subscriber registered for both "" and a specific strike
-            subs_to_notify = specific_subs - global_subs
+        for handle in global_route:
+            sub = handle() if weak else handle
+            if sub is None:
+                continue
+            if delta is not None and handle in delta_subs:
+                if not delta.is_empty:
+                    self._deliver(sub, delta, "")
+            else:
+                self._deliver(sub, data, "")
             
-            if subs_to_notify:
-                # Construct a filtered data payload for this specific strike
-                filtered_data = {
-                    "underlying_ltp": data.get("underlying_ltp"),
-                    "strikes": {strike: strike_info}
-                }
-                for sub in subs_to_notify:
-                    sub.update(filtered_data)
+        # 2. Notify strike-specific subscribers, walking whichever side is smaller.
+        # Each filtered payload is built once per strike and shared by its subscribers.
+        for strike, route in _matched_routes(strike_routes, strikes):
+            filtered = filtered_delta = None
+            for handle in route:
+                sub = handle() if weak else handle
+                if sub is None:
+                    continue
+                if delta is not None and handle in delta_subs:
+                    if filtered_delta is None:
+                        filtered_delta = delta.select([strike])
+                    self._deliver(sub, filtered_delta, strike)
+                else:
+                    if filtered is None:
+                        filtered = filter_strike(strike)
+                    self._deliver(sub, filtered, strike)
+
+    def _deliver(self, subscriber: ISubscriber, payload: Any, strike: str):
+        """
+        Hand one payload to one subscriber. `strike` is the subscription key the
+        payload was routed by ("" for global). Subclasses override this to queue
+        or dispatch deliveries elsewhere instead of calling `update` inline.
+        """
+        if self._timed_delivery:
+            label = getattr(subscriber, "metrics_label", None) or type(subscriber).__name__
+            with self.metrics.timer("subscriber_update_seconds", subscriber=label):
+                subscriber.update(payload)
+        else:
+            subscriber.update(payload)
+
+
+def _matched_routes(
+    routes: Dict[str, Tuple[ISubscriber, ...]],
+    strikes: Mapping[str, Any],
+) -> Iterator[Tuple[str, Tuple[ISubscriber, ...]]]:
+    """
+    Yield (strike, route) for strikes present in both the routing plan and the payload,
+    iterating over the smaller of the two.
+    """
+    if len(routes) < len(strikes):
+        for strike, route in routes.items():
+            if strike in strikes:
+                yield strike, route
+    else:
+        for strike in strikes:
+            route = routes.get(strike)
+            if route:
+                yield strike, route
@@ -0,0 +1,278 @@
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+# Option legs, in the order they are stored along axis 0 of the value block.
+SIDES = ("CE", "PE")
+
+# Per-leg numeric fields, in the order they are stored along axis 1 of the value block.
+# Groww nests the IV and greeks under a "greeks" key; the rest sit directly on the leg.
+FIELDS = ("open_interest", "ltp", "volume", "iv", "delta", "gamma", "theta", "vega")
+
+SIDE_INDEX = {side: i for i, side in enumerate(SIDES)}
+FIELD_INDEX = {field: i for i, field in enumerate(FIELDS)}
+
+
+def format_strike(strike: float) -> str:
+    """
+    Render a strike price the way Groww keys it ("23400", or "23412.5" for fractional strikes).
+    """
+    return str(int(strike)) if float(strike).is_integer() else repr(float(strike))
+
+
+class OptionChainSnapshot:
+    """
+    Columnar view of one option chain fetch.
+
+    Strikes are held as a sorted float64 array, and every numeric CE/PE field lives in a
+    single `(len(SIDES), len(FIELDS), n_strikes)` float64 block, so consumers can work on
+    whole columns instead of walking the nested Groww dict. Missing values are NaN.
+    The snapshot is built once per fetch and shared by every subscriber.
+    """
+
+    __slots__ = (
+        "underlying_ltp", "strikes", "values", "timestamp", "raw",
+        "underlying", "expiry_date", "_strike_keys", "_index",
+    )
+
+    def __init__(
+        self,
+        underlying_ltp: Optional[float],
+        strikes: np.ndarray,
+        values: np.ndarray,
+        strike_keys: Optional[List[str]] = None,
+        timestamp: Optional[float] = None,
+        raw: Optional[Dict[str, Any]] = None,
+        underlying: Optional[str] = None,
+        expiry_date: Optional[str] = None,
+    ):
+        self.underlying_ltp = underlying_ltp
+        self.strikes = strikes
+        self.values = values
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.raw = raw
+        self.underlying = underlying
+        self.expiry_date = expiry_date
+        self._strike_keys = strike_keys
+        self._index: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        timestamp: Optional[float] = None,
+        underlying: Optional[str] = None,
+        expiry_date: Optional[str] = None,
+    ) -> "OptionChainSnapshot":
+        """
+        Build a snapshot from a Groww SDK option chain response.
+        Strike keys that cannot be parsed as numbers are skipped. The response does not
+        name its chain, so callers that know it pass `underlying` and `expiry_date`.
+        """
+        parsed = []
+        for key, info in (data.get("strikes") or {}).items():
+            try:
+                parsed.append((float(key), key, info))
+            except (TypeError, ValueError):
+                continue
+        parsed.sort(key=lambda item: item[0])
+
+        nan = float("nan")
+        rows = []
+        for _, _, info in parsed:
+            row = []
+            for side in SIDES:
+                leg = info.get(side) or {}
+                greeks = leg.get("greeks") or {}
+                for field in FIELDS:
+                    value = leg.get(field)
+                    if value is None:
+                        value = greeks.get(field)
+                    row.append(nan if value is None else value)
+            rows.append(row)
+
+        n = len(parsed)
+        # One row per strike, transposed into the (side, field, strike) block layout.
+        values = np.array(rows, dtype=np.float64).reshape(n, len(SIDES), len(FIELDS)).transpose(1, 2, 0).copy()
+        strikes = np.array([item[0] for item in parsed], dtype=np.float64)
+        ltp = data.get("underlying_ltp")
+
+        return cls(
+            underlying_ltp=float(ltp) if ltp is not None else None,
+            strikes=strikes,
+            values=values,
+            strike_keys=[item[1] for item in parsed],
+            timestamp=timestamp,
+            raw=data,
+            underlying=underlying,
+            expiry_date=expiry_date,
+        )
+
+    def __len__(self) -> int:
+        return len(self.strikes)
+
+    @property
+    def strike_keys(self) -> List[str]:
+        """Strike prices as the string keys used by the publisher and Groww payloads."""
+        if self._strike_keys is None:
+            self._strike_keys = [format_strike(s) for s in self.strikes]
+        return self._strike_keys
+
+    @property
+    def strike_index(self) -> Dict[str, int]:
+        """Strike key -> row lookup, built on first use."""
+        if self._index is None:
+            self._index = {key: i for i, key in enumerate(self.strike_keys)}
+        return self._index
+
+    def index_of(self, strike: str) -> Optional[int]:
+        """Return the row of the given strike key, or None if the chain does not contain it."""
+        return self.strike_index.get(strike)
+
+    def column(self, side: str, field: str) -> np.ndarray:
+        """Return the (read-through) column for one leg and field, aligned with `strikes`."""
+        return self.values[SIDE_INDEX[side], FIELD_INDEX[field]]
+
+    def select(self, strikes: Iterable[str]) -> "OptionChainSnapshot":
+        """
+        Return a snapshot restricted to the given strike keys (unknown keys are ignored).
+        """
+        rows = [i for i in (self.index_of(s) for s in strikes) if i is not None]
+        rows.sort()
+        keys = self.strike_keys
+        return OptionChainSnapshot(
+            underlying_ltp=self.underlying_ltp,
+            strikes=self.strikes[rows],
+            values=self.values[:, :, rows],
+            strike_keys=[keys[i] for i in rows],
+            timestamp=self.timestamp,
+            underlying=self.underlying,
+            expiry_date=self.expiry_date,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the chain in the Groww response shape.
+        The original response is returned as-is when the snapshot was built from one.
+        """
+        if self.raw is not None:
+            return self.raw
+
+        strikes: Dict[str, Any] = {}
+        for j, key in enumerate(self.strike_keys):
+            legs = {}
+            for s, side in enumerate(SIDES):
+                leg = {
+                    field: self.values[s, f, j].item()
+                    for f, field in enumerate(FIELDS)
+                    if not np.isnan(self.values[s, f, j])
+                }
+                if leg:
+                    legs[side] = leg
+            strikes[key] = legs
+        return {"underlying_ltp": self.underlying_ltp, "strikes": strikes}
+
+
+class ChainDelta:
+    """
+    Per-strike changes between two consecutive snapshots of the same chain.
+
+    `changed` holds the rows of `snapshot` whose values differ from the previous tick
+    (strikes new to the chain always count as changed), and `deltas` holds
+    `current - previous` for those rows in the `(side, field, row)` block layout.
+    Deltas are NaN wherever either side is missing, including every field of a new strike.
+    """
+
+    __slots__ = ("snapshot", "changed", "deltas", "removed_strikes", "ltp_delta")
+
+    def __init__(
+        self,
+        snapshot: OptionChainSnapshot,
+        changed: np.ndarray,
+        deltas: np.ndarray,
+        removed_strikes: Optional[List[str]] = None,
+        ltp_delta: Optional[float] = None,
+    ):
+        self.snapshot = snapshot
+        self.changed = changed
+        self.deltas = deltas
+        self.removed_strikes = removed_strikes or []
+        self.ltp_delta = ltp_delta
+
+    def __len__(self) -> int:
+        return len(self.changed)
+
+    @property
+    def changed_strikes(self) -> List[str]:
+        keys = self.snapshot.strike_keys
+        return [keys[i] for i in self.changed]
+
+    @property
+    def is_empty(self) -> bool:
+        """True when neither any strike nor the underlying LTP moved."""
+        return not len(self.changed) and not self.removed_strikes and not self.ltp_delta
+
+    def field_delta(self, side: str, field: str) -> np.ndarray:
+        """Return the change of one leg's field for each changed strike, aligned with `changed_strikes`."""
+        return self.deltas[SIDE_INDEX[side], FIELD_INDEX[field]]
+
+    def select(self, strikes: Iterable[str]) -> "ChainDelta":
+        """
+        Return the delta restricted to the given strike keys, re-indexed onto the
+        matching single/multi-strike snapshot.
+        """
+        wanted = set(strikes)
+        keys = self.snapshot.strike_keys
+        positions = [p for p, row in enumerate(self.changed) if keys[row] in wanted]
+        subset = self.snapshot.select(keys[self.changed[p]] for p in positions)
+        return ChainDelta(
+            snapshot=subset,
+            changed=np.array([subset.index_of(keys[self.changed[p]]) for p in positions], dtype=np.intp),
+            deltas=self.deltas[:, :, positions],
+            removed_strikes=[s for s in self.removed_strikes if s in wanted],
+            ltp_delta=self.ltp_delta,
+        )
+
+
+def diff_snapshots(previous: Optional[OptionChainSnapshot], current: OptionChainSnapshot) -> ChainDelta:
+    """
+    Compute the per-strike changes from `previous` to `current`, vectorized over the
+    value blocks. With no previous snapshot every strike counts as new.
+    """
+    n = len(current)
+    if previous is None:
+        return ChainDelta(
+            snapshot=current,
+            changed=np.arange(n, dtype=np.intp),
+            deltas=np.full(current.values.shape, np.nan),
+        )
+
+    if np.array_equal(previous.strikes, current.strikes):
+        matched = np.ones(n, dtype=bool)
+        before = previous.values
+        removed: List[str] = []
+    else:
+        # Align the previous block onto the current strike grid
+        pos = np.clip(np.searchsorted(previous.strikes, current.strikes), 0, max(len(previous) - 1, 0))
+        matched = previous.strikes[pos] == current.strikes if len(previous) else np.zeros(n, dtype=bool)
+        before = np.full(current.values.shape, np.nan)
+        before[:, :, matched] = previous.values[:, :, pos[matched]]
+        gone = ~np.isin(previous.strikes, current.strikes)
+        removed = [previous.strike_keys[i] for i in np.flatnonzero(gone)]
+
+    after = current.values
+    same = (after == before) | (np.isnan(after) & np.isnan(before))
+    changed = np.flatnonzero(~same.all(axis=(0, 1)) | ~matched)
+
+    ltp_delta = None
+    if current.underlying_ltp is not None and previous.underlying_ltp is not None:
+        ltp_delta = current.underlying_ltp - previous.underlying_ltp
+
+    return ChainDelta(
+        snapshot=current,
+        changed=changed,
+        deltas=after[:, :, changed] - before[:, :, changed],
+        removed_strikes=removed,
+        ltp_delta=ltp_delta,
+    )
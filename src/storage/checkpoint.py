@@ -0,0 +1,160 @@
+import logging
+import os
+import pickle
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+from src.pubsub.codec import decode_snapshot, encode_snapshot
+from src.pubsub.interfaces import ISubscriber
+from src.pubsub.publisher import FULL, OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the checkpoint layout changes; older files are ignored on restore.
+CHECKPOINT_VERSION = 1
+
+
+class Checkpointer:
+    """
+    Warm-restart checkpoints for one publisher and the strategies subscribed to it.
+
+    Call `update` with each tick after the publisher has delivered it, e.g. from the
+    scheduler's or pump's `on_update`, so every strategy has already processed the tick
+    being saved (the publisher's fan-out order is unspecified, so the checkpointer is
+    not itself a subscriber). It remembers the latest snapshot and, at most every
+    `interval` seconds, writes one file holding the named strategies' subscriptions,
+    their `get_state()` and the last snapshot (in the columnar wire format). Files are
+    written to a temporary path, fsynced and renamed into place, so a crash mid-write
+    leaves the previous checkpoint intact. Write errors are logged, not raised, and
+    retried after another `interval`.
+
+    `restore()` puts all of that back before the first tick: strategies resume from
+    their saved state, subscriptions are re-created and a diff-mode publisher is primed
+    with the saved snapshot. Strategies without `get_state`/`set_state` keep only their
+    subscriptions. Checkpoints older than `max_age` seconds are treated as stale.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        publisher: OptionChainData,
+        strategies: Mapping[str, ISubscriber],
+        interval: float = 30.0,
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = os.fspath(path)
+        self.publisher = publisher
+        self.strategies = dict(strategies)
+        self.interval = interval
+        self.max_age = max_age
+        self.clock = clock
+        self.snapshot: Optional[OptionChainSnapshot] = None
+        self.saves = 0
+        self.failures = 0
+        self._last_save: Optional[float] = None
+
+    def update(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        """
+        Remember the latest published tick and checkpoint if `interval` has passed
+        since the last save.
+        """
+        self.snapshot = data if isinstance(data, OptionChainSnapshot) else OptionChainSnapshot.from_dict(data)
+        if self._last_save is None or self.clock() - self._last_save >= self.interval:
+            self.save()
+
+    def save(self) -> bool:
+        """Write a checkpoint now. Returns False (after logging why) if it could not be written."""
+        subscriptions = self.publisher.subscriptions()
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "saved_at": self.clock(),
+            "snapshot": encode_snapshot(self.snapshot) if self.snapshot is not None else None,
+            "subscriptions": {
+                name: subscriptions[strategy]
+                for name, strategy in self.strategies.items() if strategy in subscriptions
+            },
+            "strategies": {
+                name: strategy.get_state()
+                for name, strategy in self.strategies.items() if hasattr(strategy, "get_state")
+            },
+        }
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        # A failed attempt also counts as a save, so a full disk is retried every interval, not every tick
+        self._last_save = state["saved_at"]
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except (OSError, pickle.PicklingError):
+            self.failures += 1
+            logger.warning("Could not write checkpoint %s", self.path, exc_info=True)
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return False
+        self.saves += 1
+        return True
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the checkpoint file; None if it is missing, unreadable, from another
+        version or older than `max_age`.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            logger.warning("Ignoring unreadable checkpoint %s", self.path, exc_info=True)
+            return None
+        if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+            logger.warning("Ignoring checkpoint %s with an unsupported version", self.path)
+            return None
+        if self.max_age is not None and self.clock() - state["saved_at"] > self.max_age:
+            logger.info("Ignoring stale checkpoint %s", self.path)
+            return None
+        return state
+
+    def restore(self) -> bool:
+        """
+        Restore strategy state, subscriptions and the last snapshot from the checkpoint.
+        Returns False (and changes nothing) when there is no usable checkpoint.
+        """
+        state = self.load()
+        if state is None:
+            return False
+
+        for name, strategy_state in state["strategies"].items():
+            strategy = self.strategies.get(name)
+            if strategy is not None and hasattr(strategy, "set_state"):
+                strategy.set_state(strategy_state)
+        for name, (strikes, mode) in state["subscriptions"].items():
+            strategy = self.strategies.get(name)
+            if strategy is None:
+                continue
+            # Replace whatever was subscribed at startup with the checkpointed subscription
+            self.publisher.remove_subscriber(strategy)
+            self.publisher.add_subscriber(strategy, strikes, mode=mode if self.publisher.diff else FULL)
+
+        if state["snapshot"] is not None:
+            self.snapshot = decode_snapshot(state["snapshot"])[0]
+            self.publisher.prime(self.snapshot)
+        self._last_save = state["saved_at"]
+        return True
+
+    def close(self):
+        """Write a final checkpoint if any tick was seen."""
+        if self.snapshot is not None:
+            self.save()
+
+    def __enter__(self) -> "Checkpointer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,112 @@
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+from src.pubsub.codec import CodecError, decode_snapshot, encode_snapshot
+from src.pubsub.interfaces import IPublisher, ISubscriber
+from src.pubsub.snapshot import OptionChainSnapshot
+
+
+class TickRecorder(ISubscriber):
+    """
+    Subscriber that appends every option chain it receives to an append-only file of
+    columnar snapshot records (see `src.pubsub.codec`). Subscribe it globally next to
+    the live strategies to capture ticks for backtesting.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], flush_every: int = 1):
+        self.path = os.fspath(path)
+        self.flush_every = flush_every
+        self.recorded = 0
+        self._file = open(self.path, "ab")
+
+    def update(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        """
+        Append one tick. Dict payloads are converted to snapshots first.
+        """
+        snapshot = data if isinstance(data, OptionChainSnapshot) else OptionChainSnapshot.from_dict(data)
+        self._file.write(encode_snapshot(snapshot))
+        self.recorded += 1
+        if self.flush_every and self.recorded % self.flush_every == 0:
+            self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "TickRecorder":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TickReplay:
+    """
+    Memory-maps a recorded tick file and plays it back.
+
+    Records are decoded lazily as zero-copy views into the mapping, so replaying months
+    of ticks never loads the whole file into memory. A partially written record at the
+    end of the file (e.g. after a crash) is ignored.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = os.fspath(path)
+        size = os.path.getsize(self.path)
+        self._data = np.memmap(self.path, dtype=np.uint8, mode="r") if size else np.empty(0, dtype=np.uint8)
+        self._offsets: Optional[List[int]] = None
+
+    def _index(self) -> List[int]:
+        """Offsets of every complete record, found by walking the record headers once."""
+        if self._offsets is None:
+            offsets = []
+            offset = 0
+            while offset < len(self._data):
+                try:
+                    _, end = decode_snapshot(self._data, offset)
+                except CodecError:
+                    break
+                offsets.append(offset)
+                offset = end
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __getitem__(self, i: int) -> OptionChainSnapshot:
+        return decode_snapshot(self._data, self._index()[i])[0]
+
+    def __iter__(self) -> Iterator[OptionChainSnapshot]:
+        for offset in self._index():
+            yield decode_snapshot(self._data, offset)[0]
+
+    def replay(
+        self,
+        publisher: IPublisher,
+        speed: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> int:
+        """
+        Feed every recorded snapshot to `publisher.notify`, in order.
+
+        With `speed=None` ticks are pushed as fast as the subscribers consume them;
+        otherwise the recorded spacing is reproduced at `speed` times real time
+        (e.g. 60 plays an hour of ticks in a minute). Returns the number of ticks replayed.
+        """
+        count = 0
+        started = clock()
+        first_timestamp = None
+        for snapshot in self:
+            if speed:
+                if first_timestamp is None:
+                    first_timestamp = snapshot.timestamp
+                delay = (snapshot.timestamp - first_timestamp) / speed - (clock() - started)
+                if delay > 0:
+                    sleep(delay)
+            publisher.notify(snapshot)
+            count += 1
+        return count
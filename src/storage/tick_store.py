@@ -0,0 +1,313 @@
+import json
+import os
+import re
+import shutil
+from datetime import datetime, time as dtime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.pubsub.interfaces import ISubscriber
+from src.pubsub.snapshot import FIELD_INDEX, FIELDS, SIDE_INDEX, SIDES, OptionChainSnapshot
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+MANIFEST = "manifest.json"
+STORE_VERSION = 1
+
+# IST has no daylight saving, so time-of-day filters use a fixed offset.
+IST_OFFSET = 5 * 3600 + 30 * 60
+
+_NAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+Timestamp = Union[float, datetime]
+
+
+def _epoch(value: Optional[Timestamp]) -> Optional[float]:
+    return value.timestamp() if isinstance(value, datetime) else value
+
+
+def _seconds_of_day(value: dtime) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+class TickStore(ISubscriber):
+    """
+    On-disk store of recorded option chain snapshots, for range queries over history.
+
+    Snapshots are partitioned into one directory per (underlying, expiry) and, inside a
+    partition, into blocks of up to `block_rows` ticks that share one strike grid. Each
+    block is a few `.npy` files: sorted timestamps, the underlying LTP, the strike grid
+    and the CE/PE field values laid out as `(side, field, strike, time)`, so one strike's
+    column over a time range is a contiguous slice. A per-partition manifest records
+    each block's time and strike range.
+
+    Queries skip partitions and blocks by manifest, binary-search the memory-mapped
+    timestamp and strike arrays, and read only the selected columns, so years of
+    minute-level chains never have to fit in memory.
+
+    Subscribe a store to a publisher to record it (snapshots must carry `underlying`
+    and `expiry_date`), and call `flush()`/`close()` to write out the last block.
+    A partition supports one writer at a time.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike], block_rows: int = 1024):
+        if block_rows < 1:
+            raise ValueError(f"block_rows must be at least 1, got {block_rows}")
+        self.root = os.fspath(root)
+        self.block_rows = block_rows
+        self.written = 0
+        # Ticks not yet written to a block, per partition
+        self._pending: Dict[Tuple[str, str], List[OptionChainSnapshot]] = {}
+        os.makedirs(self.root, exist_ok=True)
+
+    # ---- writing ----
+
+    def update(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        self.append(data if isinstance(data, OptionChainSnapshot) else OptionChainSnapshot.from_dict(data))
+
+    def append(self, snapshot: OptionChainSnapshot):
+        """Buffer one snapshot; a block is written once `block_rows` ticks have accumulated."""
+        if not snapshot.underlying or not snapshot.expiry_date:
+            raise ValueError("TickStore needs snapshots that carry underlying and expiry_date")
+        key = (snapshot.underlying.upper(), snapshot.expiry_date)
+        for name in key:
+            if not _NAME.match(name):
+                raise ValueError(f"Cannot use {name!r} as a partition name")
+
+        pending = self._pending.setdefault(key, [])
+        if pending and not np.array_equal(pending[0].strikes, snapshot.strikes):
+            # A block holds a single strike grid; a new grid starts a new block
+            self._write_block(key, pending)
+            pending.clear()
+        pending.append(snapshot)
+        if len(pending) >= self.block_rows:
+            self._write_block(key, pending)
+            pending.clear()
+
+    def flush(self):
+        """Write every partially filled block."""
+        for key, pending in self._pending.items():
+            if pending:
+                self._write_block(key, pending)
+                pending.clear()
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self) -> "TickStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _partition(self, underlying: str, expiry_date: str) -> str:
+        return os.path.join(self.root, underlying.upper(), expiry_date)
+
+    def _write_block(self, key: Tuple[str, str], snapshots: List[OptionChainSnapshot]):
+        partition = self._partition(*key)
+        os.makedirs(partition, exist_ok=True)
+        manifest = self._manifest(partition)
+
+        snapshots = sorted(snapshots, key=lambda s: s.timestamp)
+        timestamps = np.array([s.timestamp for s in snapshots], dtype=np.float64)
+        ltp = np.array([np.nan if s.underlying_ltp is None else s.underlying_ltp for s in snapshots], dtype=np.float64)
+        strikes = np.asarray(snapshots[0].strikes, dtype=np.float64)
+        values = np.stack([s.values for s in snapshots], axis=-1)
+
+        name = f"{len(manifest['blocks']):06d}"
+        tmp = os.path.join(partition, f".{name}.tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        np.save(os.path.join(tmp, "timestamps.npy"), timestamps)
+        np.save(os.path.join(tmp, "underlying_ltp.npy"), ltp)
+        np.save(os.path.join(tmp, "strikes.npy"), strikes)
+        np.save(os.path.join(tmp, "values.npy"), np.ascontiguousarray(values))
+        # A block directory the manifest does not list is left over from a write that
+        # crashed before updating the manifest; replace it rather than fail on it
+        final = os.path.join(partition, name)
+        shutil.rmtree(final, ignore_errors=True)
+        os.replace(tmp, final)
+
+        manifest["blocks"].append({
+            "name": name,
+            "rows": len(timestamps),
+            "t_min": float(timestamps[0]),
+            "t_max": float(timestamps[-1]),
+            "strike_min": float(strikes[0]) if len(strikes) else None,
+            "strike_max": float(strikes[-1]) if len(strikes) else None,
+        })
+        path = os.path.join(partition, MANIFEST)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(f"{path}.tmp", path)
+        self.written += len(timestamps)
+
+    # ---- reading ----
+
+    @staticmethod
+    def _manifest(partition: str) -> Dict[str, Any]:
+        try:
+            with open(os.path.join(partition, MANIFEST), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {"version": STORE_VERSION, "blocks": []}
+        if manifest.get("version") != STORE_VERSION:
+            raise ValueError(f"Unsupported tick store version {manifest.get('version')} in {partition}")
+        return manifest
+
+    def underlyings(self) -> List[str]:
+        return sorted(name for name in os.listdir(self.root) if os.path.isdir(os.path.join(self.root, name)))
+
+    def expiries(self, underlying: str) -> List[str]:
+        """Stored expiry dates of `underlying`, oldest first."""
+        directory = os.path.join(self.root, underlying.upper())
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            name for name in os.listdir(directory)
+            if os.path.isfile(os.path.join(directory, name, MANIFEST))
+        )
+
+    def _select_expiries(self, underlying: str, expiries: Union[None, int, Sequence[str]]) -> List[str]:
+        stored = self.expiries(underlying)
+        if expiries is None:
+            return stored
+        if isinstance(expiries, int):
+            return stored[-expiries:] if expiries > 0 else []
+        return [e for e in expiries if e in stored]
+
+    def _blocks(
+        self, underlying: str, expiry_date: str, start: Optional[float], end: Optional[float],
+        strike_range: Optional[Tuple[float, float]],
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Blocks of one partition that may hold rows in the time and strike range."""
+        partition = self._partition(underlying, expiry_date)
+        for block in self._manifest(partition)["blocks"]:
+            if start is not None and block["t_max"] < start:
+                continue
+            if end is not None and block["t_min"] > end:
+                continue
+            if strike_range is not None and (
+                block["strike_min"] is None
+                or block["strike_max"] < strike_range[0]
+                or block["strike_min"] > strike_range[1]
+            ):
+                continue
+            yield os.path.join(partition, block["name"]), block
+
+    def arrays(
+        self,
+        underlying: str,
+        strikes: Optional[Iterable[Union[str, float]]] = None,
+        sides: Sequence[str] = SIDES,
+        fields: Sequence[str] = ("open_interest",),
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+        expiries: Union[None, int, Sequence[str]] = None,
+        between: Optional[Tuple[dtime, dtime]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Read one row per (tick, strike) as NumPy columns: `expiry_date`, `timestamp`,
+        `strike`, `underlying_ltp` and `<side>_<field>` for every requested leg field.
+
+        `strikes=None` reads every strike. `start`/`end` bound the tick time (inclusive,
+        epoch seconds or datetimes), and `between=(time(10), time(11))` keeps only
+        ticks within that IST time of day on every date. `expiries` is a list of expiry
+        dates or, as an int, the number of most recent expiries; None reads them all.
+        Rows are ordered by expiry, timestamp and strike.
+        """
+        for side in sides:
+            if side not in SIDE_INDEX:
+                raise ValueError(f"Unknown option side '{side}'. Supported sides: {list(SIDES)}")
+        for field in fields:
+            if field not in FIELD_INDEX:
+                raise ValueError(f"Unknown field '{field}'. Supported fields: {list(FIELDS)}")
+        wanted = None if strikes is None else np.unique(np.array([float(s) for s in strikes], dtype=np.float64))
+        strike_range = None if wanted is None or not len(wanted) else (wanted[0], wanted[-1])
+        start, end = _epoch(start), _epoch(end)
+        columns = [f"{side}_{field}" for side in sides for field in fields]
+
+        parts: Dict[str, List[np.ndarray]] = {
+            name: [] for name in ("expiry_date", "timestamp", "strike", "underlying_ltp", *columns)
+        }
+        for expiry_date in self._select_expiries(underlying, expiries):
+            for path, block in self._blocks(underlying, expiry_date, start, end, strike_range):
+                timestamps = np.load(os.path.join(path, "timestamps.npy"), mmap_mode="r")
+                lo = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+                hi = len(timestamps) if end is None else int(np.searchsorted(timestamps, end, side="right"))
+                if lo >= hi:
+                    continue
+                rows = np.arange(lo, hi)
+                if between is not None:
+                    seconds = (np.asarray(timestamps[lo:hi]) + IST_OFFSET) % 86400
+                    rows = rows[(seconds >= _seconds_of_day(between[0])) & (seconds <= _seconds_of_day(between[1]))]
+                    if not len(rows):
+                        continue
+
+                grid = np.load(os.path.join(path, "strikes.npy"))
+                cols = np.arange(len(grid)) if wanted is None else np.flatnonzero(np.isin(grid, wanted))
+                if not len(cols):
+                    continue
+
+                # (side, field, strike, time): each selected column is read as one slice
+                values = np.load(os.path.join(path, "values.npy"), mmap_mode="r")
+                count = len(rows) * len(cols)
+                parts["expiry_date"].append(np.full(count, expiry_date, dtype=object))
+                parts["timestamp"].append(np.repeat(np.asarray(timestamps[rows]), len(cols)))
+                parts["strike"].append(np.tile(grid[cols], len(rows)))
+                ltp = np.load(os.path.join(path, "underlying_ltp.npy"), mmap_mode="r")
+                parts["underlying_ltp"].append(np.repeat(np.asarray(ltp[rows]), len(cols)))
+                for side in sides:
+                    for field in fields:
+                        block_values = values[SIDE_INDEX[side], FIELD_INDEX[field], cols, lo:hi]
+                        parts[f"{side}_{field}"].append(np.asarray(block_values)[:, rows - lo].T.ravel())
+
+        result = {
+            name: np.concatenate(chunks) if chunks else np.empty(0, dtype=object if name == "expiry_date" else np.float64)
+            for name, chunks in parts.items()
+        }
+        # Blocks may overlap in time (e.g. after a strike grid change), so order the rows once
+        order = np.lexsort((result["strike"], result["timestamp"], result["expiry_date"].astype(str)))
+        return {name: column[order] for name, column in result.items()}
+
+    def query(self, underlying: str, **kwargs) -> "pd.DataFrame":
+        """
+        `arrays()` as a pandas DataFrame, with `timestamp` converted to IST datetimes.
+        """
+        import pandas as pd
+
+        frame = pd.DataFrame(self.arrays(underlying, **kwargs))
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"], unit="s", utc=True).dt.tz_convert("Asia/Kolkata")
+        return frame
+
+    def snapshots(
+        self,
+        underlying: str,
+        expiry_date: str,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+    ) -> Iterator[OptionChainSnapshot]:
+        """
+        Yield the stored snapshots of one series in time order, e.g. to replay them into
+        a publisher. Values are read lazily, one block at a time.
+        """
+        start, end = _epoch(start), _epoch(end)
+        blocks = sorted(self._blocks(underlying, expiry_date, start, end, None), key=lambda item: item[1]["t_min"])
+        for path, _ in blocks:
+            timestamps = np.load(os.path.join(path, "timestamps.npy"))
+            ltp = np.load(os.path.join(path, "underlying_ltp.npy"))
+            grid = np.load(os.path.join(path, "strikes.npy"))
+            values = np.load(os.path.join(path, "values.npy"), mmap_mode="r")
+            for i, timestamp in enumerate(timestamps):
+                if (start is not None and timestamp < start) or (end is not None and timestamp > end):
+                    continue
+                yield OptionChainSnapshot(
+                    underlying_ltp=None if np.isnan(ltp[i]) else float(ltp[i]),
+                    strikes=grid,
+                    values=np.array(values[..., i]),
+                    timestamp=float(timestamp),
+                    underlying=underlying.upper(),
+                    expiry_date=expiry_date,
+                )
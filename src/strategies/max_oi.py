@@ -1,73 +1,203 @@
-from typing import Any, Dict, Tuple, Optional
+from typing import Any, Dict, List, Mapping, Sequence, Tuple, Optional, Union
+
+import numpy as np
+
 from src.pubsub.interfaces import ISubscriber
+from src.pubsub.snapshot import OptionChainSnapshot, SIDES
+
+# (type, strike, open interest) for one scored chain, e.g. ("PE", "25100", 5000).
+MaxOIResult = Tuple[Optional[str], Optional[str], int]
+
+
+def nearest_strike_indices(strikes: np.ndarray, ltp: float, count: int) -> np.ndarray:
+    """
+    Return the indices of the `count` strikes nearest to `ltp`, nearest first.
+
+    `strikes` must be sorted ascending. The LTP is located with a binary search and
+    the window is grown outwards with two pointers, so the cost is O(log n + count)
+    instead of sorting every strike by distance. Equidistant strikes resolve to the
+    lower one first.
+    """
+    n = len(strikes)
+    hi = int(np.searchsorted(strikes, ltp))
+    lo = hi - 1
+    picked = []
+    while len(picked) < count and (lo >= 0 or hi < n):
+        if hi >= n or (lo >= 0 and ltp - strikes[lo] <= strikes[hi] - ltp):
+            picked.append(lo)
+            lo -= 1
+        else:
+            picked.append(hi)
+            hi += 1
+    return np.array(picked, dtype=np.intp)
+
+
+def nearest_strike_matrix(strikes: np.ndarray, ltps: np.ndarray, count: int) -> np.ndarray:
+    """
+    Vectorized `nearest_strike_indices` for many LTPs on one sorted strike grid: a
+    `(len(ltps), min(count, len(strikes)))` array of strike indices, nearest first.
+    """
+    n = len(strikes)
+    window = min(count, n)
+    # The `window` nearest strikes always lie within `window` positions either side of
+    # the insertion point, so rank only those 2 * window candidates.
+    pos = np.searchsorted(strikes, ltps)
+    cols = pos[:, None] + np.arange(-window, window)
+    valid = (cols >= 0) & (cols < n)
+    cols = np.clip(cols, 0, n - 1)
+    distances = np.where(valid, np.abs(strikes[cols] - ltps[:, None]), np.inf)
+    order = np.argsort(distances, axis=1, kind="stable")[:, :window]
+    return np.take_along_axis(cols, order, axis=1)
+
+
+def _interleaved_oi(ce_oi: np.ndarray, pe_oi: np.ndarray) -> np.ndarray:
+    """
+    Interleave CE/PE OI along the last axis (CE first for each strike) so that the
+    first maximum found by `argmax` matches a strike-by-strike, CE-before-PE scan.
+    Missing OI counts as -1.
+    """
+    stacked = np.stack((ce_oi, pe_oi), axis=-1)
+    return np.nan_to_num(stacked.reshape(*ce_oi.shape[:-1], -1), nan=-1.0)
+
 
 class MaxOIStrategy(ISubscriber):
     """
-    A strategy that listens to option chain data, finds the 12 strike 
-    prices nearest to the current underlying LTP, and identifies which 
-    specific option (Call or Put) has the absolute highest Open Interest (OI)
+    A strategy that listens to option chain data, finds the `window` strike
+    prices nearest to the current underlying LTP (12 by default), and identifies
+    which specific option (Call or Put) has the absolute highest Open Interest (OI)
     among them, returning its type ("CE" or "PE") and strike price.
     """
-    
-    def __init__(self):
+
+    def __init__(self, window: int = 12):
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self.window = window
         self.max_oi_type: Optional[str] = None  # "CE" or "PE"
         self.max_oi_strike: Optional[str] = None
         self.max_oi_value: int = -1
 
-    def update(self, data: Dict[str, Any]):
+    def update(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
         """
-        Process the option chain data and identify the strike with max OI 
-        among the 12 strikes nearest to the underlying_ltp.
+        Process the option chain data and identify the strike with max OI
+        among the `window` strikes nearest to the underlying_ltp.
+        Accepts either a Groww option chain dict or a pre-built `OptionChainSnapshot`.
         """
-        if "strikes" not in data or "underlying_ltp" not in data:
-            return
-            
-        underlying_ltp = data.get("underlying_ltp", 0.0)
+        if isinstance(data, OptionChainSnapshot):
+            snapshot = data
+        else:
+            if "strikes" not in data or "underlying_ltp" not in data:
+                return
+            snapshot = OptionChainSnapshot.from_dict(data)
+
+        underlying_ltp = snapshot.underlying_ltp
         if not underlying_ltp:
             return
 
-        strikes_data = data["strikes"]
-        
-        # 1. Parse and sort strikes by distance to underlying_ltp
-        strike_distances = []
-        for strike in strikes_data.keys():
-            try:
-                dist = abs(float(strike) - float(underlying_ltp))
-                strike_distances.append((dist, strike))
-            except ValueError:
-                continue
-                
-        strike_distances.sort(key=lambda x: x[0])
-        
-        # 2. Take the 12 nearest
-        nearest_strikes = [s[1] for s in strike_distances[:12]]
-        
-        # 3. Find the maximum OI among these nearest strikes (Calls and Puts)
+        # 1. Locate the nearest strikes on the sorted strike array
+        self._score(snapshot, nearest_strike_indices(snapshot.strikes, underlying_ltp, self.window))
+
+    @property
+    def requires(self) -> Tuple[str, ...]:
+        """Feature stages read by `on_features` when run inside a `FeaturePipeline`."""
+        return (f"nearest:{self.window}",)
+
+    def on_features(self, features: Mapping[str, Any]):
+        """
+        Pipeline entry point: same as `update`, but reuses the shared nearest-strike window.
+        """
+        if features["snapshot"].underlying_ltp:
+            self._score(features["snapshot"], features[f"nearest:{self.window}"])
+
+    def _score(self, snapshot: OptionChainSnapshot, nearest: np.ndarray):
+        # 2. Find the maximum OI among these nearest strikes (Calls and Puts)
+        candidates = _interleaved_oi(
+            snapshot.column("CE", "open_interest")[nearest],
+            snapshot.column("PE", "open_interest")[nearest],
+        )
+
         max_oi = -1
         max_type = None
         max_strike = None
-        
-        for strike in nearest_strikes:
-            strike_info = strikes_data[strike]
-            
-            ce_oi = strike_info.get("CE", {}).get("open_interest", -1)
-            pe_oi = strike_info.get("PE", {}).get("open_interest", -1)
-            
-            if ce_oi > max_oi:
-                max_oi = ce_oi
-                max_type = "CE"
-                max_strike = strike
-                
-            if pe_oi > max_oi:
-                max_oi = pe_oi
-                max_type = "PE"
-                max_strike = strike
-                
-        # 4. Update the strategy's current state with the result for this tick
+
+        if len(candidates):
+            best = int(np.argmax(candidates))
+            if candidates[best] > max_oi:
+                max_oi = int(candidates[best])
+                max_type = SIDES[best % 2]
+                max_strike = snapshot.strike_keys[nearest[best // 2]]
+
+        # 3. Update the strategy's current state with the result for this tick
         self.max_oi_value = max_oi
         self.max_oi_type = max_type
         self.max_oi_strike = max_strike
-                
+
+    def score_batch(self, snapshots: Sequence[OptionChainSnapshot]) -> List[MaxOIResult]:
+        """
+        Score many snapshots (e.g. a whole day of ticks) without touching the
+        strategy's live state. Snapshots that share a strike grid are scored together
+        in one vectorized pass.
+
+        Returns:
+            One (type, strike, OI) tuple per snapshot, in input order. Chains with no
+            LTP or no valid OI in the window score (None, None, -1).
+        """
+        results: List[MaxOIResult] = [(None, None, -1)] * len(snapshots)
+
+        # Group by strike grid; every tick of one expiry usually shares a single grid.
+        groups: Dict[bytes, List[int]] = {}
+        for i, snapshot in enumerate(snapshots):
+            if snapshot.underlying_ltp and len(snapshot):
+                groups.setdefault(snapshot.strikes.tobytes(), []).append(i)
+
+        for positions in groups.values():
+            first = snapshots[positions[0]]
+            for i, result in zip(positions, self._score_grid(first, [snapshots[i] for i in positions])):
+                results[i] = result
+        return results
+
+    def _score_grid(self, first: OptionChainSnapshot, snapshots: List[OptionChainSnapshot]) -> List[MaxOIResult]:
+        """
+        Vectorized scoring of snapshots that all share `first.strikes`.
+        """
+        ltps = np.array([s.underlying_ltp for s in snapshots], dtype=np.float64)
+
+        # 1. The nearest strikes for every tick at once
+        nearest = nearest_strike_matrix(first.strikes, ltps, self.window)
+
+        # 2. Gather CE/PE OI for each tick's window and take the first maximum
+        rows = np.arange(len(snapshots))[:, None]
+        ce_oi = np.stack([s.column("CE", "open_interest") for s in snapshots])[rows, nearest]
+        pe_oi = np.stack([s.column("PE", "open_interest") for s in snapshots])[rows, nearest]
+        candidates = _interleaved_oi(ce_oi, pe_oi)
+        best = np.argmax(candidates, axis=1)
+        values = candidates[np.arange(len(snapshots)), best]
+
+        keys = first.strike_keys
+        results: List[MaxOIResult] = []
+        for t in range(len(snapshots)):
+            if values[t] > -1:
+                b = int(best[t])
+                results.append((SIDES[b % 2], keys[nearest[t, b // 2]], int(values[t])))
+            else:
+                results.append((None, None, -1))
+        return results
+
+    def get_state(self) -> Dict[str, Any]:
+        """Picklable strategy state, for checkpoints."""
+        return {
+            "window": self.window,
+            "max_oi_type": self.max_oi_type,
+            "max_oi_strike": self.max_oi_strike,
+            "max_oi_value": self.max_oi_value,
+        }
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restore state produced by `get_state`."""
+        self.window = state["window"]
+        self.max_oi_type = state["max_oi_type"]
+        self.max_oi_strike = state["max_oi_strike"]
+        self.max_oi_value = state["max_oi_value"]
+
     def get_max_oi_details(self) -> Tuple[Optional[str], Optional[str]]:
         """
         Returns:
@@ -0,0 +1,167 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.pubsub.interfaces import ISubscriber
+from src.pubsub.snapshot import FIELD_INDEX, SIDES, OptionChainSnapshot
+
+# (type, strike, value) for one ranked option leg, e.g. ("PE", "25100", 5000.0).
+RankedLeg = Tuple[str, str, float]
+
+_OI = FIELD_INDEX["open_interest"]
+
+
+class RollingOITracker(ISubscriber):
+    """
+    A streaming companion to `MaxOIStrategy` that keeps per-strike open interest state
+    across ticks instead of recomputing from scratch.
+
+    The last `history + 1` OI columns live in a fixed-size ring buffer, so the OI change
+    over `history` ticks is one vectorized subtraction. Put/call totals are adjusted only
+    by the strikes that changed, which makes PCR O(1) to query. Max-pain and the OI
+    rankings behind `top_oi` are cached and recomputed (in O(n) / O(n log n)) only after
+    a tick that actually moved OI, so repeated top-k queries cost O(k).
+
+    Missing OI counts as 0. When the strike grid changes, history is carried over for
+    the strikes both grids share and new strikes start from 0.
+    """
+
+    def __init__(self, history: int = 12):
+        if history < 1:
+            raise ValueError(f"history must be at least 1, got {history}")
+        self.history = history
+        self.strikes: Optional[np.ndarray] = None
+        self.strike_keys: List[str] = []
+        self.underlying_ltp: Optional[float] = None
+        self.ticks = 0
+        # Strike indices whose OI changed on the last tick
+        self.changed: np.ndarray = np.empty(0, dtype=np.intp)
+
+        self._ring = np.zeros((history + 1, len(SIDES), 0))
+        self._pos = 0
+        self._totals = np.zeros(len(SIDES))
+        self._oi_cache: Dict[str, Any] = {}
+        self._change_cache: Dict[str, Any] = {}
+
+    def update(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        """
+        Fold one tick into the rolling state. Accepts a Groww option chain dict or an
+        `OptionChainSnapshot`.
+        """
+        snapshot = data if isinstance(data, OptionChainSnapshot) else OptionChainSnapshot.from_dict(data)
+        if self.strikes is None or not np.array_equal(self.strikes, snapshot.strikes):
+            self._realign(snapshot)
+
+        oi = np.nan_to_num(snapshot.values[:, _OI, :], nan=0.0)
+        previous = self._ring[self._pos]
+        self.changed = np.flatnonzero((oi != previous).any(axis=0))
+        if len(self.changed):
+            self._totals += (oi[:, self.changed] - previous[:, self.changed]).sum(axis=1)
+            self._oi_cache.clear()
+
+        self._pos = (self._pos + 1) % len(self._ring)
+        self._ring[self._pos] = oi
+        self.ticks += 1
+        self.underlying_ltp = snapshot.underlying_ltp
+        self._change_cache.clear()
+
+    def _realign(self, snapshot: OptionChainSnapshot):
+        """Move the ring buffer onto a new strike grid."""
+        ring = np.zeros((len(self._ring), len(SIDES), len(snapshot)))
+        if self.strikes is not None:
+            _, old, new = np.intersect1d(self.strikes, snapshot.strikes, assume_unique=True, return_indices=True)
+            ring[:, :, new] = self._ring[:, :, old]
+        self._ring = ring
+        self._totals = ring[self._pos].sum(axis=1)
+        self.strikes = np.array(snapshot.strikes, dtype=np.float64)
+        self.strike_keys = list(snapshot.strike_keys)
+        self._oi_cache.clear()
+
+    def get_state(self) -> Dict[str, Any]:
+        """Picklable rolling state, for checkpoints."""
+        return {
+            "history": self.history,
+            "strikes": self.strikes,
+            "strike_keys": self.strike_keys,
+            "underlying_ltp": self.underlying_ltp,
+            "ticks": self.ticks,
+            "ring": self._ring,
+            "pos": self._pos,
+            "totals": self._totals,
+        }
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restore state produced by `get_state`, including the OI history."""
+        self.history = state["history"]
+        self.strikes = None if state["strikes"] is None else np.array(state["strikes"], dtype=np.float64)
+        self.strike_keys = list(state["strike_keys"])
+        self.underlying_ltp = state["underlying_ltp"]
+        self.ticks = state["ticks"]
+        self._ring = np.array(state["ring"], dtype=np.float64)
+        self._pos = state["pos"]
+        self._totals = np.array(state["totals"], dtype=np.float64)
+        self.changed = np.empty(0, dtype=np.intp)
+        self._oi_cache.clear()
+        self._change_cache.clear()
+
+    @property
+    def open_interest(self) -> np.ndarray:
+        """Latest OI as a `(len(SIDES), n_strikes)` array."""
+        return self._ring[self._pos]
+
+    def oi_change(self, strike: Optional[str] = None) -> Union[np.ndarray, Tuple[float, float]]:
+        """
+        OI change over the last `history` ticks (or since the first tick, if fewer have
+        been seen): a (CE, PE) pair for `strike`, or a `(len(SIDES), n_strikes)` array.
+        """
+        change = self._change_cache.get("change")
+        if change is None:
+            lookback = min(self.history, max(self.ticks - 1, 0))
+            change = self._ring[self._pos] - self._ring[(self._pos - lookback) % len(self._ring)]
+            self._change_cache["change"] = change
+        if strike is None:
+            return change
+        i = self.strike_keys.index(strike)
+        return float(change[0, i]), float(change[1, i])
+
+    @property
+    def pcr(self) -> Optional[float]:
+        """Put/call OI ratio across the whole chain, or None without call OI."""
+        ce_total, pe_total = self._totals
+        return float(pe_total / ce_total) if ce_total > 0 else None
+
+    def max_pain(self) -> Optional[str]:
+        """
+        Strike at which option writers pay out the least at expiry, i.e. the strike K
+        minimising sum(CE_oi * max(K - s, 0) + PE_oi * max(s - K, 0)). Ties resolve to
+        the lower strike.
+        """
+        if not self.strike_keys:
+            return None
+        if "max_pain" not in self._oi_cache:
+            strikes = self.strikes
+            ce, pe = self._ring[self._pos]
+            # Prefix sums turn the O(n^2) payout table into O(n)
+            ce_pain = strikes * np.cumsum(ce) - np.cumsum(ce * strikes)
+            pe_pain = np.cumsum((pe * strikes)[::-1])[::-1] - strikes * np.cumsum(pe[::-1])[::-1]
+            self._oi_cache["max_pain"] = self.strike_keys[int(np.argmin(ce_pain + pe_pain))]
+        return self._oi_cache["max_pain"]
+
+    def top_oi(self, k: int = 5) -> List[RankedLeg]:
+        """The `k` option legs with the highest OI, highest first."""
+        return self._top(self._oi_cache, self._ring[self._pos], k)
+
+    def top_oi_change(self, k: int = 5) -> List[RankedLeg]:
+        """The `k` option legs with the largest OI build-up over the rolling window."""
+        return self._top(self._change_cache, self.oi_change(), k)
+
+    def _top(self, cache: Dict[str, Any], values: np.ndarray, k: int) -> List[RankedLeg]:
+        order = cache.get("order")
+        if order is None:
+            # Interleave CE/PE per strike so equal values keep a CE-before-PE, low-strike-first order
+            flat = values.T.ravel()
+            order = np.argsort(-flat, kind="stable")
+            cache["order"] = order
+            cache["flat"] = flat
+        flat = cache["flat"]
+        return [(SIDES[i % 2], self.strike_keys[i // 2], float(flat[i])) for i in order[:k]]
@@ -0,0 +1,236 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.metrics.registry import METRICS, MetricsRegistry
+from src.pubsub.interfaces import ISubscriber
+from src.pubsub.snapshot import FIELD_INDEX, OptionChainSnapshot
+from src.strategies.max_oi import nearest_strike_indices
+
+# The raw chain of the current tick; every other stage derives from it.
+SNAPSHOT = "snapshot"
+
+
+class Stage:
+    """One derived feature: `fn(*values of deps)`, computed at most once per tick."""
+
+    __slots__ = ("name", "fn", "deps")
+
+    def __init__(self, name: str, fn: Callable[..., Any], deps: Sequence[str] = (SNAPSHOT,)):
+        self.name = name
+        self.fn = fn
+        self.deps = tuple(deps)
+
+
+class PipelineStrategy(ABC):
+    """
+    A strategy fed by a `FeaturePipeline` instead of the raw chain. `requires` names
+    the stages it reads; they are computed, in dependency order, before `on_features`.
+    Subscribers may also just define `requires` and `on_features` without subclassing.
+    """
+
+    requires: Sequence[str] = ()
+
+    @abstractmethod
+    def on_features(self, features: "Features"):
+        pass
+
+
+# ---- built-in stages ----
+
+def nearest_window(count: int) -> Stage:
+    """`nearest:<count>`: indices of the `count` strikes nearest the LTP, nearest first."""
+    def compute(snapshot: OptionChainSnapshot) -> np.ndarray:
+        if not snapshot.underlying_ltp:
+            return np.empty(0, dtype=np.intp)
+        return nearest_strike_indices(snapshot.strikes, snapshot.underlying_ltp, count)
+
+    return Stage(f"nearest:{count}", compute)
+
+
+def atm_strike(nearest: np.ndarray) -> Optional[int]:
+    """Index of the at-the-money strike (the one nearest the LTP)."""
+    return int(nearest[0]) if len(nearest) else None
+
+
+def oi_totals(snapshot: OptionChainSnapshot) -> Tuple[float, float]:
+    """Total (CE, PE) open interest across the chain; missing OI counts as 0."""
+    ce, pe = np.nansum(snapshot.values[:, FIELD_INDEX["open_interest"], :], axis=1)
+    return float(ce), float(pe)
+
+
+def pcr(totals: Tuple[float, float]) -> Optional[float]:
+    """Put/call OI ratio, or None without call OI."""
+    ce, pe = totals
+    return pe / ce if ce > 0 else None
+
+
+def iv_smile(snapshot: OptionChainSnapshot, atm: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (strikes, IV) along the chain, taking each strike's out-of-the-money leg: puts
+    below the ATM strike, calls from it upwards. Strikes without an IV are dropped.
+    """
+    if atm is None:
+        return np.empty(0), np.empty(0)
+    ivs = np.where(np.arange(len(snapshot)) < atm, snapshot.column("PE", "iv"), snapshot.column("CE", "iv"))
+    quoted = ~np.isnan(ivs)
+    return snapshot.strikes[quoted], ivs[quoted]
+
+
+DEFAULT_STAGES = (
+    Stage("atm_strike", atm_strike, ("nearest:1",)),
+    Stage("oi_totals", oi_totals),
+    Stage("pcr", pcr, ("oi_totals",)),
+    Stage("iv_smile", iv_smile, (SNAPSHOT, "atm_strike")),
+)
+
+# Parameterised stages, requested as "<prefix>:<argument>", e.g. "nearest:12".
+STAGE_FACTORIES: Dict[str, Callable[[int], Stage]] = {
+    "nearest": nearest_window,
+}
+
+
+class Features(Mapping[str, Any]):
+    """
+    The features of one tick. Looking up a stage computes it (and its dependencies)
+    on first access and returns the memoized value afterwards.
+    """
+
+    def __init__(self, pipeline: "FeaturePipeline", snapshot: OptionChainSnapshot):
+        self.pipeline = pipeline
+        self.snapshot = snapshot
+        self._values: Dict[str, Any] = {SNAPSHOT: snapshot}
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        stage = self.pipeline.get_stage(name)
+        args = [self[dep] for dep in stage.deps]
+        metrics = self.pipeline.metrics
+        if metrics.enabled:
+            with metrics.timer("feature_seconds", stage=name):
+                value = stage.fn(*args)
+        else:
+            value = stage.fn(*args)
+        self._values[name] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def computed(self) -> List[str]:
+        """Stages evaluated so far this tick, in evaluation order."""
+        return list(self._values)
+
+
+class FeaturePipeline(ISubscriber):
+    """
+    Subscriber that computes derived chain features once per tick and shares them
+    between strategies.
+
+    Stages are declared once (see `DEFAULT_STAGES` and `add_stage`). Each tick, the
+    stages the attached strategies `require` are computed in dependency order, then
+    every strategy receives the same `Features`. Stages nobody requires are skipped
+    unless a strategy looks them up, in which case they are computed on demand and
+    memoized for the rest of the tick. The evaluation order is planned once and
+    rebuilt only when stages or strategies change.
+
+    Attached subscribers without `on_features` receive the snapshot through `update`.
+    """
+
+    def __init__(self, stages: Sequence[Stage] = DEFAULT_STAGES, metrics: Optional[MetricsRegistry] = None):
+        self._stages: Dict[str, Stage] = {}
+        self._strategies: List[Union[PipelineStrategy, ISubscriber]] = []
+        self._plan: Optional[Tuple[str, ...]] = None
+        self.metrics = metrics or METRICS
+        self.features: Optional[Features] = None
+        for stage in stages:
+            self.add_stage(stage)
+
+    def add_stage(self, stage: Stage):
+        if stage.name == SNAPSHOT:
+            raise ValueError(f"'{SNAPSHOT}' is the pipeline input and cannot be redefined")
+        self._stages[stage.name] = stage
+        self._plan = None
+
+    def stage(self, name: str, *deps: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Decorator form of `add_stage`; `deps` default to the snapshot."""
+        def register(fn: Callable[..., Any]) -> Callable[..., Any]:
+            self.add_stage(Stage(name, fn, deps or (SNAPSHOT,)))
+            return fn
+        return register
+
+    def get_stage(self, name: str) -> Stage:
+        stage = self._stages.get(name)
+        if stage is None:
+            prefix, _, argument = name.partition(":")
+            factory = STAGE_FACTORIES.get(prefix)
+            if factory is None or not argument.isdigit():
+                raise KeyError(f"Unknown feature stage '{name}'")
+            stage = factory(int(argument))
+            self.add_stage(stage)
+        return stage
+
+    def add_strategy(self, strategy: Union[PipelineStrategy, ISubscriber]):
+        """
+        Attach a strategy. Raises KeyError/ValueError, leaving the pipeline unchanged,
+        if it requires an unknown stage or the stages form a cycle.
+        """
+        if strategy in self._strategies:
+            return
+        self._strategies.append(strategy)
+        self._plan = None
+        try:
+            self.plan()
+        except (KeyError, ValueError):
+            self._strategies.remove(strategy)
+            self._plan = None
+            raise
+
+    def remove_strategy(self, strategy: Union[PipelineStrategy, ISubscriber]):
+        if strategy in self._strategies:
+            self._strategies.remove(strategy)
+            self._plan = None
+
+    def plan(self) -> Tuple[str, ...]:
+        """The stages computed every tick, dependencies first."""
+        if self._plan is None:
+            order: List[str] = []
+            visiting: List[str] = []
+
+            def visit(name: str):
+                if name == SNAPSHOT or name in order:
+                    return
+                if name in visiting:
+                    raise ValueError(f"Feature stages form a cycle: {' -> '.join(visiting + [name])}")
+                visiting.append(name)
+                for dep in self.get_stage(name).deps:
+                    visit(dep)
+                visiting.pop()
+                order.append(name)
+
+            for strategy in self._strategies:
+                for name in getattr(strategy, "requires", ()):
+                    visit(name)
+            self._plan = tuple(order)
+        return self._plan
+
+    def update(self, data: Union[Dict[str, Any], OptionChainSnapshot]):
+        snapshot = data if isinstance(data, OptionChainSnapshot) else OptionChainSnapshot.from_dict(data)
+        features = Features(self, snapshot)
+        for name in self.plan():
+            features[name]
+        self.features = features
+        for strategy in self._strategies:
+            on_features = getattr(strategy, "on_features", None)
+            if on_features is not None:
+                on_features(features)
+            else:
+                strategy.update(snapshot)
@@ -0,0 +1,29 @@
+from typing import Any, List, Optional
+from src.pubsub.interfaces import ISubscriber
+
+
+class MockSubscriber(ISubscriber):
+    """Records every payload it receives. `label` sets the metrics label."""
+
+    def __init__(self, label: Optional[str] = None):
+        self.received_data: List[Any] = []
+        if label:
+            self.metrics_label = label
+
+    def update(self, data: Any):
+        self.received_data.append(data)
+
+
+class FakeClock:
+    """Manually advanced clock; `sleep` records the wait and advances time."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
@@ -0,0 +1,120 @@
+import threading
+import time
+import pytest
+from datetime import datetime
+from src.client.fake import FakeClient
+from src.fetch.adaptive import AdaptiveInterval
+from src.fetch.scheduler import FetchKey, FetchScheduler
+from src.market.trading_calendar import IST, NSE
+from src.pubsub.snapshot import OptionChainSnapshot
+from tests.helpers import FakeClock
+
+KEY = FetchKey("NSE", "NIFTY", "2026-10-27")
+
+
+def at(day, hour, minute=0):
+    return datetime(2026, 10, day, hour, minute, tzinfo=IST).timestamp()
+
+
+def ticks(count, num_strikes=20):
+    client = FakeClient(num_strikes=num_strikes)
+    return [OptionChainSnapshot.from_dict(client.get_option_chain("NSE", "NIFTY", KEY.expiry_date)) for _ in range(count)]
+
+
+def test_interval_follows_chain_activity():
+    policy = AdaptiveInterval(NSE, KEY.expiry_date, min_interval=5, max_interval=80, clock=FakeClock(at(21, 12)))
+    busy = ticks(2)
+    # Until two ticks were compared the chain counts as busy
+    policy.observe(busy[0])
+    assert policy.interval() == pytest.approx(5)
+
+    policy.observe(busy[1])
+    assert policy.activity == 1.0
+    # Unchanged ticks halve the activity each time, backing the interval off
+    intervals = []
+    for _ in range(4):
+        policy.observe(busy[1])
+        intervals.append(policy.interval())
+    assert intervals == sorted(intervals)
+    assert intervals[0] == pytest.approx(80 * (5 / 80) ** 0.5)
+    assert intervals[-1] < 80
+
+    # A new strike grid counts as fully active
+    policy.observe(busy[1].select(busy[1].strike_keys[:10]))
+    assert policy.interval() < intervals[0]
+
+
+def test_expiry_day_caps_interval():
+    clock = FakeClock(at(27, 10))
+    policy = AdaptiveInterval(NSE, KEY.expiry_date, min_interval=5, max_interval=60, expiry_ramp=6 * 3600, clock=clock)
+    policy.activity = 0.0
+    assert policy.interval() == pytest.approx(5 + 55 * 5.5 / 6)
+    clock.now = at(27, 15, 24)
+    assert policy.interval() == pytest.approx(5 + 55 * 0.1 / 6)
+    # The day before, a quiet chain is polled at the maximum interval
+    clock.now = at(26, 14)
+    assert policy.interval() == pytest.approx(60)
+
+
+def test_closed_market_waits_for_open():
+    clock = FakeClock(at(19, 15, 45))
+    policy = AdaptiveInterval(NSE, KEY.expiry_date, clock=clock)
+    # Dussehra on Tuesday: next open is Wednesday 09:15
+    assert policy.until_open() == policy.interval() == 41.5 * 3600
+    clock.now = at(21, 9, 15)
+    assert policy.until_open() == 0
+
+    with pytest.raises(ValueError):
+        AdaptiveInterval(NSE, min_interval=10, max_interval=5)
+
+
+def test_scheduler_applies_policy():
+    client = FakeClient(num_strikes=5)
+    scheduler = FetchScheduler(client, max_workers=1)
+    open_policy = AdaptiveInterval(NSE, min_interval=0.05, max_interval=0.05, clock=FakeClock(at(21, 12)))
+    closed_policy = AdaptiveInterval(NSE, clock=FakeClock(at(18, 12)))
+    scheduler.add(KEY, policy=open_policy)
+    scheduler.add(KEY._replace(underlying="BANKNIFTY"), policy=closed_policy)
+
+    runner = threading.Thread(target=scheduler.run)
+    runner.start()
+    time.sleep(0.4)
+    scheduler.close()
+    runner.join(timeout=2)
+
+    jobs = {job.key.underlying: job for job in scheduler.jobs()}
+    assert jobs["NIFTY"].fetches >= 4
+    assert jobs["NIFTY"].interval == pytest.approx(0.05)
+    # Sunday: the closed series is never fetched
+    assert jobs["BANKNIFTY"].fetches == 0
+    assert jobs["BANKNIFTY"].next_due - time.monotonic() > 20 * 3600
+
+
+def test_expired_series_is_retired_and_rolled():
+    clock = FakeClock(at(27, 15, 29))
+    policy = AdaptiveInterval(NSE, KEY.expiry_date, clock=clock)
+    assert not policy.expired()
+    clock.now = at(27, 15, 30)
+    assert policy.expired()
+
+    rolled = []
+    scheduler = FetchScheduler(FakeClient(num_strikes=5), max_workers=1)
+    next_key = KEY._replace(expiry_date="2026-11-03")
+
+    def roll(key):
+        rolled.append(key)
+        scheduler.add(next_key, policy=AdaptiveInterval(NSE, next_key.expiry_date, min_interval=0.05, max_interval=0.05, clock=clock))
+
+    scheduler.on_expire = roll
+    scheduler.add(KEY, policy=policy)
+    runner = threading.Thread(target=scheduler.run)
+    clock.now = at(28, 12)
+    runner.start()
+    time.sleep(0.3)
+    scheduler.close()
+    runner.join(timeout=2)
+
+    assert rolled == [KEY]
+    jobs = {job.key: job for job in scheduler.jobs()}
+    assert KEY not in jobs
+    assert jobs[next_key].fetches >= 2
@@ -0,0 +1,192 @@
+import asyncio
+import time
+import pytest
+from aiohttp import web
+from src.client.async_groww import AsyncGrowwClient, GrowwAPIError
+from src.client.auth import TokenManager
+from src.client.factory import ClientFactory
+from src.client.fake import AsyncFakeClient, generate_chain
+from src.client.interfaces import AsyncTradingClient
+
+
+class GrowwStub:
+    """Local aiohttp server answering like the Groww option chain endpoint."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = []
+        self.peers = set()
+        self.runner = None
+        self.url = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append(request)
+        self.peers.add(request.transport.get_extra_info("peername"))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if request.headers.get("Authorization") != "Bearer stub-token":
+            return web.json_response(
+                {"status": "FAILURE", "error": {"code": "GA005", "message": "Invalid token"}}, status=401
+            )
+        underlying = request.match_info["underlying"]
+        if underlying == "UNKNOWN":
+            return web.json_response({"status": "FAILURE", "error": {"code": "GA003", "message": "Unknown underlying"}})
+        payload = generate_chain(underlying, num_strikes=10)
+        payload["expiry_date"] = request.query["expiry_date"]
+        payload["exchange"] = request.match_info["exchange"]
+        return web.json_response({"status": "SUCCESS", "payload": payload})
+
+    async def __aenter__(self) -> "GrowwStub":
+        app = web.Application()
+        app.router.add_get("/v1/option-chain/exchange/{exchange}/underlying/{underlying}", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/v1"
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.runner.cleanup()
+
+
+def test_fetches_option_chain_from_stub():
+    async def scenario():
+        async with GrowwStub() as stub:
+            async with AsyncGrowwClient(access_token="stub-token", base_url=stub.url) as client:
+                return await client.get_option_chain("nse", "NIFTY", "2026-10-20"), stub.requests[0]
+
+    chain, request = asyncio.run(scenario())
+
+    assert chain["expiry_date"] == "2026-10-20"
+    assert chain["exchange"] == "NSE"
+    assert len(chain["strikes"]) == 10
+    assert request.headers["X-API-VERSION"] == "1.0"
+
+
+def test_concurrent_fetches_share_keep_alive_pool():
+    async def scenario():
+        async with GrowwStub(delay=0.2) as stub:
+            async with AsyncGrowwClient(access_token="stub-token", base_url=stub.url, max_connections=4) as client:
+                requests = [("NSE", "NIFTY", f"2026-10-{20 + i}") for i in range(4)]
+                started = time.perf_counter()
+                chains = await client.get_option_chains(requests)
+                elapsed = time.perf_counter() - started
+                # A second round reuses the pooled connections
+                await client.get_option_chains(requests)
+                return chains, elapsed, stub.peers
+
+    chains, elapsed, peers = asyncio.run(scenario())
+
+    assert [c["expiry_date"] for c in chains] == [f"2026-10-{20 + i}" for i in range(4)]
+    assert elapsed < 0.6
+    assert len(peers) <= 4
+
+
+def test_api_errors_and_timeouts():
+    async def scenario():
+        async with GrowwStub() as stub:
+            async with AsyncGrowwClient(access_token="stub-token", base_url=stub.url) as client:
+                results = await client.get_option_chains([("NSE", "UNKNOWN", "2026-10-20"), ("NSE", "NIFTY", "2026-10-20")])
+            async with AsyncGrowwClient(access_token="expired", base_url=stub.url) as client:
+                with pytest.raises(GrowwAPIError) as unauthorized:
+                    await client.get_option_chain("NSE", "NIFTY", "2026-10-20")
+            stub.delay = 0.5
+            async with AsyncGrowwClient(access_token="stub-token", base_url=stub.url, timeout=0.1) as client:
+                with pytest.raises(asyncio.TimeoutError):
+                    await client.get_option_chain("NSE", "NIFTY", "2026-10-20")
+            return results, unauthorized.value
+
+    results, unauthorized = asyncio.run(scenario())
+
+    assert isinstance(results[0], GrowwAPIError)
+    assert results[0].code == "GA003"
+    assert len(results[1]["strikes"]) == 10
+    assert unauthorized.status == 401
+    assert unauthorized.code == "GA005"
+
+
+def test_logs_in_with_api_key(monkeypatch):
+    logins = []
+
+    class MockGrowwAPI:
+        @classmethod
+        def get_access_token(cls, api_key, totp):
+            logins.append((api_key, totp))
+            return "stub-token"
+
+    class MockTOTP:
+        def __init__(self, secret): pass
+        def now(self): return "123456"
+
+    class MockPyOTP:
+        TOTP = MockTOTP
+
+    monkeypatch.setattr("src.client.groww.GrowwAPI", MockGrowwAPI)
+    monkeypatch.setattr("src.client.groww.pyotp", MockPyOTP)
+    monkeypatch.setattr(TokenManager, "_shared", {})
+
+    async def scenario():
+        async with GrowwStub() as stub:
+            client = ClientFactory.get_async_client("groww", api_key="key", totp_secret="secret", base_url=stub.url)
+            async with client:
+                await client.get_option_chains([("NSE", "NIFTY", "2026-10-20")] * 3)
+
+    asyncio.run(scenario())
+    assert logins == [("key", "123456")]
+
+
+def test_rejected_token_is_renewed_once(monkeypatch):
+    tokens = iter(["revoked", "stub-token"])
+    logins = []
+
+    class MockGrowwAPI:
+        @classmethod
+        def get_access_token(cls, api_key, totp):
+            logins.append(api_key)
+            return next(tokens)
+
+    class MockTOTP:
+        def __init__(self, secret): pass
+        def now(self): return "123456"
+
+    class MockPyOTP:
+        TOTP = MockTOTP
+
+    monkeypatch.setattr("src.client.groww.GrowwAPI", MockGrowwAPI)
+    monkeypatch.setattr("src.client.groww.pyotp", MockPyOTP)
+    monkeypatch.setattr(TokenManager, "_shared", {})
+
+    async def scenario():
+        async with GrowwStub() as stub:
+            async with AsyncGrowwClient(api_key="key", totp_secret="secret", base_url=stub.url) as client:
+                chain = await client.get_option_chain("NSE", "NIFTY", "2026-10-20")
+            return chain, [r.headers["Authorization"] for r in stub.requests]
+
+    chain, auth_headers = asyncio.run(scenario())
+    assert len(chain["strikes"]) == 10
+    assert auth_headers == ["Bearer revoked", "Bearer stub-token"]
+    assert logins == ["key", "key"]
+
+
+def test_requires_credentials():
+    with pytest.raises(ValueError):
+        AsyncGrowwClient(api_key="key")
+
+
+def test_factory_returns_async_fake_client():
+    client = ClientFactory.get_async_client("fake", num_strikes=5, latency=0.1)
+    assert isinstance(client, AsyncFakeClient)
+    assert isinstance(client, AsyncTradingClient)
+
+    async def scenario():
+        started = time.perf_counter()
+        chains = await client.get_option_chains([("NSE", "NIFTY", "2026-10-20"), ("BSE", "SENSEX", "2026-10-22")])
+        return chains, time.perf_counter() - started
+
+    chains, elapsed = asyncio.run(scenario())
+    assert [len(c["strikes"]) for c in chains] == [5, 5]
+    assert elapsed < 0.2
+    with pytest.raises(ValueError):
+        ClientFactory.get_async_client("zerodha")
@@ -0,0 +1,209 @@
+import asyncio
+import threading
+import pytest
+from typing import Any, Dict
+from src.pubsub.async_publisher import AsyncOptionChainData, OverflowPolicy
+from src.pubsub.interfaces import ISubscriber
+
+
+class SyncSubscriber(ISubscriber):
+    def __init__(self):
+        self.received_data = []
+        self.threads = set()
+
+    def update(self, data: Dict[str, Any]):
+        self.threads.add(threading.get_ident())
+        self.received_data.append(data)
+
+
+class GatedAsyncSubscriber(ISubscriber):
+    def __init__(self):
+        self.received_data = []
+        self.gate = asyncio.Event()
+
+    async def update(self, data: Dict[str, Any]):
+        await self.gate.wait()
+        self.received_data.append(data)
+
+
+def make_tick(ltp: float) -> Dict[str, Any]:
+    return {
+        "underlying_ltp": ltp,
+        "strikes": {
+            "23400": {"CE": {"ltp": 2200}},
+            "23450": {"CE": {"ltp": 2082}}
+        }
+    }
+
+
+def test_async_and_sync_subscribers_are_routed_like_option_chain_data():
+    async def scenario():
+        publisher = AsyncOptionChainData()
+        global_sub = SyncSubscriber()
+        strike_sub = GatedAsyncSubscriber()
+        strike_sub.gate.set()
+        publisher.add_subscriber(global_sub)
+        publisher.add_subscriber(strike_sub, "23450")
+        publisher.start()
+
+        await publisher.publish(make_tick(25641.7))
+        await publisher.join()
+        stats = publisher.stats()
+        await publisher.close()
+        return global_sub, strike_sub, stats
+
+    global_sub, strike_sub, stats = asyncio.run(scenario())
+
+    assert global_sub.received_data == [make_tick(25641.7)]
+    # Sync subscribers run off the event loop thread
+    assert threading.get_ident() not in global_sub.threads
+    assert strike_sub.received_data == [{"underlying_ltp": 25641.7, "strikes": {"23450": {"CE": {"ltp": 2082}}}}]
+    assert stats[global_sub]["delivered"] == 1
+    assert stats[strike_sub]["dropped"] == 0
+
+
+def test_slow_subscriber_drops_oldest_without_delaying_others():
+    async def scenario():
+        publisher = AsyncOptionChainData(maxsize=2, policy="drop_oldest")
+        fast = SyncSubscriber()
+        slow = GatedAsyncSubscriber()
+        publisher.add_subscriber(fast, maxsize=10)
+        publisher.add_subscriber(slow)
+        publisher.start()
+
+        for ltp in range(5):
+            await publisher.publish(make_tick(ltp))
+        assert publisher.stats()[slow]["lag"] == 2
+
+        slow.gate.set()
+        await publisher.join()
+        stats = publisher.stats()
+        await publisher.close()
+        return fast, slow, stats
+
+    fast, slow, stats = asyncio.run(scenario())
+
+    assert [d["underlying_ltp"] for d in fast.received_data] == [0, 1, 2, 3, 4]
+    assert [d["underlying_ltp"] for d in slow.received_data] == [3, 4]
+    assert stats[slow]["dropped"] == 3
+    assert stats[slow]["max_lag"] == 2
+    assert stats[slow]["latency_max"] >= stats[slow]["latency_last"] > 0
+
+
+def test_conflate_keeps_latest_payload_per_strike():
+    async def scenario():
+        publisher = AsyncOptionChainData(policy=OverflowPolicy.CONFLATE)
+        sub = GatedAsyncSubscriber()
+        publisher.add_subscriber(sub, strikes=["23400", "23450"])
+        publisher.start()
+
+        for ltp in (1, 2, 3):
+            await publisher.publish(make_tick(ltp))
+        sub.gate.set()
+        await publisher.join()
+        stats = publisher.stats()
+        await publisher.close()
+        return sub, stats
+
+    sub, stats = asyncio.run(scenario())
+
+    received = [(list(d["strikes"])[0], d["underlying_ltp"]) for d in sub.received_data]
+    assert received == [("23400", 3), ("23450", 3)]
+    assert stats[sub]["dropped"] == 4
+
+
+def test_block_policy_applies_backpressure():
+    async def scenario():
+        publisher = AsyncOptionChainData(maxsize=1, policy=OverflowPolicy.BLOCK)
+        sub = GatedAsyncSubscriber()
+        publisher.add_subscriber(sub)
+        publisher.start()
+
+        await publisher.publish(make_tick(1))
+        await publisher.publish(make_tick(2))
+        pending = asyncio.ensure_future(publisher.publish(make_tick(3)))
+        await asyncio.sleep(0.01)
+        # Queue is full and the subscriber is stuck, so the publisher must wait
+        assert not pending.done()
+
+        sub.gate.set()
+        await pending
+        await publisher.join()
+        stats = publisher.stats()
+        await publisher.close()
+        return sub, stats
+
+    sub, stats = asyncio.run(scenario())
+
+    assert [d["underlying_ltp"] for d in sub.received_data] == [1, 2, 3]
+    assert stats[sub]["dropped"] == 0
+
+
+def test_block_policy_keeps_order_under_backpressure():
+    async def scenario():
+        publisher = AsyncOptionChainData(maxsize=1, policy=OverflowPolicy.BLOCK)
+        sub = GatedAsyncSubscriber()
+        publisher.add_subscriber(sub)
+        publisher.start()
+
+        for ltp in range(1, 31):
+            publisher.notify(make_tick(ltp))
+            if ltp == 10:
+                sub.gate.set()
+            await asyncio.sleep(0)
+        await publisher.join()
+        stats = publisher.stats()
+        await publisher.close()
+        return sub, stats
+
+    sub, stats = asyncio.run(scenario())
+
+    assert [d["underlying_ltp"] for d in sub.received_data] == list(range(1, 31))
+    assert stats[sub]["dropped"] == 0
+
+
+def test_invalid_queue_size():
+    with pytest.raises(ValueError):
+        AsyncOptionChainData(maxsize=0)
+
+
+def test_removed_subscriber_releases_blocked_putters():
+    async def scenario():
+        publisher = AsyncOptionChainData(maxsize=1, policy=OverflowPolicy.BLOCK)
+        sub = GatedAsyncSubscriber()
+        publisher.add_subscriber(sub)
+        publisher.start()
+
+        for ltp in (1, 2, 3):
+            publisher.notify(make_tick(ltp))
+        await asyncio.sleep(0.01)
+        stats = publisher.stats()[sub]
+        pending = asyncio.ensure_future(publisher.publish(make_tick(4)))
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+
+        publisher.remove_subscriber(sub)
+        await asyncio.wait_for(pending, 1)
+        # The overflow feeder started by notify() finished too
+        await asyncio.sleep(0.01)
+        leftover = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        await publisher.close()
+        return stats, leftover
+
+    stats, leftover = asyncio.run(scenario())
+    assert stats["enqueued"] == 2
+    assert leftover == []
+
+
+def test_misuse_outside_the_loop_fails_fast():
+    publisher = AsyncOptionChainData()
+    publisher.add_subscriber(SyncSubscriber())
+    with pytest.raises(RuntimeError, match="AsyncOptionChainData.notify"):
+        publisher.notify(make_tick(1))
+
+    async def queue_without_starting():
+        publisher.notify(make_tick(1))
+        # Nothing will drain the queue, so join() returns instead of hanging
+        await asyncio.wait_for(publisher.join(), 1)
+
+    asyncio.run(queue_without_starting())
@@ -0,0 +1,234 @@
+import json
+import os
+import threading
+import time
+import pytest
+from datetime import datetime
+from src.client.auth import IST, TokenManager, next_token_expiry
+from src.client.groww import GrowwAPIAuthenticationException, GrowwClient
+from tests.helpers import FakeClock
+
+
+class CountingLogin:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return f"token-{self.calls}"
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_tokens():
+    TokenManager.reset_shared()
+    yield
+    TokenManager.reset_shared()
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_next_token_expiry_is_next_6am_ist():
+    before = datetime(2026, 10, 19, 5, 59, tzinfo=IST).timestamp()
+    after = datetime(2026, 10, 19, 6, 0, tzinfo=IST).timestamp()
+    assert next_token_expiry(before) == after
+    assert datetime.fromtimestamp(next_token_expiry(after), IST) == datetime(2026, 10, 20, 6, 0, tzinfo=IST)
+
+
+def test_one_login_shared_across_threads():
+    login = CountingLogin(delay=0.05)
+    manager = TokenManager.shared("key", login)
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(TokenManager.shared("key", None).get_token())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert tokens == ["token-1"] * 8
+    assert login.calls == 1
+    assert manager.logins == 1
+
+
+def test_expired_token_logs_in_again_and_early_refresh_runs_in_background():
+    clock = FakeClock()
+    login = CountingLogin()
+    manager = TokenManager("key", login, refresh_margin=60, expiry=lambda issued: issued + 600, clock=clock)
+
+    assert manager.get_token() == "token-1"
+    clock.now += 500
+    assert manager.get_token() == "token-1"
+    assert login.calls == 1
+
+    # Inside the refresh margin: the current token is served while a new one is fetched
+    clock.now += 50
+    assert manager.get_token() == "token-1"
+    wait_for(lambda: manager.token == "token-2")
+    assert manager.expires_at == clock.now + 600
+
+    clock.now += 601
+    assert manager.get_token() == "token-3"
+
+
+def test_failed_background_refresh_keeps_current_token():
+    clock = FakeClock()
+    calls = []
+
+    def login():
+        calls.append(1)
+        if len(calls) > 1:
+            raise ConnectionError("login throttled")
+        return "token-1"
+
+    manager = TokenManager("key", login, refresh_margin=60, expiry=lambda issued: issued + 600, clock=clock)
+    manager.get_token()
+    clock.now += 580
+    assert manager.get_token() == "token-1"
+    wait_for(lambda: len(calls) == 2 and not manager._refresh.is_alive())
+    assert manager.get_token() == "token-1"
+
+
+def test_failed_refresh_backs_off_before_retrying():
+    clock = FakeClock()
+    calls = []
+
+    def login():
+        calls.append(1)
+        if len(calls) > 1:
+            raise ConnectionError("login throttled")
+        return "token-1"
+
+    manager = TokenManager(
+        "key", login, refresh_margin=300, expiry=lambda issued: issued + 600, clock=clock, retry_delay=30
+    )
+    manager.get_token()
+    clock.now += 400
+    manager.get_token()
+    wait_for(lambda: len(calls) == 2 and not manager._refresh.is_alive())
+
+    # Every poll inside the back-off reuses the current token without logging in
+    for _ in range(20):
+        assert manager.get_token() == "token-1"
+        clock.now += 1
+    assert len(calls) == 2
+
+    clock.now += 10
+    manager.get_token()
+    wait_for(lambda: len(calls) == 3)
+
+
+def test_disk_cache_survives_restart(tmp_path):
+    path = tmp_path / "tokens.json"
+    clock = FakeClock()
+    first_login = CountingLogin()
+    TokenManager("secret-api-key", first_login, cache_path=path, expiry=lambda issued: issued + 3600, clock=clock).get_token()
+
+    # A new process: fresh manager, same cache file
+    second_login = CountingLogin()
+    restarted = TokenManager("secret-api-key", second_login, cache_path=path, clock=clock)
+    assert restarted.get_token() == "token-1"
+    assert second_login.calls == 0
+
+    assert oct(os.stat(path).st_mode & 0o777) == "0o600"
+    assert "secret-api-key" not in path.read_text()
+    assert list(json.loads(path.read_text()).values())[0]["token"] == "token-1"
+
+    # Another key gets its own entry
+    TokenManager("other-key", CountingLogin(), cache_path=path, clock=clock).get_token()
+    assert len(json.loads(path.read_text())) == 2
+
+
+def test_expired_disk_cache_is_ignored(tmp_path):
+    path = tmp_path / "tokens.json"
+    clock = FakeClock()
+    TokenManager("key", CountingLogin(), cache_path=path, expiry=lambda issued: issued + 3600, clock=clock).get_token()
+    clock.now += 3600
+    login = CountingLogin()
+    assert TokenManager("key", login, cache_path=path, clock=clock).get_token() == "token-1"
+    assert login.calls == 1
+
+
+def test_groww_clients_share_one_login(monkeypatch):
+    logins = []
+
+    class MockGrowwAPI:
+        EXCHANGE_NSE = "NSE"
+        EXCHANGE_BSE = "BSE"
+
+        @classmethod
+        def get_access_token(cls, api_key, totp):
+            logins.append(api_key)
+            return f"token-{len(logins)}"
+
+        def __init__(self, token):
+            self.token = token
+
+        def get_option_chain(self, exchange, underlying, expiry_date):
+            return {"token": self.token}
+
+    class MockTOTP:
+        def __init__(self, secret): pass
+        def now(self): return "123456"
+
+    class MockPyOTP:
+        TOTP = MockTOTP
+
+    monkeypatch.setattr("src.client.groww.GrowwAPI", MockGrowwAPI)
+    monkeypatch.setattr("src.client.groww.pyotp", MockPyOTP)
+
+    first = GrowwClient(api_key="key", totp_secret="secret")
+    second = GrowwClient(api_key="key", totp_secret="secret")
+    assert logins == ["key"]
+    assert second.get_option_chain("NSE", "NIFTY", "2026-10-20") == {"token": "token-1"}
+
+    # After a refresh, existing clients pick up the new token
+    first.tokens.invalidate()
+    assert first.get_option_chain("NSE", "NIFTY", "2026-10-20") == {"token": "token-2"}
+    assert second.get_option_chain("NSE", "NIFTY", "2026-10-20") == {"token": "token-2"}
+
+
+def test_rejected_token_is_renewed_and_request_retried_once(monkeypatch):
+    logins = []
+
+    class RejectingGrowwAPI:
+        EXCHANGE_NSE = "NSE"
+        EXCHANGE_BSE = "BSE"
+
+        @classmethod
+        def get_access_token(cls, api_key, totp):
+            logins.append(api_key)
+            return f"token-{len(logins)}"
+
+        def __init__(self, token):
+            self.token = token
+
+        def get_option_chain(self, exchange, underlying, expiry_date):
+            # The first token was revoked server side before its 6 AM expiry
+            if self.token == "token-1":
+                raise GrowwAPIAuthenticationException()
+            return {"token": self.token}
+
+    class MockPyOTP:
+        class TOTP:
+            def __init__(self, secret): pass
+            def now(self): return "123456"
+
+    monkeypatch.setattr("src.client.groww.GrowwAPI", RejectingGrowwAPI)
+    monkeypatch.setattr("src.client.groww.pyotp", MockPyOTP)
+
+    first = GrowwClient(api_key="key", totp_secret="secret")
+    stale = GrowwClient(api_key="key", totp_secret="secret")
+    assert first.get_option_chain("NSE", "NIFTY", "2026-10-20") == {"token": "token-2"}
+    assert logins == ["key", "key"]
+
+    # A client still holding the rejected token does not discard the renewed one
+    stale.tokens.invalidate("token-1")
+    assert stale.get_option_chain("NSE", "NIFTY", "2026-10-20") == {"token": "token-2"}
+    assert logins == ["key", "key"]
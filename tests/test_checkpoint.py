@@ -0,0 +1,136 @@
+import numpy as np
+import os
+import pickle
+from src.client.fake import FakeClient
+from src.pubsub.publisher import DELTA, FULL, OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.storage.checkpoint import Checkpointer
+from src.strategies.max_oi import MaxOIStrategy
+from src.strategies.oi_tracker import RollingOITracker
+from tests.helpers import FakeClock, MockSubscriber
+
+
+def ticks(count, num_strikes=20):
+    client = FakeClient(num_strikes=num_strikes)
+    return [OptionChainSnapshot.from_dict(client.get_option_chain("NSE", "NIFTY", "2026-10-20")) for _ in range(count)]
+
+
+def live_setup(path, clock, diff=False):
+    publisher = OptionChainData(diff=diff)
+    strategies = {"max_oi": MaxOIStrategy(window=3), "tracker": RollingOITracker(history=4), "watcher": MockSubscriber()}
+    publisher.add_subscriber(strategies["max_oi"])
+    publisher.add_subscriber(strategies["tracker"])
+    checkpointer = Checkpointer(path, publisher, strategies, interval=10, max_age=60, clock=clock)
+    return publisher, strategies, checkpointer
+
+
+def publish(publisher, checkpointer, snapshot):
+    """Deliver a tick, then checkpoint it, as the scheduler's on_update does."""
+    publisher.notify(snapshot)
+    checkpointer.update(snapshot)
+
+
+def test_saves_at_most_every_interval(tmp_path):
+    clock = FakeClock()
+    publisher, _, checkpointer = live_setup(tmp_path / "nifty.ckpt", clock)
+    for snapshot in ticks(5):
+        publish(publisher, checkpointer, snapshot)
+        clock.now += 3
+    # Saved on the first tick and again once 10s had passed
+    assert checkpointer.saves == 2
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_restores_state_and_subscriptions(tmp_path):
+    path = tmp_path / "nifty.ckpt"
+    clock = FakeClock()
+    chain = ticks(8)
+    publisher, strategies, checkpointer = live_setup(path, clock)
+    publisher.add_subscriber(strategies["watcher"], ["23400", "23450"])
+    for snapshot in chain[:6]:
+        publish(publisher, checkpointer, snapshot)
+    checkpointer.close()
+
+    clock.now += 30
+    restored_publisher, restored, restored_checkpointer = live_setup(path, clock)
+    assert restored_checkpointer.restore()
+
+    assert restored["max_oi"].get_max_oi_details() == strategies["max_oi"].get_max_oi_details()
+    assert restored["tracker"].pcr == strategies["tracker"].pcr
+    assert restored["tracker"].top_oi_change(3) == strategies["tracker"].top_oi_change(3)
+    assert restored_publisher.subscriptions()[restored["watcher"]] == (["23400", "23450"], FULL)
+    assert restored_checkpointer.snapshot.strike_keys == chain[5].strike_keys
+
+    # The restored tracker continues exactly where the original left off
+    for snapshot in chain[6:]:
+        publisher.notify(snapshot)
+        restored_publisher.notify(snapshot)
+    np.testing.assert_array_equal(restored["tracker"].oi_change(), strategies["tracker"].oi_change())
+    assert restored["tracker"].max_pain() == strategies["tracker"].max_pain()
+
+
+def test_primes_diff_publisher(tmp_path):
+    path = tmp_path / "nifty.ckpt"
+    clock = FakeClock()
+    snapshot = ticks(1)[0]
+    publisher, strategies, checkpointer = live_setup(path, clock, diff=True)
+    publisher.add_subscriber(strategies["watcher"], mode=DELTA)
+    publish(publisher, checkpointer, snapshot)
+
+    restored_publisher, restored, restored_checkpointer = live_setup(path, clock, diff=True)
+    assert restored_checkpointer.restore()
+    assert restored_publisher.previous_snapshot.strike_keys == snapshot.strike_keys
+
+    # An unchanged tick after the restart is not a full re-send
+    restored_publisher.notify(snapshot)
+    assert restored["watcher"].received_data == []
+    assert restored_publisher.subscriptions()[restored["watcher"]] == (None, DELTA)
+
+
+def test_ignores_missing_stale_and_foreign_checkpoints(tmp_path):
+    path = tmp_path / "nifty.ckpt"
+    clock = FakeClock()
+    publisher, strategies, checkpointer = live_setup(path, clock)
+    assert not checkpointer.restore()
+
+    publish(publisher, checkpointer, ticks(1)[0])
+    clock.now += 61
+    _, restored, stale = live_setup(path, clock)
+    assert not stale.restore()
+    assert restored["max_oi"].max_oi_strike is None
+
+    with open(path, "wb") as f:
+        pickle.dump({"version": -1}, f)
+    assert not stale.restore()
+    path.write_bytes(b"not a checkpoint")
+    assert not stale.restore()
+
+
+def test_saved_state_matches_saved_snapshot(tmp_path):
+    clock = FakeClock()
+    publisher, strategies, checkpointer = live_setup(tmp_path / "nifty.ckpt", clock)
+    checkpointer.interval = 0
+    for snapshot in ticks(3):
+        publish(publisher, checkpointer, snapshot)
+
+    state = checkpointer.load()
+    replayed = MaxOIStrategy(window=3)
+    replayed.update(checkpointer.snapshot)
+    assert state["strategies"]["max_oi"] == replayed.get_state()
+
+
+def test_write_errors_are_logged_not_raised(tmp_path, caplog):
+    clock = FakeClock()
+    publisher, _, checkpointer = live_setup(tmp_path / "missing" / "nifty.ckpt", clock)
+    chain = ticks(3)
+    publish(publisher, checkpointer, chain[0])
+    assert checkpointer.failures == 1 and checkpointer.saves == 0
+    assert "Could not write checkpoint" in caplog.text
+
+    # Retried after the interval, not on every tick
+    publish(publisher, checkpointer, chain[1])
+    assert checkpointer.failures == 1
+    (tmp_path / "missing").mkdir()
+    clock.now += 10
+    publish(publisher, checkpointer, chain[2])
+    assert checkpointer.saves == 1
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+import src.pubsub.codec as codec_module
+from src.client.fake import generate_chain
+from src.pubsub.codec import CodecError, SnapshotCodec, available_codecs, get_codec, register_codec
+from src.pubsub.snapshot import OptionChainSnapshot
+
+
+@pytest.fixture
+def snapshot() -> OptionChainSnapshot:
+    return OptionChainSnapshot.from_dict(
+        generate_chain("NIFTY", num_strikes=200, tick=3),
+        timestamp=1760000000.25,
+        underlying="NIFTY",
+        expiry_date="2026-10-20",
+    )
+
+
+@pytest.mark.parametrize("name", ["columnar", "json", "pickle", "protobuf"])
+def test_codecs_round_trip(name, snapshot):
+    codec = get_codec(name)
+    decoded = codec.decode(codec.encode(snapshot))
+
+    assert decoded.underlying_ltp == snapshot.underlying_ltp
+    assert decoded.timestamp == snapshot.timestamp
+    assert (decoded.underlying, decoded.expiry_date) == ("NIFTY", "2026-10-20")
+    assert decoded.strike_keys == snapshot.strike_keys
+    np.testing.assert_array_equal(decoded.values, snapshot.values)
+
+
+@pytest.mark.parametrize("name", ["columnar", "json", "pickle", "protobuf"])
+def test_codecs_handle_missing_ltp_and_empty_chain(name):
+    codec = get_codec(name)
+    decoded = codec.decode(codec.encode(OptionChainSnapshot.from_dict({"underlying_ltp": None, "strikes": {}})))
+    assert decoded.underlying_ltp is None
+    assert len(decoded) == 0
+
+
+def test_columnar_is_smallest_binary_encoding(snapshot):
+    sizes = {name: len(get_codec(name).encode(snapshot)) for name in available_codecs()}
+    assert sizes["columnar"] < sizes["json"]
+
+
+def test_protobuf_rejects_other_layouts(snapshot):
+    codec = get_codec("protobuf")
+    message = codec.message_class().FromString(codec.encode(snapshot))
+    message.version = 99
+    with pytest.raises(CodecError):
+        codec.decode(message.SerializeToString())
+
+
+def test_registry(monkeypatch):
+    monkeypatch.setattr(codec_module, "_CODECS", dict(codec_module._CODECS))
+
+    class CustomCodec(SnapshotCodec):
+        name = "Custom"
+
+        def encode(self, snapshot):
+            return b""
+
+        def decode(self, buffer):
+            return OptionChainSnapshot.from_dict({})
+
+    register_codec(CustomCodec())
+    assert isinstance(get_codec("custom"), CustomCodec)
+    with pytest.raises(ValueError):
+        get_codec("msgpack")
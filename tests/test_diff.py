@@ -0,0 +1,115 @@
+import copy
+import math
+import numpy as np
+import pytest
+from typing import Any, Dict
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import ChainDelta, OptionChainSnapshot, diff_snapshots
+from tests.helpers import MockSubscriber
+
+
+@pytest.fixture
+def market_data() -> Dict[str, Any]:
+    return {
+        "underlying_ltp": 25641.7,
+        "strikes": {
+            "23400": {"CE": {"ltp": 2200, "open_interest": 10}},
+            "23450": {"CE": {"ltp": 2082, "open_interest": 20}},
+            "23500": {"CE": {"ltp": 2000, "open_interest": 30}}
+        }
+    }
+
+
+def test_diff_snapshots_reports_changed_fields(market_data):
+    previous = OptionChainSnapshot.from_dict(market_data)
+    market_data = copy.deepcopy(market_data)
+    market_data["strikes"]["23450"]["CE"]["open_interest"] = 25
+    market_data["strikes"]["23550"] = {"CE": {"ltp": 1900}}
+    del market_data["strikes"]["23400"]
+    current = OptionChainSnapshot.from_dict(market_data)
+
+    delta = diff_snapshots(previous, current)
+
+    assert delta.changed_strikes == ["23450", "23550"]
+    assert delta.removed_strikes == ["23400"]
+    assert delta.field_delta("CE", "open_interest")[0] == 5
+    assert delta.field_delta("CE", "ltp")[0] == 0
+    # New strikes have no baseline
+    assert math.isnan(delta.field_delta("CE", "ltp")[1])
+    assert delta.ltp_delta == 0
+    assert not delta.is_empty
+
+    unchanged = diff_snapshots(current, OptionChainSnapshot.from_dict(market_data))
+    assert unchanged.is_empty
+    assert len(unchanged) == 0
+
+
+def test_first_tick_marks_every_strike_changed(market_data):
+    delta = diff_snapshots(None, OptionChainSnapshot.from_dict(market_data))
+    assert delta.changed_strikes == ["23400", "23450", "23500"]
+    assert np.isnan(delta.deltas).all()
+
+
+def test_diff_mode_publisher(market_data):
+    publisher = OptionChainData(diff=True)
+    full_sub = MockSubscriber()
+    delta_sub = MockSubscriber()
+    strike_sub = MockSubscriber()
+    strike_delta_sub = MockSubscriber()
+    publisher.add_subscriber(full_sub)
+    publisher.add_subscriber(delta_sub, mode="delta")
+    publisher.add_subscriber(strike_sub, ["23400", "23450"])
+    publisher.add_subscriber(strike_delta_sub, "23450", mode="delta")
+
+    publisher.notify(market_data)
+    assert len(full_sub.received_data) == 1
+    assert len(delta_sub.received_data) == 1
+    assert len(strike_sub.received_data) == 2
+
+    # Only 23450 moves on the second tick
+    second = copy.deepcopy(market_data)
+    second["strikes"]["23450"]["CE"]["ltp"] = 2090
+    publisher.notify(second)
+
+    assert full_sub.received_data[-1] == second
+    delta = delta_sub.received_data[-1]
+    assert isinstance(delta, ChainDelta)
+    assert delta.changed_strikes == ["23450"]
+    assert delta.field_delta("CE", "ltp").tolist() == [8]
+
+    assert len(strike_sub.received_data) == 3
+    assert strike_sub.received_data[-1] == {"underlying_ltp": 25641.7, "strikes": {"23450": {"CE": {"ltp": 2090, "open_interest": 20}}}}
+    strike_delta = strike_delta_sub.received_data[-1]
+    assert strike_delta.snapshot.strike_keys == ["23450"]
+    assert strike_delta.changed.tolist() == [0]
+
+    # Nothing moves on the third tick: only full global subscribers hear about it
+    publisher.notify(copy.deepcopy(second))
+    assert len(full_sub.received_data) == 3
+    assert len(delta_sub.received_data) == 2
+    assert len(strike_sub.received_data) == 3
+    assert len(strike_delta_sub.received_data) == 2
+
+
+def test_diff_mode_accepts_an_empty_chain(market_data):
+    publisher = OptionChainData(diff=True)
+    full_sub = MockSubscriber()
+    delta_sub = MockSubscriber()
+    publisher.add_subscriber(full_sub)
+    publisher.add_subscriber(delta_sub, mode="delta")
+
+    empty = OptionChainSnapshot.from_dict({"underlying_ltp": 25641.7, "strikes": {}})
+    publisher.notify(empty)
+    assert full_sub.received_data == [empty]
+    assert delta_sub.received_data == []
+
+    # The next full tick is diffed against the empty chain, so every strike changed
+    publisher.notify(market_data)
+    assert delta_sub.received_data[-1].changed_strikes == ["23400", "23450", "23500"]
+
+
+def test_delta_subscription_requires_diff_mode():
+    with pytest.raises(ValueError):
+        OptionChainData().add_subscriber(MockSubscriber(), mode="delta")
+    with pytest.raises(ValueError):
+        OptionChainData(diff=True).add_subscriber(MockSubscriber(), mode="sometimes")
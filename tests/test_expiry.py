@@ -0,0 +1,26 @@
+from datetime import date, datetime
+from src.market.expiry import exchange_for, next_monthly_expiry, next_weekly_expiry, upcoming_expiries
+
+
+def test_next_weekly_expiry():
+    # 2026-10-18 is a Sunday
+    assert next_weekly_expiry("NIFTY", date(2026, 10, 18)) == date(2026, 10, 20)
+    assert next_weekly_expiry("NIFTY", datetime(2026, 10, 20, 9, 30)) == date(2026, 10, 20)
+    assert next_weekly_expiry("SENSEX", date(2026, 10, 23)) == date(2026, 10, 29)
+
+
+def test_next_monthly_expiry():
+    assert next_monthly_expiry("BANKNIFTY", date(2026, 10, 18)) == date(2026, 10, 27)
+    assert next_monthly_expiry("BANKNIFTY", date(2026, 10, 28)) == date(2026, 11, 24)
+    assert next_monthly_expiry("SENSEX", date(2026, 12, 31)) == date(2026, 12, 31)
+    assert next_monthly_expiry("SENSEX", date(2027, 1, 1)) == date(2027, 1, 28)
+
+
+def test_upcoming_expiries():
+    assert upcoming_expiries("NIFTY", date(2026, 10, 18)) == ["2026-10-20", "2026-10-27"]
+    # Monthly-only index
+    assert upcoming_expiries("FINNIFTY", date(2026, 10, 18)) == ["2026-10-27"]
+    # Weekly and monthly coincide in the last week of the month
+    assert upcoming_expiries("NIFTY", date(2026, 10, 21)) == ["2026-10-27"]
+    assert exchange_for("sensex") == "BSE"
+    assert exchange_for("NIFTY") == "NSE"
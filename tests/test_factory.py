@@ -1,4 +1,8 @@
+import os
+import subprocess
+import sys
 import pytest
+from src.client.auth import TokenManager
 from src.client.factory import ClientFactory
 from src.client.groww import GrowwClient
 from src.client.interfaces import TradingClient
@@ -26,6 +30,7 @@ def mock_dependencies(monkeypatch):
 
     monkeypatch.setattr("src.client.groww.GrowwAPI", MockGrowwAPI)
     monkeypatch.setattr("src.client.groww.pyotp", MockPyOTP)
+    monkeypatch.setattr(TokenManager, "_shared", {})
 
 def test_factory_get_existing_client():
     client = ClientFactory.get_client("groww", api_key="test_key", totp_secret="test_secret")
@@ -41,3 +46,20 @@ def test_factory_register_new_client():
     ClientFactory.register_client("dummy", DummyClient)
     client = ClientFactory.get_client("dummy")
     assert isinstance(client, DummyClient)
+
+def test_factory_register_lazy_reference():
+    ClientFactory.register_client("lazy_dummy", "tests.test_factory:DummyClient")
+    assert isinstance(ClientFactory.get_client("lazy_dummy"), DummyClient)
+    # Resolved once, then cached as the class itself
+    assert ClientFactory._clients["lazy_dummy"] is DummyClient
+
+def test_startup_does_not_import_unused_clients():
+    code = (
+        "import sys, main\n"
+        "from src.client.factory import ClientFactory\n"
+        "ClientFactory.get_throttled_client('fake')\n"
+        "print(sorted(m for m in ('growwapi', 'src.client.groww', 'src.client.async_groww', 'aiohttp') if m in sys.modules))"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
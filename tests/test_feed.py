@@ -0,0 +1,248 @@
+import asyncio
+import pytest
+from typing import List
+from aiohttp import WSMsgType, web
+from src.client.fake import AsyncFakeClient
+from src.feed.adapter import FeedAdapter, FeedTick, WebSocketFeedAdapter, parse_tick
+from src.feed.live_chain import LiveChainBuilder
+from src.feed.pump import StreamingPump
+from src.fetch.scheduler import FetchKey
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+from tests.helpers import MockSubscriber
+
+KEY = FetchKey("NSE", "NIFTY", "2026-10-20")
+
+
+class FakeFeedServer:
+    """Local websocket server that pushes JSON ticks to subscribed clients."""
+
+    def __init__(self):
+        self.sockets: List[web.WebSocketResponse] = []
+        self.subscriptions = []
+        self.subscribed = asyncio.Event()
+        self.runner = None
+        self.url = None
+
+    async def handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.append(ws)
+        async for msg in ws:
+            if msg.type is WSMsgType.TEXT:
+                self.subscriptions.append(msg.json())
+                self.subscribed.set()
+        return ws
+
+    async def push(self, *messages):
+        for ws in list(self.sockets):
+            if not ws.closed:
+                await ws.send_json(list(messages))
+
+    async def drop(self):
+        self.subscribed.clear()
+        for ws in self.sockets:
+            await ws.close()
+        self.sockets.clear()
+
+    async def __aenter__(self) -> "FakeFeedServer":
+        app = web.Application()
+        app.router.add_get("/feed", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", 0).start()
+        self.url = f"http://127.0.0.1:{self.runner.addresses[0][1]}/feed"
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.drop()
+        await self.runner.cleanup()
+
+
+def option_tick(strike, side, **fields):
+    return {"underlying": "NIFTY", "expiry_date": "2026-10-20", "strike": strike, "type": side, **fields}
+
+
+async def wait_until(predicate, timeout=3.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+def test_parse_tick():
+    tick = parse_tick({"underlying": "NIFTY", "strike": 23400, "type": "CE", "ltp": 12, "open_interest": 5, "timestamp": 7})
+    assert tick == FeedTick("NIFTY", None, "23400", "CE", {"ltp": 12.0, "open_interest": 5.0}, 7.0)
+    assert parse_tick({"underlying": "NIFTY", "ltp": 25001.5}).strike is None
+
+
+def test_live_chain_builder_updates_in_place():
+    builder = LiveChainBuilder("NIFTY", "2026-10-20")
+    builder.reset(OptionChainSnapshot.from_dict({
+        "underlying_ltp": 23450.0,
+        "strikes": {"23400": {"CE": {"open_interest": 10}}, "23500": {"PE": {"open_interest": 30}}}
+    }))
+    first = builder.snapshot()
+    assert not builder.dirty
+
+    assert builder.apply(parse_tick(option_tick("23400", "CE", open_interest=15, iv=13.5)))
+    assert builder.apply(parse_tick(option_tick("23450.0", "PE", open_interest=7)))
+    assert builder.apply(parse_tick({"underlying": "NIFTY", "ltp": 23461.0}))
+    assert not builder.apply(parse_tick(option_tick("23400", "FUT", ltp=1)))
+    assert builder.dirty
+
+    snapshot = builder.snapshot()
+    assert snapshot.strike_keys == ["23400", "23450", "23500"]
+    assert snapshot.column("CE", "open_interest")[0] == 15
+    assert snapshot.column("CE", "iv")[0] == 13.5
+    assert snapshot.column("PE", "open_interest").tolist()[1:] == [7, 30]
+    assert snapshot.underlying_ltp == 23461.0
+    # Earlier snapshots are unaffected by later ticks
+    assert first.column("CE", "open_interest")[0] == 10
+
+
+def test_pump_conflates_bursts_of_ticks():
+    async def scenario():
+        async with FakeFeedServer() as server:
+            publisher = OptionChainData()
+            sub = MockSubscriber()
+            publisher.add_subscriber(sub, "23400")
+            pump = StreamingPump(WebSocketFeedAdapter(server.url), KEY, publisher, max_rate=10)
+            task = asyncio.create_task(pump.run())
+            await asyncio.wait_for(server.subscribed.wait(), 3)
+
+            await server.push(*(option_tick("23400", "CE", open_interest=oi) for oi in range(1, 101)))
+            await wait_until(lambda: pump.builder.ticks == 100 and not pump.builder.dirty)
+            pump.stop()
+            await task
+            return server.subscriptions, pump, sub
+
+    subscriptions, pump, sub = asyncio.run(scenario())
+
+    assert subscriptions == [{"action": "subscribe", "underlying": "NIFTY", "expiry_date": "2026-10-20"}]
+    assert 1 <= pump.published <= 3
+    assert pump.conflated == 100 - pump.published
+    assert sub.received_data[-1].column("CE", "open_interest").tolist() == [100]
+
+
+def test_pump_ignores_other_chains():
+    async def scenario():
+        async with FakeFeedServer() as server:
+            pump = StreamingPump(WebSocketFeedAdapter(server.url), KEY, max_rate=50)
+            task = asyncio.create_task(pump.run())
+            await asyncio.wait_for(server.subscribed.wait(), 3)
+            await server.push(
+                {"underlying": "BANKNIFTY", "strike": "56000", "type": "CE", "open_interest": 1},
+                {**option_tick("23400", "CE", open_interest=1), "expiry_date": "2026-10-27"},
+                {"underlying": "NIFTY", "ltp": 25010.0},
+            )
+            await wait_until(lambda: pump.published == 1)
+            pump.stop()
+            await task
+            return pump
+
+    pump = asyncio.run(scenario())
+    assert len(pump.builder) == 0
+    assert pump.builder.underlying_ltp == 25010.0
+
+
+def test_falls_back_to_polling_and_reconnects():
+    updates = []
+
+    async def scenario():
+        async with FakeFeedServer() as server:
+            client = AsyncFakeClient(num_strikes=10)
+            pump = StreamingPump(
+                WebSocketFeedAdapter(server.url), KEY, client=client, max_rate=50,
+                poll_interval=0.05, reconnect_delay=0.3, on_update=lambda key, snap: updates.append(snap)
+            )
+            task = asyncio.create_task(pump.run())
+            await asyncio.wait_for(server.subscribed.wait(), 3)
+            # Seeded from REST before the first tick
+            assert pump.polls == 1 and len(pump.builder) == 10
+            await wait_until(lambda: pump.published >= 1)
+
+            await server.drop()
+            await wait_until(lambda: pump.polls >= 3)
+            assert not pump.streaming
+
+            await asyncio.wait_for(server.subscribed.wait(), 3)
+            await wait_until(lambda: pump.streaming)
+            polls = pump.polls
+            strike = pump.builder.snapshot().strike_keys[0]
+            await server.push(option_tick(strike, "PE", open_interest=123456))
+            await wait_until(lambda: updates[-1].column("PE", "open_interest")[0] == 123456)
+            await asyncio.sleep(0.2)
+            pump.stop()
+            await task
+            return pump, polls
+
+    pump, polls = asyncio.run(scenario())
+    assert pump.reconnects >= 1
+    # Polling stops once the feed is back
+    assert pump.polls <= polls + 1
+
+
+def test_stale_feed_triggers_reconnect():
+    async def scenario():
+        async with FakeFeedServer() as server:
+            pump = StreamingPump(WebSocketFeedAdapter(server.url), KEY, stale_after=0.1, reconnect_delay=0.05)
+            task = asyncio.create_task(pump.run())
+            await wait_until(lambda: pump.reconnects >= 2)
+            pump.stop()
+            await task
+            return server
+
+    server = asyncio.run(scenario())
+    assert len(server.subscriptions) >= 2
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        StreamingPump(WebSocketFeedAdapter("http://127.0.0.1:1/feed"), KEY, max_rate=0)
+
+
+def test_bad_frames_are_skipped():
+    async def scenario():
+        async with FakeFeedServer() as server:
+            pump = StreamingPump(WebSocketFeedAdapter(server.url), KEY, max_rate=50)
+            task = asyncio.create_task(pump.run())
+            await asyncio.wait_for(server.subscribed.wait(), 3)
+            await server.sockets[0].send_str("not json")
+            await server.push({"strike": "23400", "type": "CE", "ltp": 1.0}, option_tick("23400", "CE", ltp=120.5))
+            await wait_until(lambda: len(pump.builder) == 1)
+            streaming, reconnects = pump.streaming, pump.reconnects
+            pump.stop()
+            await task
+            return streaming, reconnects
+
+    assert asyncio.run(scenario()) == (True, 0)
+
+
+def test_unexpected_feed_errors_fall_back_to_polling():
+    class BrokenFeed(FeedAdapter):
+        async def connect(self):
+            pass
+
+        async def subscribe(self, underlying, expiry_date):
+            pass
+
+        async def __aiter__(self):
+            raise RuntimeError("decoder crashed")
+            yield
+
+        async def close(self):
+            pass
+
+    async def scenario():
+        pump = StreamingPump(BrokenFeed(), KEY, client=AsyncFakeClient(num_strikes=5), poll_interval=0.05, reconnect_delay=0.05)
+        task = asyncio.create_task(pump.run())
+        await wait_until(lambda: pump.reconnects >= 2 and pump.polls >= 3)
+        pump.stop()
+        await task
+        return pump
+
+    pump = asyncio.run(scenario())
+    assert not pump.streaming
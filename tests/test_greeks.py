@@ -0,0 +1,118 @@
+import math
+import numpy as np
+from datetime import datetime
+from src.client.fake import FakeClient
+from src.pricing import black_scholes as bs
+from src.pricing.engine import IST, GreeksEngine
+from src.pubsub.codec import get_codec
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.strategies.max_oi import MaxOIStrategy
+
+# Two days before the 2026-10-20 15:30 IST expiry
+NOW = datetime(2026, 10, 18, 15, 30, tzinfo=IST).timestamp()
+
+
+def synthetic_chain(strikes, spot=25000.0, t=2 / 365, rate=0.065):
+    """A chain priced off a known smile, so the engine should recover it."""
+    smile = 0.12 + 0.5 * ((strikes - spot) / spot) ** 2
+    values = np.full((2, 8, len(strikes)), np.nan)
+    values[0, 1] = bs.price(spot, strikes, t, smile, True, rate)
+    values[1, 1] = bs.price(spot, strikes, t, smile, False, rate)
+    values[:, 0] = 1000.0
+    snapshot = OptionChainSnapshot(spot, strikes, values, timestamp=NOW, underlying="NIFTY", expiry_date="2026-10-20")
+    return snapshot, smile
+
+
+def test_prices_and_normal_cdf():
+    # Hull's textbook example: S=42, K=40, r=10%, sigma=20%, six months
+    call, put = bs.price(42.0, 40.0, 0.5, 0.2, np.array([True, False]), 0.1)
+    assert round(float(call), 2) == 4.76
+    assert round(float(put), 2) == 0.81
+    x = np.linspace(-6, 6, 241)
+    expected = np.array([0.5 * math.erfc(-v / math.sqrt(2)) for v in x])
+    np.testing.assert_allclose(bs.norm_cdf(x), expected, rtol=2e-7)
+
+
+def test_implied_volatility_recovers_smile_and_rejects_bad_premiums():
+    strikes = np.linspace(20000, 30000, 201)
+    spot, t = 25000.0, 5 / 365
+    smile = 0.1 + 0.4 * ((strikes - spot) / spot) ** 2
+    is_call = np.array([[True], [False]])
+    premiums = bs.price(spot, strikes, t, smile, is_call, 0.065)
+
+    ivs = bs.implied_volatility(premiums, spot, strikes, t, is_call, 0.065)
+    solved = ~np.isnan(ivs)
+    # Every leg with at least a tick (0.05) of time value solves
+    forward_gap = spot - strikes * np.exp(-0.065 * t)
+    time_value = premiums - np.maximum(np.where(is_call, forward_gap, -forward_gap), 0)
+    assert solved[time_value > 0.05].all()
+    # Solved legs reprice to within price_tol; legs with only a sliver of time value
+    # pin the volatility down loosely, so the IV itself is checked where it is priced
+    repriced = bs.price(spot, strikes, t, ivs, is_call, 0.065)
+    np.testing.assert_allclose(repriced[solved], premiums[solved], atol=1e-6)
+    priced = time_value > 0.05
+    np.testing.assert_allclose(ivs[priced], np.broadcast_to(smile, ivs.shape)[priced], atol=1e-5)
+
+    bad = bs.implied_volatility([-1.0, 0.0, 30000.0, np.nan, 100.0], spot, 25000.0, [t, t, t, t, 0.0], True)
+    assert np.isnan(bad).all()
+
+
+def test_engine_enriches_chain_with_warm_start():
+    strikes = np.arange(20000.0, 30000.0, 50.0)
+    snapshot, smile = synthetic_chain(strikes)
+    engine = GreeksEngine()
+
+    enriched = engine(snapshot)
+    iv = enriched.column("CE", "iv")
+    otm_calls = (strikes >= 25000) & (snapshot.column("CE", "ltp") > 0.05)
+    np.testing.assert_allclose(iv[otm_calls], smile[otm_calls] * 100, atol=1e-3)
+    assert np.all((enriched.column("CE", "delta")[otm_calls] > 0) & (enriched.column("CE", "delta")[otm_calls] < 1))
+    assert np.all(enriched.column("PE", "delta")[~np.isnan(enriched.column("PE", "delta"))] < 0)
+    assert np.all(enriched.column("CE", "theta")[otm_calls] < 0)
+    # The input snapshot is untouched
+    assert np.isnan(snapshot.column("CE", "iv")).all()
+
+    # A grid change maps the previous IVs onto the new strikes as the starting point
+    narrower, _ = synthetic_chain(strikes[10:-10])
+    guess = engine._guess(("NIFTY", "2026-10-20"), narrower.strikes)
+    previous = enriched.column("CE", "iv")[10:-10] / 100
+    known = ~np.isnan(previous)
+    np.testing.assert_allclose(guess[0][known], previous[known])
+    assert not np.isnan(guess).any()
+
+
+def test_publisher_enrich_hook_feeds_subscribers():
+    data = FakeClient(num_strikes=50).get_option_chain("NSE", "NIFTY", "2026-10-20")
+    publisher = OptionChainData(enrich=GreeksEngine(expiry_date="2026-10-20"))
+    received = []
+
+    class Capture(MaxOIStrategy):
+        def update(self, data):
+            received.append(data)
+            super().update(data)
+
+    strategy = Capture()
+    publisher.add_subscriber(strategy)
+    publisher.add_subscriber(strategy, "25000")
+    snapshot = OptionChainSnapshot.from_dict(data, timestamp=NOW)
+    publisher.notify(snapshot)
+
+    assert len(received) == 1 and received[0] is not snapshot
+    assert not np.array_equal(received[0].column("CE", "iv"), snapshot.column("CE", "iv"), equal_nan=True)
+    assert strategy.max_oi_strike is not None
+    # Without a known expiry the chain passes through unchanged
+    assert GreeksEngine()(OptionChainSnapshot.from_dict(data)).column("CE", "iv").tolist() == snapshot.column("CE", "iv").tolist()
+
+
+def test_enriched_chain_survives_dict_codecs():
+    data = FakeClient(num_strikes=50).get_option_chain("NSE", "NIFTY", "2026-10-20")
+    snapshot = OptionChainSnapshot.from_dict(data, timestamp=NOW, underlying="NIFTY", expiry_date="2026-10-20")
+    enriched = GreeksEngine()(snapshot)
+    codec = get_codec("json")
+
+    decoded = codec.decode(codec.encode(enriched))
+
+    np.testing.assert_array_equal(decoded.column("CE", "iv"), enriched.column("CE", "iv"))
+    np.testing.assert_array_equal(decoded.column("PE", "delta"), enriched.column("PE", "delta"))
+    assert not np.array_equal(decoded.column("CE", "iv"), snapshot.column("CE", "iv"), equal_nan=True)
@@ -0,0 +1,29 @@
+import asyncio
+import main
+from src.feed.pump import StreamingPump
+
+
+def test_streaming_mode_runs_pumps(monkeypatch, capsys):
+    for name in ("CHECKPOINT_DIR", "METRICS_PORT", "METRICS_LOG_INTERVAL", "COMPUTE_GREEKS"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("TRADING_CLIENT", "fake")
+    monkeypatch.setenv("UNDERLYINGS", "NIFTY")
+    monkeypatch.setenv("EXPIRY_KINDS", "weekly")
+    # Nothing listens on port 1, so the pump falls back to its REST seed fetch
+    monkeypatch.setenv("FEED_URL", "http://127.0.0.1:1/feed")
+    monkeypatch.setattr(main, "load_dotenv", lambda: None)
+
+    pumps = []
+    run = StreamingPump.run
+
+    async def run_briefly(self):
+        pumps.append(self)
+        asyncio.get_running_loop().call_later(0.2, self.stop)
+        await run(self)
+
+    monkeypatch.setattr(StreamingPump, "run", run_briefly)
+    main.main()
+
+    assert len(pumps) == 1
+    assert pumps[0].polls == 1
+    assert "Streaming NIFTY (NSE)" in capsys.readouterr().out
@@ -0,0 +1,134 @@
+import urllib.request
+import pytest
+from src.client.fake import FakeClient
+from src.fetch.scheduler import FetchKey, FetchScheduler
+from src.metrics.exporters import prometheus_text, serve_prometheus, summary_line
+from src.metrics.registry import Histogram, MetricsRegistry
+from src.pubsub.publisher import OptionChainData
+from tests.helpers import MockSubscriber
+
+
+SAMPLE_DATA = {
+    "underlying_ltp": 25641.7,
+    "strikes": {
+        "23400": {"CE": {"open_interest": 10}, "PE": {"open_interest": 20}},
+        "23450": {"CE": {"open_interest": 30}, "PE": {"open_interest": 40}},
+    }
+}
+
+
+def test_histogram_percentiles_within_bucket_resolution():
+    hist = Histogram()
+    for value in range(1, 100001):
+        hist.record(value)
+
+    assert hist.count == 100000
+    assert hist.min == 1 and hist.max == 100000
+    for q in (0.5, 0.9, 0.99, 0.999):
+        assert hist.percentile(q) == pytest.approx(q * 100000, rel=0.04)
+    assert hist.mean == pytest.approx(50000.5)
+
+
+def test_small_values_are_exact():
+    hist = Histogram(scale=0.5)
+    for value in (3, 3, 7, 40):
+        hist.record(value)
+    assert hist.percentile(0.5) == 1.5
+    assert hist.percentile(0.75) == 3.5
+    assert hist.percentile(1.0) == 20.0
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    with registry.timer("notify_seconds"):
+        pass
+    registry.inc("ticks_total")
+    registry.observe("payload_strikes", 10)
+
+    @registry.timed("work_seconds")
+    def work():
+        return 42
+
+    assert work() == 42
+    assert registry.collect() == ({}, {})
+
+
+def test_timed_decorator_and_prometheus_text():
+    registry = MetricsRegistry()
+
+    @registry.timed(stage="score")
+    def score():
+        return 1
+
+    for _ in range(5):
+        score()
+    registry.inc("ticks_total", 3)
+
+    text = prometheus_text(registry)
+    assert "# TYPE ticks_total counter\nticks_total 3" in text
+    assert 'test_timed_decorator_and_prometheus_text_score_seconds_count{stage="score"} 5' in text
+    assert 'quantile="0.99"' in text
+    assert "ticks_total=3" in summary_line(registry)
+
+
+def test_publisher_records_per_subscriber_latency():
+    registry = MetricsRegistry()
+    publisher = OptionChainData(metrics=registry)
+    labelled = MockSubscriber("max_oi_nifty")
+    plain = MockSubscriber()
+    publisher.add_subscriber(labelled)
+    publisher.add_subscriber(plain, "23400")
+
+    publisher.notify(SAMPLE_DATA)
+    publisher.notify(SAMPLE_DATA)
+
+    histograms, counters = registry.collect()
+    assert histograms["notify_seconds"][()].count == 2
+    assert histograms["payload_strikes"][()].max == 2
+    assert counters["ticks_total"][()].value == 2
+    updates = histograms["subscriber_update_seconds"]
+    assert updates[(("subscriber", "max_oi_nifty"),)].count == 2
+    assert updates[(("subscriber", "MockSubscriber"),)].count == 2
+    assert len(plain.received_data) == 2
+
+
+def test_publisher_skips_timing_when_disabled():
+    registry = MetricsRegistry(enabled=False)
+    publisher = OptionChainData(metrics=registry)
+    subscriber = MockSubscriber()
+    publisher.add_subscriber(subscriber)
+
+    publisher.notify(SAMPLE_DATA)
+
+    assert len(subscriber.received_data) == 1
+    assert registry.collect() == ({}, {})
+
+
+def test_scheduler_records_stage_latencies():
+    registry = MetricsRegistry()
+    key = FetchKey("NSE", "NIFTY", "2026-10-20")
+    scheduler = FetchScheduler(FakeClient(num_strikes=10), metrics=registry)
+    scheduler.add(key, publisher=OptionChainData(metrics=registry))
+    try:
+        scheduler.run_once()
+    finally:
+        scheduler.close()
+
+    histograms, _ = registry.collect()
+    labels = (("expiry", "2026-10-20"), ("underlying", "NIFTY"))
+    for stage in ("fetch_seconds", "parse_seconds", "publish_seconds"):
+        assert histograms[stage][labels].count == 1
+    assert histograms["notify_seconds"][()].count == 1
+
+
+def test_prometheus_endpoint_serves_metrics():
+    registry = MetricsRegistry()
+    registry.inc("ticks_total")
+    server = serve_prometheus(registry, 0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+    assert "ticks_total 1" in body
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import pytest
+from typing import Callable, List
+from src.client.fake import FakeClient
+from src.pubsub.nats_publisher import NatsPublisher, chain_subject
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.strategies.max_oi import MaxOIStrategy
+from tests.helpers import MockSubscriber
+
+
+class InMemoryMsg:
+    def __init__(self, subject: str, data: bytes):
+        self.subject = subject
+        self.data = data
+
+
+class InMemorySubscription:
+    def __init__(self, server: "InMemoryNats", subject: str, cb: Callable):
+        self.server = server
+        self.subject = subject
+        self.cb = cb
+
+    async def unsubscribe(self):
+        self.server.subscriptions.remove(self)
+
+
+class InMemoryNats:
+    """Stand-in for a connected nats.aio.client.Client with `*`/`>` wildcard matching."""
+
+    def __init__(self):
+        self.subscriptions: List[InMemorySubscription] = []
+        self.published: List[str] = []
+
+    async def publish(self, subject: str, payload: bytes = b""):
+        self.published.append(subject)
+        for sub in list(self.subscriptions):
+            if self._matches(sub.subject, subject):
+                await sub.cb(InMemoryMsg(subject, payload))
+
+    async def subscribe(self, subject: str, cb: Callable = None):
+        sub = InMemorySubscription(self, subject, cb)
+        self.subscriptions.append(sub)
+        return sub
+
+    @staticmethod
+    def _matches(pattern: str, subject: str) -> bool:
+        p_tokens, s_tokens = pattern.split("."), subject.split(".")
+        for i, token in enumerate(p_tokens):
+            if token == ">":
+                return len(s_tokens) > i
+            if i >= len(s_tokens) or (token != "*" and token != s_tokens[i]):
+                return False
+        return len(p_tokens) == len(s_tokens)
+
+
+def test_chain_subject():
+    assert chain_subject("NIFTY", "2026-10-20") == "chain.NIFTY.2026-10-20"
+    assert chain_subject("NIFTY", "2026-10-20", "23400") == "chain.NIFTY.2026-10-20.23400"
+    assert chain_subject("NIFTY", "2026-10-20", "23412.5") == "chain.NIFTY.2026-10-20.23412_5"
+
+
+def test_remote_strategies_receive_snapshots_over_nats():
+    async def scenario():
+        server = InMemoryNats()
+        # "Remote" side: strategies subscribe through their own publisher instance
+        remote = NatsPublisher(server, "NIFTY", "2026-10-20")
+        strategy = MaxOIStrategy()
+        strike_sub = MockSubscriber()
+        both_sub = MockSubscriber()
+        await remote.subscribe(strategy)
+        await remote.subscribe(strike_sub, ["25000", "25050"])
+        await remote.subscribe(both_sub, "25000")
+        await remote.subscribe(both_sub)
+
+        # "Local" side: the fetch loop's publisher bridged onto NATS
+        local = OptionChainData()
+        bridge = NatsPublisher(server, "NIFTY", "2026-10-20")
+        local.add_subscriber(bridge)
+        data = FakeClient(num_strikes=20).get_option_chain("NSE", "NIFTY", "2026-10-20")
+        local.notify(OptionChainSnapshot.from_dict(data))
+        await bridge.flush()
+        return server, strategy, strike_sub, both_sub, data
+
+    server, strategy, strike_sub, both_sub, data = asyncio.run(scenario())
+
+    expected = MaxOIStrategy()
+    expected.update(data)
+    assert strategy.get_max_oi_details() == expected.get_max_oi_details()
+    assert strategy.max_oi_value == expected.max_oi_value
+
+    assert sorted(s.strike_keys[0] for s in strike_sub.received_data) == ["25000", "25050"]
+    assert all(len(s) == 1 for s in strike_sub.received_data)
+    # Global + strike subscriber hears each tick once
+    assert len(both_sub.received_data) == 1
+    assert len(both_sub.received_data[0]) == 20
+    assert len(server.published) == 21
+
+
+def test_sync_calls_from_other_threads_and_unsubscribe():
+    async def scenario():
+        server = InMemoryNats()
+        publisher = NatsPublisher(server, "BANKNIFTY", "2026-10-27", per_strike=False)
+        sub = MockSubscriber()
+        publisher.add_subscriber(sub)
+        await publisher.flush()
+
+        data = FakeClient(num_strikes=5).get_option_chain("NSE", "BANKNIFTY", "2026-10-27")
+        worker = threading.Thread(target=publisher.notify, args=(data,))
+        worker.start()
+        await asyncio.to_thread(worker.join)
+        await publisher.flush()
+
+        publisher.remove_subscriber(sub)
+        await publisher.flush()
+        await publisher.publish(data)
+        return server, sub
+
+    server, sub = asyncio.run(scenario())
+
+    assert len(sub.received_data) == 1
+    assert sub.received_data[0].underlying == "BANKNIFTY"
+    assert server.published == ["chain.BANKNIFTY.2026-10-27"] * 2
+    assert server.subscriptions == []
+
+
+def test_alternate_codec():
+    async def scenario():
+        server = InMemoryNats()
+        publisher = NatsPublisher(server, "NIFTY", "2026-10-20", per_strike=False, codec="protobuf")
+        sub = MockSubscriber()
+        await publisher.subscribe(sub)
+        data = FakeClient(num_strikes=5).get_option_chain("NSE", "NIFTY", "2026-10-20")
+        await publisher.publish(data)
+        return sub, data
+
+    sub, data = asyncio.run(scenario())
+
+    assert len(sub.received_data) == 1
+    assert sub.received_data[0].strike_keys == OptionChainSnapshot.from_dict(data).strike_keys
+
+
+def test_pickle_codec_needs_explicit_opt_in():
+    async def scenario():
+        server = InMemoryNats()
+        with pytest.raises(ValueError, match="allow_pickle"):
+            NatsPublisher(server, "NIFTY", "2026-10-20", codec="pickle")
+        publisher = NatsPublisher(server, "NIFTY", "2026-10-20", per_strike=False, codec="pickle", allow_pickle=True)
+        sub = MockSubscriber()
+        await publisher.subscribe(sub)
+        await publisher.publish(FakeClient(num_strikes=5).get_option_chain("NSE", "NIFTY", "2026-10-20"))
+        return sub
+
+    assert len(asyncio.run(scenario()).received_data) == 1
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from src.client.fake import generate_chain
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.strategies.oi_tracker import RollingOITracker
+
+
+def chain(oi):
+    """Build a chain from {strike: (CE OI, PE OI)}."""
+    return {
+        "underlying_ltp": 23450.0,
+        "strikes": {
+            strike: {"CE": {"open_interest": ce}, "PE": {"open_interest": pe}}
+            for strike, (ce, pe) in oi.items()
+        }
+    }
+
+
+def brute_force_max_pain(snapshot: OptionChainSnapshot) -> str:
+    ce = np.nan_to_num(snapshot.column("CE", "open_interest"))
+    pe = np.nan_to_num(snapshot.column("PE", "open_interest"))
+    s = snapshot.strikes
+    pain = [np.sum(ce * np.maximum(k - s, 0) + pe * np.maximum(s - k, 0)) for k in s]
+    return snapshot.strike_keys[int(np.argmin(pain))]
+
+
+def test_invalid_history():
+    with pytest.raises(ValueError):
+        RollingOITracker(history=0)
+
+
+def test_oi_change_over_rolling_window():
+    tracker = RollingOITracker(history=2)
+    tracker.update(chain({"23400": (100, 50), "23450": (200, 80)}))
+    assert tracker.oi_change("23400") == (0.0, 0.0)
+
+    tracker.update(chain({"23400": (110, 50), "23450": (200, 80)}))
+    assert tracker.changed.tolist() == [0]
+    assert tracker.oi_change("23400") == (10.0, 0.0)
+
+    tracker.update(chain({"23400": (130, 60), "23450": (200, 80)}))
+    assert tracker.oi_change("23400") == (30.0, 10.0)
+
+    # The first tick falls out of the two-tick window
+    tracker.update(chain({"23400": (130, 60), "23450": (200, 80)}))
+    assert tracker.changed.tolist() == []
+    assert tracker.oi_change("23400") == (20.0, 10.0)
+    assert tracker.oi_change().shape == (2, 2)
+
+
+def test_pcr_tracks_running_totals():
+    tracker = RollingOITracker()
+    assert tracker.pcr is None
+    tracker.update(chain({"23400": (100, 50), "23450": (100, 150)}))
+    assert tracker.pcr == pytest.approx(1.0)
+
+    tracker.update(chain({"23400": (100, 50), "23450": (100, 350)}))
+    assert tracker.pcr == pytest.approx(2.0)
+
+
+def test_top_k_rankings():
+    tracker = RollingOITracker(history=1)
+    tracker.update(chain({"23400": (100, 50), "23450": (200, 80), "23500": (200, 10)}))
+    assert tracker.top_oi(3) == [("CE", "23450", 200.0), ("CE", "23500", 200.0), ("CE", "23400", 100.0)]
+
+    tracker.update(chain({"23400": (100, 90), "23450": (200, 80), "23500": (205, 10)}))
+    assert tracker.top_oi_change(2) == [("PE", "23400", 40.0), ("CE", "23500", 5.0)]
+    assert tracker.top_oi(1) == [("CE", "23500", 205.0)]
+
+
+def test_max_pain_matches_brute_force():
+    tracker = RollingOITracker()
+    for tick in range(5):
+        data = generate_chain("NIFTY", num_strikes=60, tick=tick, seed=3)
+        tracker.update(data)
+        assert tracker.max_pain() == brute_force_max_pain(OptionChainSnapshot.from_dict(data))
+
+
+def test_strike_grid_change_keeps_shared_history():
+    tracker = RollingOITracker(history=3)
+    tracker.update(chain({"23400": (100, 50), "23450": (200, 80)}))
+    tracker.update(chain({"23450": (260, 80), "23500": (40, 0)}))
+
+    assert tracker.strike_keys == ["23450", "23500"]
+    assert tracker.oi_change("23450") == (60.0, 0.0)
+    # New strikes have no history, so their change is their whole OI
+    assert tracker.oi_change("23500") == (40.0, 0.0)
+    assert tracker.pcr == pytest.approx(80 / 300)
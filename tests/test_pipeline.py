@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from src.client.fake import FakeClient
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.strategies.max_oi import MaxOIStrategy
+from src.strategies.pipeline import FeaturePipeline, Features, PipelineStrategy, Stage
+
+
+class Recorder(PipelineStrategy):
+    def __init__(self, *requires):
+        self.requires = requires
+        self.seen = []
+
+    def on_features(self, features: Features):
+        self.seen.append({name: features[name] for name in self.requires})
+
+
+def chain(num_strikes=30, seed=0):
+    data = FakeClient(num_strikes=num_strikes, seed=seed).get_option_chain("NSE", "NIFTY", "2026-10-20")
+    return OptionChainSnapshot.from_dict(data)
+
+
+def test_shared_stages_are_computed_once_per_tick():
+    calls = []
+    pipeline = FeaturePipeline()
+
+    @pipeline.stage("atm_oi", "snapshot", "atm_strike")
+    def atm_oi(snapshot, atm):
+        calls.append(atm)
+        return snapshot.column("CE", "open_interest")[atm]
+
+    strategies = [Recorder("atm_oi", "pcr") for _ in range(10)]
+    for strategy in strategies:
+        pipeline.add_strategy(strategy)
+    publisher = OptionChainData()
+    publisher.add_subscriber(pipeline)
+    snapshot = chain()
+    publisher.notify(snapshot)
+
+    assert len(calls) == 1
+    assert pipeline.plan() == ("nearest:1", "atm_strike", "atm_oi", "oi_totals", "pcr")
+    # Unused stages are skipped
+    assert "iv_smile" not in pipeline.features.computed
+    ce, pe = np.nansum(snapshot.column("CE", "open_interest")), np.nansum(snapshot.column("PE", "open_interest"))
+    assert strategies[-1].seen == [{"atm_oi": snapshot.column("CE", "open_interest")[calls[0]], "pcr": pe / ce}]
+
+
+def test_lazy_lookup_and_iv_smile():
+    class Lazy(PipelineStrategy):
+        def on_features(self, features):
+            self.smile = features["iv_smile"]
+
+    pipeline = FeaturePipeline()
+    strategy = Lazy()
+    pipeline.add_strategy(strategy)
+    snapshot = chain()
+    pipeline.update(snapshot)
+
+    assert pipeline.plan() == ()
+    atm = pipeline.features["atm_strike"]
+    strikes, ivs = strategy.smile
+    assert len(strikes) == len(snapshot)
+    assert ivs[atm - 1] == snapshot.column("PE", "iv")[atm - 1]
+    assert ivs[atm] == snapshot.column("CE", "iv")[atm]
+
+
+def test_max_oi_strategy_matches_standalone_results():
+    pipeline = FeaturePipeline()
+    shared = [MaxOIStrategy(window=w) for w in (6, 12, 12)]
+    standalone = [MaxOIStrategy(window=w) for w in (6, 12, 12)]
+    for strategy in shared:
+        pipeline.add_strategy(strategy)
+
+    for seed in range(5):
+        snapshot = chain(seed=seed)
+        pipeline.update(snapshot)
+        for strategy in standalone:
+            strategy.update(snapshot)
+        for a, b in zip(shared, standalone):
+            assert (a.max_oi_type, a.max_oi_strike, a.max_oi_value) == (b.max_oi_type, b.max_oi_strike, b.max_oi_value)
+    assert pipeline.plan() == ("nearest:6", "nearest:12")
+
+
+def test_plain_subscribers_receive_snapshot():
+    class Plain:
+        def __init__(self):
+            self.received = []
+
+        def update(self, data):
+            self.received.append(data)
+
+    pipeline = FeaturePipeline()
+    plain = Plain()
+    pipeline.add_strategy(plain)
+    pipeline.update(chain().to_dict())
+    assert isinstance(plain.received[0], OptionChainSnapshot)
+
+
+def test_rejects_unknown_stages_and_cycles():
+    pipeline = FeaturePipeline(stages=[Stage("a", lambda b: b, ("b",)), Stage("b", lambda a: a, ("a",))])
+    with pytest.raises(KeyError):
+        pipeline.add_strategy(Recorder("missing"))
+    with pytest.raises(ValueError):
+        pipeline.add_strategy(Recorder("a"))
+    with pytest.raises(ValueError):
+        pipeline.add_stage(Stage("snapshot", lambda s: s))
+    assert pipeline.plan() == ()
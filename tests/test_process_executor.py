@@ -0,0 +1,69 @@
+import pytest
+from multiprocessing.shared_memory import SharedMemory
+from src.client.fake import FakeClient
+from src.pubsub.process_executor import ProcessStrategyExecutor
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.strategies.max_oi import MaxOIStrategy
+
+
+def test_strategies_run_in_worker_processes():
+    windows = {"w4": 4, "w8": 8, "w12": 12}
+    client = FakeClient(num_strikes=60)
+    ticks = [OptionChainSnapshot.from_dict(client.get_option_chain("NSE", "NIFTY", "2026-10-20")) for _ in range(10)]
+
+    publisher = OptionChainData()
+    with ProcessStrategyExecutor({name: MaxOIStrategy(window=w) for name, w in windows.items()}, workers=2, slots=2, collect_results=True) as executor:
+        publisher.add_subscriber(executor)
+        for snapshot in ticks:
+            publisher.notify(snapshot)
+        executor.join()
+        completed = executor.drain()
+        latest = dict(executor.latest)
+
+    assert len(completed) == len(ticks) * len(windows)
+    assert sorted({seq for seq, _, _ in completed}) == list(range(len(ticks)))
+
+    for name, window in windows.items():
+        local = MaxOIStrategy(window=window)
+        expected = []
+        for snapshot in ticks:
+            local.update(snapshot)
+            expected.append(local.get_max_oi_details())
+        remote = [result for _, n, result in sorted(completed) if n == name]
+        assert remote == expected
+        assert latest[name] == expected[-1]
+
+
+def test_oversized_snapshot_is_rejected():
+    snapshot = OptionChainSnapshot.from_dict(FakeClient(num_strikes=100).get_option_chain("NSE", "NIFTY", "2026-10-20"))
+    executor = ProcessStrategyExecutor({"max_oi": MaxOIStrategy()}, workers=1, slot_size=1024)
+    try:
+        with pytest.raises(ValueError):
+            executor.update(snapshot)
+    finally:
+        executor.close()
+
+    with pytest.raises(ValueError):
+        ProcessStrategyExecutor({})
+
+
+def test_latest_only_by_default_and_close_releases_slots_on_timeout():
+    snapshot = OptionChainSnapshot.from_dict(FakeClient(num_strikes=10).get_option_chain("NSE", "NIFTY", "2026-10-20"))
+    executor = ProcessStrategyExecutor({"max_oi": MaxOIStrategy()}, workers=1, slots=2)
+    executor.update(snapshot)
+    executor.join()
+    assert executor.drain() == []
+    assert "max_oi" in executor.latest
+
+    names = [slot.name for slot in executor._slots]
+
+    def stuck():
+        raise TimeoutError("Strategy workers stopped responding")
+
+    executor.join = stuck
+    with pytest.raises(TimeoutError):
+        executor.close()
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
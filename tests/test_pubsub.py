@@ -1,15 +1,6 @@
 import pytest
-from typing import Any, Dict
-from src.pubsub.interfaces import ISubscriber
 from src.pubsub.publisher import OptionChainData
-
-
-class MockSubscriber(ISubscriber):
-    def __init__(self):
-        self.received_data = []
-
-    def update(self, data: Dict[str, Any]):
-        self.received_data.append(data)
+from tests.helpers import MockSubscriber
 
 
 @pytest.fixture
@@ -124,3 +115,59 @@ def test_add_subscriber_with_multiple_strikes(publisher):
     assert "23450" not in received_strikes
 
 
+def test_subscriber_on_global_and_strike_is_notified_once(publisher):
+    sub = MockSubscriber()
+    publisher.add_subscriber(sub)
+    publisher.add_subscriber(sub, "23400")
+
+    publisher.notify({
+        "underlying_ltp": 25641.7,
+        "strikes": {"23400": {"CE": {"ltp": 2200}}}
+    })
+
+    assert len(sub.received_data) == 1
+
+
+def test_routing_plan_is_rebuilt_only_when_subscriptions_change(publisher):
+    sub_a = MockSubscriber()
+    sub_b = MockSubscriber()
+    publisher.add_subscriber(sub_a, "23400")
+
+    _, routes = publisher._routing_plan()
+    assert routes == {"23400": (sub_a,)}
+    assert publisher._routing_plan()[1] is routes
+
+    publisher.add_subscriber(sub_b, "23400")
+    _, rebuilt = publisher._routing_plan()
+    assert rebuilt is not routes
+    assert set(rebuilt["23400"]) == {sub_a, sub_b}
+
+
+def test_strike_payload_is_shared_across_subscribers(publisher):
+    subs = [MockSubscriber() for _ in range(3)]
+    for sub in subs:
+        publisher.add_subscriber(sub, "23450")
+
+    publisher.notify({
+        "underlying_ltp": 25641.7,
+        "strikes": {
+            "23400": {"CE": {"ltp": 2200}},
+            "23450": {"CE": {"ltp": 2082}}
+        }
+    })
+
+    payloads = [sub.received_data[0] for sub in subs]
+    assert all(payload is payloads[0] for payload in payloads)
+
+
+def test_remove_subscriber_drops_empty_buckets(publisher):
+    subs = [MockSubscriber() for _ in range(2000)]
+    for i, sub in enumerate(subs):
+        publisher.add_subscriber(sub, [str(23000 + 50 * (i % 40)), str(25000 + 50 * (i % 40))])
+
+    for sub in subs:
+        publisher.remove_subscriber(sub)
+
+    assert not publisher._all_subscribers
+    assert not publisher._subscribers
+    assert publisher._routing_plan() == ((), {})
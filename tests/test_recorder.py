@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+from src.client.fake import FakeClient
+from src.pubsub.codec import CodecError, decode_snapshot, encode_snapshot
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.storage.recorder import TickRecorder, TickReplay
+from src.strategies.max_oi import MaxOIStrategy
+from tests.helpers import MockSubscriber
+
+
+def record_ticks(path, ticks=20):
+    client = FakeClient(num_strikes=40)
+    publisher = OptionChainData()
+    strategy = MaxOIStrategy()
+    publisher.add_subscriber(strategy)
+    live_results = []
+    with TickRecorder(path) as recorder:
+        publisher.add_subscriber(recorder)
+        for tick in range(ticks):
+            data = client.get_option_chain("NSE", "NIFTY", "2026-10-20")
+            publisher.notify(OptionChainSnapshot.from_dict(data, timestamp=1000.0 + tick, underlying="NIFTY", expiry_date="2026-10-20"))
+            live_results.append(strategy.get_max_oi_details())
+    return live_results
+
+
+def test_codec_round_trip_is_zero_copy():
+    data = FakeClient(num_strikes=10).get_option_chain("NSE", "NIFTY", "2026-10-20")
+    snapshot = OptionChainSnapshot.from_dict(data, timestamp=123.5, underlying="NIFTY", expiry_date="2026-10-20")
+    encoded = encode_snapshot(snapshot)
+
+    decoded, end = decode_snapshot(encoded)
+
+    assert end == len(encoded)
+    assert decoded.strike_keys == snapshot.strike_keys
+    np.testing.assert_array_equal(decoded.values, snapshot.values)
+    assert (decoded.timestamp, decoded.underlying, decoded.expiry_date) == (123.5, "NIFTY", "2026-10-20")
+    assert decoded.underlying_ltp == snapshot.underlying_ltp
+    # Views into the encoded bytes rather than copies
+    assert not decoded.values.flags.writeable
+    assert not decoded.values.flags.owndata
+
+    with pytest.raises(CodecError):
+        decode_snapshot(encoded[:-8])
+    with pytest.raises(CodecError):
+        decode_snapshot(b"XYZ" + encoded[3:])
+
+
+def test_replay_reproduces_live_strategy_results(tmp_path):
+    path = tmp_path / "ticks.bin"
+    live_results = record_ticks(path)
+
+    replay = TickReplay(path)
+    assert len(replay) == 20
+    assert replay[0].timestamp == 1000.0
+    assert replay[-1].underlying == "NIFTY"
+
+    publisher = OptionChainData()
+    strategy = MaxOIStrategy()
+    strike_sub = MockSubscriber()
+    publisher.add_subscriber(strategy)
+    publisher.add_subscriber(strike_sub, replay[0].strike_keys[5])
+
+    replayed_results = []
+    for snapshot in replay:
+        publisher.notify(snapshot)
+        replayed_results.append(strategy.get_max_oi_details())
+
+    assert replayed_results == live_results
+    assert len(strike_sub.received_data) == 20
+
+
+def test_replay_ignores_truncated_tail(tmp_path):
+    path = tmp_path / "ticks.bin"
+    record_ticks(path, ticks=3)
+    with open(path, "ab") as f:
+        f.write(b"OCS\x01partial")
+
+    assert len(TickReplay(path)) == 3
+
+    empty = tmp_path / "empty.bin"
+    empty.touch()
+    assert len(TickReplay(empty)) == 0
+
+
+def test_replay_at_time_multiple(tmp_path):
+    path = tmp_path / "ticks.bin"
+    record_ticks(path, ticks=4)
+
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    sub = MockSubscriber()
+    publisher = OptionChainData()
+    publisher.add_subscriber(sub)
+
+    count = TickReplay(path).replay(publisher, speed=2, sleep=sleep, clock=lambda: now[0])
+
+    assert count == 4
+    assert len(sub.received_data) == 4
+    # Ticks recorded one second apart are replayed half a second apart
+    assert sleeps == [0.5, 0.5, 0.5]
+    assert TickReplay(path).replay(publisher) == 4
@@ -0,0 +1,128 @@
+import threading
+import time
+import pytest
+from src.client.factory import ClientFactory
+from src.client.fake import FakeClient
+from src.fetch.scheduler import FetchKey, FetchScheduler
+from src.pubsub.snapshot import OptionChainSnapshot
+from tests.helpers import MockSubscriber
+
+
+KEYS = [
+    FetchKey("NSE", "NIFTY", "2026-10-20"),
+    FetchKey("NSE", "BANKNIFTY", "2026-10-27"),
+    FetchKey("NSE", "FINNIFTY", "2026-10-27"),
+    FetchKey("BSE", "SENSEX", "2026-10-22"),
+]
+
+
+def test_factory_returns_fake_client():
+    client = ClientFactory.get_client("fake", num_strikes=10)
+    assert isinstance(client, FakeClient)
+    chain = client.get_option_chain("NSE", "NIFTY", "2026-10-20")
+    assert len(chain["strikes"]) == 10
+    assert chain["underlying_ltp"] > 0
+
+
+def test_run_once_fetches_all_series_concurrently():
+    client = FakeClient(num_strikes=20, latency=0.2)
+    scheduler = FetchScheduler(client, max_workers=4)
+    subscribers = {}
+    for key in KEYS:
+        subscribers[key] = MockSubscriber()
+        scheduler.add(key).add_subscriber(subscribers[key])
+
+    started = time.perf_counter()
+    scheduler.run_once()
+    elapsed = time.perf_counter() - started
+    scheduler.close()
+
+    # Four 0.2s fetches on four workers overlap instead of taking 0.8s
+    assert elapsed < 0.6
+    assert sorted(client.calls) == sorted(tuple(key) for key in KEYS)
+    for key, sub in subscribers.items():
+        assert len(sub.received_data) == 1
+        snapshot = sub.received_data[0]
+        assert isinstance(snapshot, OptionChainSnapshot)
+        assert (snapshot.underlying, snapshot.expiry_date) == (key.underlying, key.expiry_date)
+        assert len(snapshot) == 20
+
+
+def test_run_respects_per_series_intervals():
+    client = FakeClient(num_strikes=5)
+    scheduler = FetchScheduler(client, max_workers=2)
+    fast_key, slow_key = KEYS[0], KEYS[1]
+    scheduler.add(fast_key, interval=0.05)
+    scheduler.add(slow_key, interval=60)
+
+    runner = threading.Thread(target=scheduler.run)
+    runner.start()
+    time.sleep(0.4)
+    scheduler.close()
+    runner.join(timeout=2)
+
+    assert not runner.is_alive()
+    jobs = {job.key: job for job in scheduler.jobs()}
+    assert jobs[fast_key].fetches >= 4
+    assert jobs[slow_key].fetches == 1
+
+
+def test_failing_series_does_not_stop_others():
+    class FlakyClient(FakeClient):
+        def get_option_chain(self, exchange, underlying, expiry_date):
+            if underlying == "BANKNIFTY":
+                raise ConnectionError("throttled")
+            return super().get_option_chain(exchange, underlying, expiry_date)
+
+    errors = []
+    scheduler = FetchScheduler(FlakyClient(num_strikes=5), on_error=lambda key, e: errors.append((key, e)))
+    for key in KEYS[:2]:
+        scheduler.add(key)
+    scheduler.run_once()
+    scheduler.close()
+
+    jobs = {job.key: job for job in scheduler.jobs()}
+    assert jobs[KEYS[0]].fetches == 1
+    assert jobs[KEYS[1]].errors == 1
+    assert isinstance(jobs[KEYS[1]].last_error, ConnectionError)
+    assert errors[0][0] == KEYS[1]
+
+    with pytest.raises(ValueError):
+        scheduler.add(KEYS[0])
+
+
+def test_close_waits_for_run_and_rejects_non_positive_intervals():
+    scheduler = FetchScheduler(FakeClient(num_strikes=5), max_workers=2, default_interval=60)
+    for interval in (0, -1):
+        with pytest.raises(ValueError):
+            scheduler.add(KEYS[0], interval=interval)
+    with pytest.raises(ValueError):
+        FetchScheduler(FakeClient(num_strikes=5), default_interval=0)
+    for key in KEYS:
+        scheduler.add(key, interval=0.001)
+    assert {job.interval for job in scheduler.jobs()} == {0.001}
+
+    errors = []
+
+    def run():
+        try:
+            scheduler.run()
+        except Exception as e:
+            errors.append(e)
+
+    for _ in range(5):
+        runner = threading.Thread(target=run)
+        runner.start()
+        time.sleep(0.05)
+        # Closing while run() is busy dispatching must not make it submit to a dead executor
+        scheduler.close()
+        assert not runner.is_alive()
+        runner.join()
+        scheduler = FetchScheduler(FakeClient(num_strikes=5), max_workers=2)
+        for key in KEYS:
+            scheduler.add(key, interval=0.001)
+    assert errors == []
+
+    scheduler.close()
+    with pytest.raises(RuntimeError):
+        scheduler.run()
@@ -0,0 +1,83 @@
+import math
+import numpy as np
+import pytest
+from typing import Any, Dict
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.strategies.max_oi import MaxOIStrategy
+from tests.helpers import MockSubscriber
+
+
+@pytest.fixture
+def market_data() -> Dict[str, Any]:
+    return {
+        "underlying_ltp": 23420.5,
+        "strikes": {
+            "23450": {
+                "CE": {"ltp": 2082, "open_interest": 30, "volume": 5,
+                       "greeks": {"iv": 14.2, "delta": 0.45, "gamma": 0.001, "theta": -12.0, "vega": 8.5}},
+                "PE": {"ltp": 95, "open_interest": 70},
+            },
+            "23400": {
+                "CE": {"ltp": 2200, "open_interest": 10},
+                "PE": {"ltp": 80, "open_interest": 40},
+            },
+            "not-a-strike": {"CE": {"ltp": 1}},
+        }
+    }
+
+
+def test_snapshot_from_dict_is_sorted_and_columnar(market_data):
+    snapshot = OptionChainSnapshot.from_dict(market_data)
+
+    assert len(snapshot) == 2
+    assert snapshot.strikes.dtype == np.float64
+    assert snapshot.strikes.tolist() == [23400.0, 23450.0]
+    assert snapshot.strike_keys == ["23400", "23450"]
+    assert snapshot.underlying_ltp == 23420.5
+
+    assert snapshot.column("CE", "open_interest").tolist() == [10, 30]
+    assert snapshot.column("PE", "ltp").tolist() == [80, 95]
+    # Greeks are lifted out of the nested "greeks" dict
+    assert snapshot.column("CE", "iv")[1] == 14.2
+    assert snapshot.column("CE", "delta")[1] == 0.45
+    # Missing fields are NaN
+    assert math.isnan(snapshot.column("CE", "volume")[0])
+    assert math.isnan(snapshot.column("PE", "delta")[1])
+
+
+def test_snapshot_select_and_to_dict(market_data):
+    snapshot = OptionChainSnapshot.from_dict(market_data)
+    assert snapshot.to_dict() is market_data
+
+    selected = snapshot.select(["23450", "99999"])
+    assert selected.strike_keys == ["23450"]
+    assert selected.column("PE", "open_interest").tolist() == [70]
+
+    rebuilt = selected.to_dict()
+    assert rebuilt["underlying_ltp"] == 23420.5
+    assert rebuilt["strikes"]["23450"]["PE"] == {"open_interest": 70, "ltp": 95}
+
+
+def test_publisher_fans_out_snapshot(market_data):
+    publisher = OptionChainData()
+    global_sub = MockSubscriber()
+    strike_sub = MockSubscriber()
+    publisher.add_subscriber(global_sub)
+    publisher.add_subscriber(strike_sub, "23400")
+
+    snapshot = OptionChainSnapshot.from_dict(market_data)
+    publisher.notify(snapshot)
+
+    assert global_sub.received_data == [snapshot]
+    assert len(strike_sub.received_data) == 1
+    assert strike_sub.received_data[0].strike_keys == ["23400"]
+    assert strike_sub.received_data[0].underlying_ltp == 23420.5
+
+
+def test_max_oi_strategy_accepts_snapshot(market_data):
+    strategy = MaxOIStrategy()
+    strategy.update(OptionChainSnapshot.from_dict(market_data))
+
+    assert strategy.get_max_oi_details() == ("PE", "23450")
+    assert strategy.max_oi_value == 70
@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
-from src.strategies.max_oi import MaxOIStrategy
+from src.strategies.max_oi import MaxOIStrategy, nearest_strike_indices
+from src.pubsub.snapshot import OptionChainSnapshot
 from src.pubsub.publisher import OptionChainData
 
 def test_max_oi_strategy():
@@ -55,3 +57,66 @@ def test_max_oi_strategy():
     assert oi_type == "CE"
     assert oi_strike == "24900"
     assert strategy.max_oi_value == 10000
+
+
+def test_nearest_strike_indices_prefers_lower_strike_on_ties():
+    strikes = np.arange(24300, 25800, 100, dtype=np.float64)
+    nearest = nearest_strike_indices(strikes, 25000, 4)
+    assert strikes[nearest].tolist() == [25000, 24900, 25100, 24800]
+
+    # LTP outside the strike range still yields the closest strikes
+    assert strikes[nearest_strike_indices(strikes, 10, 2)].tolist() == [24300, 24400]
+    assert len(nearest_strike_indices(strikes, 25000, 100)) == len(strikes)
+
+
+def test_max_oi_strategy_configurable_window():
+    market_data = {
+        "underlying_ltp": 25000,
+        "strikes": {
+            str(strike): {"CE": {"open_interest": 10}, "PE": {"open_interest": 10}}
+            for strike in range(24300, 25800, 100)
+        }
+    }
+    market_data["strikes"]["25300"]["CE"]["open_interest"] = 700
+
+    narrow = MaxOIStrategy(window=4)
+    narrow.update(market_data)
+    assert narrow.get_max_oi_details() == ("CE", "25000")
+    assert narrow.max_oi_value == 10
+
+    wide = MaxOIStrategy(window=8)
+    wide.update(market_data)
+    assert wide.get_max_oi_details() == ("CE", "25300")
+
+    with pytest.raises(ValueError):
+        MaxOIStrategy(window=0)
+
+
+def test_max_oi_score_batch_matches_update():
+    rng = np.random.default_rng(7)
+    snapshots = []
+    for tick in range(50):
+        # Mix two strike grids and a few missing OI values
+        step = 50 if tick % 3 else 100
+        strikes = range(24000, 26000, step)
+        data = {
+            "underlying_ltp": float(rng.uniform(23900, 26100)),
+            "strikes": {
+                str(s): {
+                    "CE": {"open_interest": int(rng.integers(0, 20))},
+                    "PE": {"open_interest": int(rng.integers(0, 20))} if rng.random() > 0.1 else {},
+                }
+                for s in strikes
+            }
+        }
+        snapshots.append(OptionChainSnapshot.from_dict(data))
+    snapshots.append(OptionChainSnapshot.from_dict({"underlying_ltp": 0, "strikes": {}}))
+
+    strategy = MaxOIStrategy(window=6)
+    batch = strategy.score_batch(snapshots)
+
+    assert len(batch) == len(snapshots)
+    for snapshot, result in zip(snapshots[:-1], batch):
+        strategy.update(snapshot)
+        assert result == (strategy.max_oi_type, strategy.max_oi_strike, strategy.max_oi_value)
+    assert batch[-1] == (None, None, -1)
@@ -0,0 +1,102 @@
+import itertools
+import numpy as np
+import pytest
+from src.client.fake import FakeClient
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.backtest.sweep import MaxOISweep
+from src.storage.recorder import TickRecorder
+from src.strategies.max_oi import MaxOIStrategy
+
+
+def day(seed, ticks=60, num_strikes=40):
+    client = FakeClient(num_strikes=num_strikes, seed=seed)
+    return [
+        OptionChainSnapshot.from_dict(client.get_option_chain("NSE", "NIFTY", "2026-10-20"), timestamp=1000.0 + t)
+        for t in range(ticks)
+    ]
+
+
+def brute_force(snapshots, window, min_oi, tie_break, horizon):
+    """Loop-per-parameter reference for one combination."""
+    strategy = MaxOIStrategy(window=window)
+    ltps = [s.underlying_ltp for s in snapshots]
+    signals = hits = 0
+    for t in range(len(snapshots) - horizon):
+        snapshot = snapshots[t]
+        strategy.update(snapshot)
+        side, strike, value = strategy.max_oi_type, strategy.max_oi_strike, strategy.max_oi_value
+        if tie_break == "PE" and side == "CE":
+            # The same strike's PE leg wins a tie when preferred
+            pe = snapshot.column("PE", "open_interest")[snapshot.index_of(strike)]
+            if pe == value:
+                side = "PE"
+        if side is None or value < min_oi:
+            continue
+        signals += 1
+        future = ltps[t + 1:t + 1 + horizon]
+        level = float(strike)
+        hits += max(future) <= level if side == "CE" else min(future) >= level
+    return signals, hits
+
+
+def test_matches_per_parameter_loop():
+    snapshots = day(seed=3)
+    # Force CE/PE ties so the tie-break matters
+    for s in snapshots[::3]:
+        s.values[1, 0] = s.values[0, 0]
+    sweep = MaxOISweep(windows=(2, 6, 12), min_oi=(0, 20_000, 40_000), horizon=5, max_workers=0)
+
+    result = sweep.evaluate_day(snapshots)
+
+    for (b, side), (w, window), (k, threshold) in itertools.product(
+        enumerate(sweep.tie_break), enumerate(sweep.windows), enumerate(sweep.min_oi)
+    ):
+        expected = brute_force(snapshots, int(window), threshold, side, 5)
+        assert (result["signals"][b, w, k], result["hits"][b, w, k]) == expected
+    assert (result["ticks"] == len(snapshots) - 5).all()
+
+
+def test_signals_match_score_batch():
+    snapshots = day(seed=1, ticks=20)
+    sweep = MaxOISweep(windows=(12,), tie_break=("CE",))
+    values, sides, cols = sweep.signals(
+        np.array([s.underlying_ltp for s in snapshots]),
+        snapshots[0].strikes,
+        np.stack([s.column("CE", "open_interest") for s in snapshots]),
+        np.stack([s.column("PE", "open_interest") for s in snapshots]),
+    )
+    expected = MaxOIStrategy(window=12).score_batch(snapshots)
+    assert [("CE" if sides[0, t, 0] == 0 else "PE", snapshots[0].strike_keys[cols[0, t, 0]], int(values[0, t, 0]))
+            for t in range(len(snapshots))] == expected
+
+
+def test_run_across_days_in_process_pool(tmp_path):
+    days = {}
+    for seed in range(3):
+        path = tmp_path / f"day{seed}.bin"
+        with TickRecorder(path) as recorder:
+            for snapshot in day(seed, ticks=30):
+                recorder.update(snapshot)
+        days[f"2026-10-{12 + seed}"] = str(path)
+    days["2026-10-15"] = day(9, ticks=30)
+
+    sweep = MaxOISweep(windows=(4, 12), min_oi=(0, 30_000), horizon=5, max_workers=2)
+    results = sweep.run(days)
+
+    assert len(results) == 4 * 2 * 2 * 2
+    assert list(results.columns) == ["day", "window", "min_oi", "tie_break", "ticks", "signals", "hits"]
+    inline = MaxOISweep(windows=(4, 12), min_oi=(0, 30_000), horizon=5, max_workers=0).run(days)
+    assert results.equals(inline)
+
+    summary = MaxOISweep.summarize(results)
+    assert len(summary) == 8
+    assert summary["hit_rate"].is_monotonic_decreasing
+    assert (summary["ticks"] == 4 * 25).all()
+
+
+def test_validates_grid():
+    with pytest.raises(ValueError):
+        MaxOISweep(windows=(0, 4))
+    with pytest.raises(ValueError):
+        MaxOISweep(tie_break=("FUT",))
+    assert MaxOISweep(horizon=10).evaluate_day(day(0, ticks=5))["signals"].sum() == 0
@@ -0,0 +1,110 @@
+import threading
+import time
+import pytest
+from src.client.factory import ClientFactory
+from src.client.fake import FakeClient
+from src.client.interfaces import TradingClient
+from src.client.throttled import ThrottledClient, TokenBucket
+from tests.helpers import FakeClock
+
+
+class CountingClient(TradingClient):
+    def __init__(self, release: threading.Event = None):
+        self.calls = 0
+        self.release = release
+
+    def get_option_chain(self, exchange: str, underlying: str, expiry_date: str):
+        self.calls += 1
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        return {"underlying_ltp": 25000.0 + self.calls, "strikes": {}}
+
+
+def test_token_bucket_limits_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    # Burst used up: the next callers wait 0.5s per token
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquire() == pytest.approx(0.5)
+    clock.now += 10
+    assert bucket.acquire() == 0
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_cache_serves_within_ttl():
+    clock = FakeClock()
+    inner = CountingClient()
+    client = ThrottledClient(inner, cache_ttl=5, clock=clock, sleep=clock.sleep)
+
+    first = client.get_option_chain("NSE", "NIFTY", "2026-10-20")
+    assert client.get_option_chain("nse", "nifty", "2026-10-20") is first
+    clock.now += 6
+    assert client.get_option_chain("NSE", "NIFTY", "2026-10-20") is not first
+
+    assert inner.calls == 2
+    assert client.stats()["hits"] == 1
+    assert client.stats()["misses"] == 2
+
+
+def test_concurrent_identical_requests_are_coalesced():
+    release = threading.Event()
+    inner = CountingClient(release)
+    client = ThrottledClient(inner)
+    results = []
+
+    def fetch():
+        results.append(client.get_option_chain("NSE", "NIFTY", "2026-10-20"))
+
+    threads = [threading.Thread(target=fetch) for _ in range(8)]
+    for t in threads:
+        t.start()
+    while client.stats()["misses"] + client.stats()["coalesced"] < 8:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert inner.calls == 1
+    assert len(results) == 8
+    assert all(r is results[0] for r in results)
+    assert client.stats()["coalesced"] == 7
+
+
+def test_errors_propagate_to_coalesced_callers_and_are_not_cached():
+    class FailingClient(TradingClient):
+        def get_option_chain(self, exchange, underlying, expiry_date):
+            raise ConnectionError("throttled by broker")
+
+    client = ThrottledClient(FailingClient(), cache_ttl=60)
+    with pytest.raises(ConnectionError):
+        client.get_option_chain("NSE", "NIFTY", "2026-10-20")
+    with pytest.raises(ConnectionError):
+        client.get_option_chain("NSE", "NIFTY", "2026-10-20")
+    assert client.stats()["misses"] == 2
+
+
+def test_rate_limit_counts_throttled_requests():
+    clock = FakeClock()
+    client = ThrottledClient(
+        FakeClient(num_strikes=5),
+        rate_limits={"option_chain": (1.0, 1.0)},
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    for expiry in ("2026-10-20", "2026-10-27", "2026-11-03"):
+        client.get_option_chain("NSE", "NIFTY", expiry)
+
+    assert client.stats()["throttled"] == 2
+    assert clock.sleeps == [pytest.approx(1.0), pytest.approx(1.0)]
+
+
+def test_factory_composes_throttled_client():
+    client = ClientFactory.get_throttled_client("fake", cache_ttl=1, num_strikes=5)
+    assert isinstance(client, ThrottledClient)
+    assert isinstance(client.client, FakeClient)
+    assert client.cache_ttl == 1
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
+from src.client.fake import FakeClient
+from src.pubsub.publisher import OptionChainData
+from src.pubsub.snapshot import OptionChainSnapshot
+from src.storage.tick_store import TickStore
+
+IST = ZoneInfo("Asia/Kolkata")
+EXPIRIES = ["2026-10-06", "2026-10-13", "2026-10-20"]
+
+
+def minute_ticks(expiry_date, minutes=120, num_strikes=10, seed=0):
+    """One tick a minute from 09:30 IST on the day before expiry."""
+    client = FakeClient(num_strikes=num_strikes, seed=seed)
+    day = datetime.fromisoformat(expiry_date).replace(hour=9, minute=30, tzinfo=IST).timestamp() - 86400
+    return [
+        OptionChainSnapshot.from_dict(
+            client.get_option_chain("NSE", "NIFTY", expiry_date),
+            timestamp=day + 60 * minute, underlying="NIFTY", expiry_date=expiry_date
+        )
+        for minute in range(minutes)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with TickStore(tmp_path / "ticks", block_rows=50) as store:
+        publisher = OptionChainData()
+        publisher.add_subscriber(store)
+        for i, expiry_date in enumerate(EXPIRIES):
+            for snapshot in minute_ticks(expiry_date, seed=i):
+                publisher.notify(snapshot)
+    return store
+
+
+def test_partitions_into_blocks(store):
+    assert store.underlyings() == ["NIFTY"]
+    assert store.expiries("nifty") == EXPIRIES
+    assert store.written == 3 * 120
+    assert len(store._manifest(store._partition("NIFTY", EXPIRIES[0]))["blocks"]) == 3
+
+
+def test_query_matches_recorded_ticks(store):
+    ticks = minute_ticks(EXPIRIES[1], seed=1)
+    strike = ticks[0].strike_keys[4]
+
+    frame = store.query(
+        "NIFTY", strikes=[strike], sides=["CE"], fields=["open_interest", "ltp"],
+        expiries=2, between=(time(10, 0), time(11, 0))
+    )
+
+    assert list(frame.columns) == ["expiry_date", "timestamp", "strike", "underlying_ltp", "CE_open_interest", "CE_ltp"]
+    assert frame["expiry_date"].unique().tolist() == EXPIRIES[1:]
+    assert len(frame) == 2 * 61
+    assert frame["timestamp"].dt.strftime("%H:%M").iloc[[0, 60]].tolist() == ["10:00", "11:00"]
+    expected = [t.column("CE", "open_interest")[4] for t in ticks[30:91]]
+    np.testing.assert_array_equal(frame["CE_open_interest"].to_numpy()[:61], expected)
+    assert (frame["strike"] == float(strike)).all()
+
+
+def test_time_range_reads_only_overlapping_blocks(store, monkeypatch):
+    ticks = minute_ticks(EXPIRIES[0], seed=0)
+    loaded = []
+    original = np.load
+    monkeypatch.setattr(np, "load", lambda path, *a, **k: loaded.append(path) or original(path, *a, **k))
+
+    columns = store.arrays("NIFTY", start=ticks[10].timestamp, end=ticks[20].timestamp, expiries=[EXPIRIES[0]])
+
+    assert len(columns["timestamp"]) == 11 * 10
+    assert {str(path).split("/")[-2] for path in loaded} == {"000000"}
+    np.testing.assert_array_equal(columns["PE_open_interest"][:10], ticks[10].column("PE", "open_interest"))
+
+
+def test_strike_grid_change_starts_new_block(tmp_path):
+    ticks = minute_ticks("2026-10-20", minutes=4)
+    narrower = ticks[2].select(ticks[2].strike_keys[2:])
+    narrower.underlying, narrower.expiry_date = "NIFTY", "2026-10-20"
+    with TickStore(tmp_path) as store:
+        for snapshot in [ticks[0], ticks[1], narrower, ticks[3]]:
+            store.append(snapshot)
+
+    assert len(store._manifest(store._partition("NIFTY", "2026-10-20"))["blocks"]) == 3
+    lowest = store.arrays("NIFTY", strikes=[ticks[0].strikes[0]])
+    assert len(lowest["timestamp"]) == 3
+    replayed = list(store.snapshots("NIFTY", "2026-10-20"))
+    assert [len(s) for s in replayed] == [10, 10, 8, 10]
+    np.testing.assert_array_equal(replayed[3].values, ticks[3].values)
+
+
+def test_orphan_block_from_a_crashed_write_is_replaced(tmp_path):
+    ticks = minute_ticks("2026-10-20", minutes=4)
+    with TickStore(tmp_path, block_rows=2) as store:
+        for snapshot in ticks[:2]:
+            store.append(snapshot)
+    # A crash between renaming the block into place and writing the manifest
+    orphan = tmp_path / "NIFTY" / "2026-10-20" / "000001"
+    orphan.mkdir()
+    (orphan / "timestamps.npy").write_bytes(b"partial")
+
+    with TickStore(tmp_path, block_rows=2) as store:
+        for snapshot in ticks[2:]:
+            store.append(snapshot)
+
+    replayed = list(store.snapshots("NIFTY", "2026-10-20"))
+    assert [s.timestamp for s in replayed] == [t.timestamp for t in ticks]
+
+
+def test_rejects_unnamed_snapshots_and_unknown_fields(tmp_path):
+    store = TickStore(tmp_path)
+    with pytest.raises(ValueError):
+        store.append(OptionChainSnapshot.from_dict(FakeClient(num_strikes=2).get_option_chain("NSE", "NIFTY", "2026-10-20")))
+    with pytest.raises(ValueError):
+        store.arrays("NIFTY", fields=["gross"])
+    assert len(store.arrays("BANKNIFTY")["timestamp"]) == 0
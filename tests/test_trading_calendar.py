@@ -0,0 +1,66 @@
+import pytest
+from datetime import date, datetime
+from src.market.expiry import next_weekly_expiry
+from src.market.trading_calendar import (
+    BSE, CLOSED, IST, NSE, OPEN, PRE_OPEN_PHASE, TradingCalendar, calendar_for, load_holidays
+)
+
+
+def at(day, hour, minute=0):
+    return datetime(2026, 10, day, hour, minute, tzinfo=IST)
+
+
+def test_session_phases():
+    # Friday 2026-10-16
+    assert NSE.phase(at(16, 8, 59)) == CLOSED
+    assert NSE.phase(at(16, 9, 5)) == PRE_OPEN_PHASE
+    assert NSE.phase(at(16, 9, 15)) == OPEN
+    assert NSE.phase(at(16, 15, 30)) == CLOSED
+    # Weekend and Dussehra holiday
+    assert NSE.phase(at(17, 11)) == CLOSED
+    assert NSE.phase(at(20, 11)) == CLOSED
+    # Epoch seconds and naive (IST) datetimes are accepted too
+    assert NSE.is_open(at(16, 12).timestamp())
+    assert NSE.is_open(datetime(2026, 10, 16, 12))
+
+
+def test_next_open_skips_weekends_and_holidays():
+    assert NSE.seconds_until_open(at(16, 12)) == 0
+    assert NSE.next_open(at(16, 8)) == at(16, 9, 15)
+    # Friday after the close -> Monday
+    assert NSE.next_open(at(16, 16)) == at(19, 9, 15)
+    # Monday after the close -> Wednesday, Tuesday is Dussehra
+    assert NSE.next_open(at(19, 15, 45)) == at(21, 9, 15)
+    assert NSE.seconds_until_open(at(19, 15, 45)) == 41.5 * 3600
+    assert NSE.seconds_until_close(at(16, 15)) == 30 * 60
+
+
+def test_expiries_shift_before_holidays():
+    # The 2026-10-20 Tuesday expiry moves to Monday
+    assert NSE.expiries("NIFTY", date(2026, 10, 18)) == ["2026-10-19", "2026-10-27"]
+    assert next_weekly_expiry("NIFTY", date(2026, 10, 18)) == date(2026, 10, 20)
+    # Once the shifted expiry has passed, the next week's contract is current
+    assert NSE.expiries("NIFTY", date(2026, 10, 20), ["weekly"]) == ["2026-10-27"]
+    # Monthly expiry on a holiday: last Tuesday of November 2026 is Guru Nanak Jayanti
+    assert NSE.expiries("BANKNIFTY", date(2026, 11, 1)) == ["2026-11-23"]
+    assert NSE.expiries("BANKNIFTY", date(2026, 11, 24)) == ["2026-12-29"]
+    assert BSE.expiries("SENSEX", date(2026, 10, 18), ["weekly"]) == ["2026-10-22"]
+    assert NSE.expiry_close("2026-10-19") == at(19, 15, 30)
+
+
+def test_extra_holidays(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text("# special closure\n2026-10-22\n\n2026-10-29  # another\n")
+    holidays = load_holidays(path)
+    assert holidays == [date(2026, 10, 22), date(2026, 10, 29)]
+
+    calendar = calendar_for("bse", holidays)
+    assert calendar.expiries("SENSEX", date(2026, 10, 18), ["weekly"]) == ["2026-10-21"]
+    assert not calendar.is_trading_day(date(2026, 10, 20))
+    # The shared exchange calendar is untouched
+    assert BSE.is_trading_day(date(2026, 10, 22))
+
+    with pytest.raises(ValueError):
+        calendar_for("MCX")
+    with pytest.raises(ValueError):
+        TradingCalendar(open_time=at(16, 16).time())
@@ -0,0 +1,104 @@
+import gc
+import weakref
+from src.client.fake import FakeClient
+from src.pubsub.publisher import DELTA, FULL, OptionChainData
+from tests.helpers import MockSubscriber
+
+
+def chain():
+    return FakeClient(num_strikes=10).get_option_chain("NSE", "NIFTY", "2026-10-20")
+
+
+def test_collected_subscriber_and_empty_buckets_are_dropped():
+    publisher = OptionChainData(weak=True)
+    keeper = MockSubscriber()
+    publisher.add_subscriber(keeper, "23400")
+    watcher = MockSubscriber()
+    publisher.add_subscriber(watcher, ["23400", "23450"])
+    publisher.notify(chain())
+    watcher_ref = weakref.ref(watcher)
+
+    # Neither the registry nor the routing plan keeps the watcher alive
+    del watcher
+    gc.collect()
+    assert watcher_ref() is None
+
+    usage = publisher.memory_usage()
+    assert usage["subscribers"] == 1
+    assert usage["buckets"] == 1
+    assert usage["bucket_entries"] == 1
+    assert list(publisher.subscriptions()) == [keeper]
+
+
+def test_notify_skips_collected_subscribers():
+    publisher = OptionChainData(weak=True)
+    keeper = MockSubscriber()
+    publisher.add_subscriber(keeper)
+    for strike in ["23400", "23450", "23500"]:
+        publisher.add_subscriber(MockSubscriber(), strike)
+    publisher.notify(chain())
+
+    gc.collect()
+    publisher.notify(chain())
+    assert len(keeper.received_data) == 2
+    assert publisher.memory_usage()["buckets"] == 1
+
+
+def test_weak_mode_matches_strong_routing():
+    data = chain()
+    received = []
+    for weak in (False, True):
+        publisher = OptionChainData(diff=True, weak=weak)
+        everything, strike, delta = MockSubscriber(), MockSubscriber(), MockSubscriber()
+        publisher.add_subscriber(everything)
+        publisher.add_subscriber(strike, "23400")
+        publisher.add_subscriber(delta, mode=DELTA)
+        publisher.notify(data)
+        assert publisher.subscriptions()[strike] == (["23400"], FULL)
+        received.append([len(s.received_data) for s in (everything, strike, delta)])
+
+        publisher.remove_subscriber(strike)
+        assert publisher.memory_usage()["buckets"] == 1
+    assert received[0] == received[1]
+
+
+def test_memory_usage_shrinks_as_watchers_leave():
+    publisher = OptionChainData(weak=True)
+    watchers = [MockSubscriber() for _ in range(200)]
+    for i in range(len(watchers)):
+        publisher.add_subscriber(watchers[i], str(23000 + 50 * (i % 40)))
+    publisher.notify(chain())
+    before = publisher.memory_usage()
+
+    del watchers[100:]
+    gc.collect()
+    after = publisher.memory_usage()
+    assert after["subscribers"] == 100
+    assert after["bytes"] < before["bytes"]
+
+    watchers.clear()
+    gc.collect()
+    assert publisher.memory_usage()["buckets"] == 0
+
+
+def test_handles_queued_during_a_purge_are_purged():
+    publisher = OptionChainData(weak=True)
+    watchers = [MockSubscriber() for _ in range(3)]
+    for i, watcher in enumerate(watchers):
+        publisher.add_subscriber(watcher, str(23000 + 50 * i))
+    del watcher
+    handles = [publisher._handle(watcher) for watcher in watchers]
+    drop = publisher._drop
+
+    def drop_while_collecting(handle):
+        # Another thread's collection queues the next handle mid-purge
+        if handles:
+            publisher._dead.append(handles.pop())
+        drop(handle)
+
+    publisher._drop = drop_while_collecting
+    publisher._dead.append(handles.pop())
+    publisher._purge()
+
+    usage = publisher.memory_usage()
+    assert usage["subscribers"] == 0 and usage["buckets"] == 0